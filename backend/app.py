@@ -1,8 +1,15 @@
 import os
 import urllib.parse
-import requests
 
-from flask import redirect, url_for, request, session, jsonify
+from flask import (
+    Response,
+    redirect,
+    url_for,
+    request,
+    session,
+    jsonify,
+    stream_with_context,
+)
 from flask_cors import CORS
 from datetime import datetime
 from dotenv import load_dotenv
@@ -11,14 +18,21 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 from config.config import app
 from config.celery_config import celery
 from tasks import transfer_playlist_task, transfer_spotify_to_youtube_task
+from task_events import stream_task_events
+from transfer_results import STATUSES, result_tracks, summarize_result
 from clients.youtube_client import YouTubeClient
-from clients.spotify_client import SpotifyClient
+from clients.youtube_auth import (
+    save_youtube_credentials,
+    youtube_credentials,
+    youtube_token_data,
+)
+from clients.spotify_client import SpotifyClient, save_user_tokens
+from clients.playlist_cache import SpotifyPlaylistCache, YouTubePlaylistCache
+from clients.http_session import get_session, DEFAULT_TIMEOUT
 
 from google_auth_oauthlib.flow import Flow
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request as GoogleRequest
 from urllib.parse import urlparse, parse_qs
-from typing import Optional
+from typing import Dict, List, Optional
 
 load_dotenv(override=True)
 
@@ -39,6 +53,8 @@ app.config.update(
 
 SPOTIFY_REDIRECT_URI = os.getenv("SPOTIFY_REDIRECT_URI")
 FRONTEND_URL = "https://playlifts.com"
+TASK_STATUS_BATCH_LIMIT = int(os.getenv("TASK_STATUS_BATCH_LIMIT", "100"))
+TASK_RESULTS_PAGE_LIMIT = int(os.getenv("TASK_RESULTS_PAGE_LIMIT", "500"))
 
 app.secret_key = os.getenv("SECRET_KEY")
 
@@ -60,34 +76,11 @@ def get_youtube_credentials():
     if "youtube_token" not in session:
         return None
 
-    creds_data = session["youtube_token"]
-    credentials = Credentials(
-        token=creds_data["token"],
-        refresh_token=creds_data.get("refresh_token"),
-        token_uri=creds_data["token_uri"],
-        client_id=creds_data["client_id"],
-        client_secret=creds_data["client_secret"],
-        scopes=creds_data["scopes"],
-    )
-
-    if not credentials.valid:
-        if credentials.expired and credentials.refresh_token:
-            try:
-                credentials.refresh(GoogleRequest())
-                session["youtube_token"] = {
-                    "token": credentials.token,
-                    "refresh_token": credentials.refresh_token,
-                    "token_uri": credentials.token_uri,
-                    "client_id": credentials.client_id,
-                    "client_secret": credentials.client_secret,
-                    "scopes": credentials.scopes,
-                }
-            except Exception as e:
-                app.logger.error(f"Failed to refresh YouTube token: {e}")
-                return None
-        else:
-            return None
-    return credentials
+    try:
+        return youtube_credentials(session["youtube_token"])
+    except Exception as e:
+        app.logger.error(f"Failed to refresh YouTube token: {e}")
+        return None
 
 
 def _extract_spotify_playlist_id(value: str) -> Optional[str]:
@@ -155,7 +148,9 @@ def spotify_callback():
             "client_id": SPOTIFY_CLIENT_ID,
             "client_secret": SPOTIFY_CLIENT_SECRET,
         }
-        response = requests.post(SPOTIFY_TOKEN_URL, data=req_body)
+        response = get_session().post(
+            SPOTIFY_TOKEN_URL, data=req_body, timeout=DEFAULT_TIMEOUT
+        )
         if response.status_code != 200:
             return (
                 jsonify(
@@ -180,7 +175,11 @@ def spotify_callback():
             )
 
         session["access_token"] = token_info["access_token"]
-        session["refresh_token"] = token_info["refresh_token"]
+        session["spotify_token_key"] = save_user_tokens(
+            token_info["access_token"],
+            token_info["refresh_token"],
+            token_info["expires_in"],
+        )
         session["expires_at"] = datetime.now().timestamp() + token_info["expires_in"]
         session["is_logged_in"] = True
 
@@ -200,51 +199,30 @@ def spotify_playlists():
         return jsonify({"error": "Not authenticated"}), 401
 
     try:
-        headers = {"Authorization": f"Bearer {session['access_token']}"}
-        user_response = requests.get("https://api.spotify.com/v1/me", headers=headers)
-        if user_response.status_code != 200:
-            return jsonify({"error": "Failed to fetch user profile"}), 400
-        user_data = user_response.json()
-        current_user_id = user_data["id"]
-
-        all_playlists = []
-        offset = 0
-        limit = 50
-        while True:
-            response = requests.get(
-                f"https://api.spotify.com/v1/me/playlists?limit={limit}&offset={offset}",
-                headers=headers,
-            )
-            if response.status_code != 200:
-                return (
-                    jsonify(
-                        {"error": f"Failed to fetch playlists: {response.status_code}"}
-                    ),
-                    400,
-                )
-            playlists_data = response.json()
-            items = playlists_data.get("items", [])
-            if not items:
-                break
-            for playlist in items:
-                if playlist["owner"]["id"] == current_user_id:
-                    cover_image = None
-                    if playlist.get("images"):
-                        cover_image = playlist["images"][0]["url"]
-                    all_playlists.append(
-                        {
-                            "id": playlist["id"],
-                            "name": playlist["name"],
-                            "tracks_count": playlist["tracks"]["total"],
-                            "owner": playlist["owner"]["display_name"],
-                            "public": playlist.get("public", False),
-                            "cover_image": cover_image,
-                        }
-                    )
-            offset += limit
-            if len(items) < limit:
-                break
-        return jsonify({"playlists": all_playlists})
+        access_token = session["access_token"]
+        cache = SpotifyPlaylistCache()
+        spotify_client = SpotifyClient(
+            api_token=access_token, user_token_key=session.get("spotify_token_key")
+        )
+
+        profile = cache.get_profile(access_token)
+        if profile is None:
+            try:
+                profile = {"id": spotify_client.get_current_user()["id"]}
+            except Exception as e:
+                app.logger.error(str(e))
+                return jsonify({"error": "Failed to fetch user profile"}), 400
+            cache.set_profile(access_token, profile)
+
+        playlists = cache.get_playlists(profile["id"])
+        if playlists is None:
+            try:
+                playlists = spotify_client.get_user_playlists(profile["id"])
+            except Exception as e:
+                return jsonify({"error": str(e)}), 400
+            cache.set_playlists(profile["id"], playlists)
+
+        return jsonify({"playlists": playlists})
     except Exception:
         app.logger.exception("Error in spotify_playlists")
         raise
@@ -274,17 +252,8 @@ def spotify_transfer():
     if not spotify_playlist_id:
         return jsonify({"error": "Invalid Spotify playlist identifier"}), 400
 
-    youtube_token_data = {
-        "token": credentials.token,
-        "refresh_token": credentials.refresh_token,
-        "token_uri": credentials.token_uri,
-        "client_id": credentials.client_id,
-        "client_secret": credentials.client_secret,
-        "scopes": credentials.scopes,
-    }
-
     task = transfer_spotify_to_youtube_task.delay(
-        None, spotify_playlist_id, youtube_playlist_id, youtube_token_data
+        None, spotify_playlist_id, youtube_playlist_id, youtube_token_data(credentials)
     )
     return jsonify({"task_id": task.id}), 202
 
@@ -337,15 +306,7 @@ def youtube_callback():
     authorization_response = request.url
     flow.fetch_token(authorization_response=authorization_response)
 
-    credentials = flow.credentials
-    session["youtube_token"] = {
-        "token": credentials.token,
-        "refresh_token": credentials.refresh_token,
-        "token_uri": credentials.token_uri,
-        "client_id": credentials.client_id,
-        "client_secret": credentials.client_secret,
-        "scopes": credentials.scopes,
-    }
+    session["youtube_token"] = save_youtube_credentials(flow.credentials)
     session["is_youtube_logged_in"] = True
 
     resp = redirect(FRONTEND_URL)
@@ -365,8 +326,29 @@ def youtube_playlists():
             ),
             401,
         )
-    yt_client = YouTubeClient(credentials=credentials)
-    playlists = yt_client.get_playlists()
+
+    # ?refresh=true reloads the listing after changes made outside Playlifts.
+    refresh = request.args.get("refresh", "").lower() in ("1", "true")
+    cache = YouTubePlaylistCache()
+    grant = credentials.refresh_token or credentials.token
+    yt_client = None
+
+    channel_id = cache.get_channel(grant)
+    if channel_id is None:
+        yt_client = YouTubeClient(credentials=credentials)
+        channel_id = yt_client.get_channel_id()
+        if channel_id:
+            cache.set_channel(grant, channel_id)
+
+    if channel_id and refresh:
+        cache.invalidate(channel_id)
+
+    playlists = cache.get_playlists(channel_id) if channel_id else None
+    if playlists is None:
+        yt_client = yt_client or YouTubeClient(credentials=credentials)
+        playlists = yt_client.get_playlists()
+        if channel_id:
+            cache.set_playlists(channel_id, playlists)
     return jsonify({"playlists": playlists})
 
 
@@ -389,7 +371,10 @@ def youtube_transfer():
             return jsonify({"error": "No playlist ID found"}), 400
 
         task = transfer_playlist_task.delay(
-            session["access_token"], playlist_id, target_playlist_id
+            session["access_token"],
+            playlist_id,
+            target_playlist_id,
+            spotify_token_key=session.get("spotify_token_key"),
         )
 
         return jsonify({"task_id": task.id}), 202
@@ -423,99 +408,166 @@ def logout():
     return resp
 
 
-@app.route("/tasks/status/<task_id>")
-def task_status(task_id):
-    try:
-        task = celery.AsyncResult(task_id)
+def _task_status_from_meta(task_id: str, state: str, info) -> dict:
+    """Build the /tasks/status payload for one task from its state and info."""
+    if state == "PENDING":
+        response = {
+            "state": state,
+            "status": "Waiting to start",
+            "progress": 0,
+        }
+    elif state == "PROGRESS":
+        try:
+            progress_info = info or {}
+            response = {
+                "state": state,
+                "progress": progress_info.get("progress", 0),
+                "current": progress_info.get("current", 0),
+                "total": progress_info.get("total", 0),
+                "status": progress_info.get("status", "In progress..."),
+            }
+        except Exception as e:
+            app.logger.error(f"Error getting progress info: {e}")
+            response = {
+                "state": state,
+                "progress": 0,
+                "current": 0,
+                "total": 0,
+                "status": "In progress...",
+            }
+    elif state == "SUCCESS":
+        try:
+            response = {
+                "state": state,
+                "result": summarize_result(info),
+                "progress": 100,
+            }
+        except Exception as e:
+            app.logger.error(f"Error getting task result: {e}")
+            response = {
+                "state": state,
+                "result": {
+                    "success": {"count": 0},
+                    "failed": {"count": 0},
+                },
+                "progress": 100,
+            }
+    elif state == "FAILURE":
+        try:
+            error_info = info or {}
+
+            if isinstance(error_info, dict):
+                error_msg = error_info.get("error", "Unknown error occurred")
+                error_type = error_info.get("error_type", "Exception")
+            elif isinstance(error_info, Exception):
+                error_msg = str(error_info)
+                error_type = type(error_info).__name__
+            else:
+                error_msg = str(error_info) if error_info else "Unknown error occurred"
+                error_type = "Exception"
 
-        if task.state == "PENDING":
             response = {
-                "state": task.state,
-                "status": "Waiting to start",
+                "state": state,
+                "error": error_msg,
+                "error_type": error_type,
                 "progress": 0,
             }
-        elif task.state == "PROGRESS":
-            try:
-                progress_info = task.info or {}
-                response = {
-                    "state": task.state,
-                    "progress": progress_info.get("progress", 0),
-                    "current": progress_info.get("current", 0),
-                    "total": progress_info.get("total", 0),
-                    "status": progress_info.get("status", "In progress..."),
-                }
-            except Exception as e:
-                app.logger.error(f"Error getting progress info: {e}")
-                response = {
-                    "state": task.state,
-                    "progress": 0,
-                    "current": 0,
-                    "total": 0,
-                    "status": "In progress...",
-                }
-        elif task.state == "SUCCESS":
-            try:
-                response = {"state": task.state, "result": task.result, "progress": 100}
-            except Exception as e:
-                app.logger.error(f"Error getting task result: {e}")
-                response = {
-                    "state": task.state,
-                    "result": {
-                        "success": {"count": 0, "tracks": []},
-                        "failed": {"count": 0, "tracks": []},
-                    },
-                    "progress": 100,
-                }
-        elif task.state == "FAILURE":
-            try:
-                error_info = task.info if hasattr(task, "info") and task.info else {}
-
-                if isinstance(error_info, dict):
-                    error_msg = error_info.get("error", "Unknown error occurred")
-                    error_type = error_info.get("error_type", "Exception")
-                elif isinstance(error_info, Exception):
-                    error_msg = str(error_info)
-                    error_type = type(error_info).__name__
-                else:
-                    error_msg = (
-                        str(error_info) if error_info else "Unknown error occurred"
-                    )
-                    error_type = "Exception"
-
-                response = {
-                    "state": task.state,
-                    "error": error_msg,
-                    "error_type": error_type,
-                    "progress": 0,
-                }
-            except Exception as e:
-                app.logger.error(f"Error getting failure info for task {task_id}: {e}")
-                response = {
-                    "state": task.state,
-                    "error": "Task failed - unable to retrieve error details",
-                    "error_type": "Exception",
-                    "progress": 0,
-                }
-        else:
-            try:
-                status_info = (
-                    str(task.info)
-                    if hasattr(task, "info") and task.info
-                    else "Unknown state"
-                )
-                response = {"state": task.state, "status": status_info, "progress": 0}
-            except Exception as e:
-                app.logger.error(f"Error getting task info for state {task.state}: {e}")
-                response = {
-                    "state": task.state,
-                    "status": f"Task in {task.state} state",
+        except Exception as e:
+            app.logger.error(f"Error getting failure info for task {task_id}: {e}")
+            response = {
+                "state": state,
+                "error": "Task failed - unable to retrieve error details",
+                "error_type": "Exception",
+                "progress": 0,
+            }
+    else:
+        try:
+            status_info = str(info) if info else "Unknown state"
+            response = {"state": state, "status": status_info, "progress": 0}
+        except Exception as e:
+            app.logger.error(f"Error getting task info for state {state}: {e}")
+            response = {
+                "state": state,
+                "status": f"Task in {state} state",
+                "progress": 0,
+            }
+
+    return response
+
+
+def _task_status_response(task_id: str) -> dict:
+    """Build the /tasks/status payload for one task from its Celery state."""
+    task = celery.AsyncResult(task_id)
+    return _task_status_from_meta(task_id, task.state, task.info)
+
+
+def _task_status_responses(task_ids: List[str]) -> Dict[str, dict]:
+    """
+    Build /tasks/status payloads for many tasks with a single MGET of their
+    celery-task-meta-* keys instead of one backend read per AsyncResult.
+    Tasks without a stored result are PENDING, as with AsyncResult.
+    """
+    backend = celery.backend
+    values = backend.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+
+    responses = {}
+    for task_id, value in zip(task_ids, values):
+        state, info = "PENDING", None
+        if value is not None:
+            meta = backend.decode_result(value)
+            state, info = meta["status"], meta["result"]
+        responses[task_id] = _task_status_from_meta(task_id, state, info)
+    return responses
+
+
+@app.route("/tasks/status/<task_id>")
+def task_status(task_id):
+    try:
+        return jsonify(_task_status_response(task_id))
+
+    except Exception as e:
+        app.logger.error(f"Error getting task status for {task_id}: {str(e)}")
+        return (
+            jsonify(
+                {
+                    "state": "ERROR",
+                    "error": f"Failed to get task status: {str(e)}",
                     "progress": 0,
                 }
+            ),
+            500,
+        )
+
+
+@app.route("/tasks/status", methods=["POST"])
+def task_statuses():
+    """Status of several tasks at once: {"task_ids": [...]} -> {"tasks": {id: status}}."""
+    body = request.get_json(silent=True)
+    task_ids = body.get("task_ids") if isinstance(body, dict) else None
+    if (
+        not isinstance(task_ids, list)
+        or not task_ids
+        or not all(isinstance(task_id, str) and task_id for task_id in task_ids)
+    ):
+        return (
+            jsonify({"error": "'task_ids' must be a non-empty list of task IDs"}),
+            400,
+        )
+
+    task_ids = list(dict.fromkeys(task_ids))
+    if len(task_ids) > TASK_STATUS_BATCH_LIMIT:
+        return (
+            jsonify(
+                {"error": f"At most {TASK_STATUS_BATCH_LIMIT} task IDs per request"}
+            ),
+            400,
+        )
 
-        return jsonify(response)
+    try:
+        return jsonify({"tasks": _task_status_responses(task_ids)})
 
     except Exception as e:
-        app.logger.error(f"Error getting task status for {task_id}: {str(e)}")
+        app.logger.error(f"Error getting task statuses: {str(e)}")
         return (
             jsonify(
                 {
@@ -528,5 +580,73 @@ def task_status(task_id):
         )
 
 
+@app.route("/tasks/<task_id>/results")
+def task_results(task_id):
+    """
+    One page of a finished transfer's per-track outcomes:
+    ?offset=&limit= and optionally ?status=success,failed.
+    """
+    try:
+        offset = int(request.args.get("offset", 0))
+        limit = int(request.args.get("limit", 100))
+    except ValueError:
+        return jsonify({"error": "'offset' and 'limit' must be integers"}), 400
+    if offset < 0 or not 0 < limit <= TASK_RESULTS_PAGE_LIMIT:
+        return (
+            jsonify(
+                {
+                    "error": f"'offset' must be >= 0 and 'limit' between 1 and {TASK_RESULTS_PAGE_LIMIT}"
+                }
+            ),
+            400,
+        )
+
+    statuses = [s for s in request.args.get("status", "").split(",") if s]
+    if any(status not in STATUSES for status in statuses):
+        return (
+            jsonify({"error": f"'status' must be one of {', '.join(STATUSES)}"}),
+            400,
+        )
+
+    try:
+        task = celery.AsyncResult(task_id)
+        if task.state != "SUCCESS":
+            return (
+                jsonify({"state": task.state, "error": "Task has not finished"}),
+                409,
+            )
+
+        total, tracks = result_tracks(task.result, offset, limit, statuses)
+        return jsonify(
+            {"offset": offset, "limit": limit, "total": total, "tracks": tracks}
+        )
+
+    except Exception as e:
+        app.logger.error(f"Error getting task results for {task_id}: {str(e)}")
+        return jsonify({"error": f"Failed to get task results: {str(e)}"}), 500
+
+
+@app.route("/tasks/stream/<task_id>")
+def task_stream(task_id):
+    """
+    Server-Sent Events for one task: a "status" snapshot shaped like
+    /tasks/status, then "progress", "tracks", "done" and "failed" events
+    published by the worker as they happen.
+    """
+
+    def snapshot():
+        try:
+            return _task_status_response(task_id)
+        except Exception as e:
+            app.logger.error(f"Error getting task status for {task_id}: {str(e)}")
+            return {"state": "PENDING", "status": "Waiting to start", "progress": 0}
+
+    return Response(
+        stream_with_context(stream_task_events(task_id, snapshot)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 if __name__ == "__main__":
     app.run(port=8889, debug=False)
@@ -0,0 +1,95 @@
+"""
+Microbenchmark and accuracy report for clients/title_parser.py.
+
+Run from backend/:
+    python -m benchmarks.bench_title_parser [--pages 2000]
+
+Parses the labelled corpus in tests/data/title_corpus.jsonl a page (50
+titles) at a time and compares speed and accuracy with the previous
+" - " split parser.
+"""
+
+import os
+import json
+import time
+import argparse
+from typing import Callable, List, Optional, Tuple
+
+from clients.title_parser import parse_titles
+
+CORPUS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "data", "title_corpus.jsonl"
+)
+PAGE_SIZE = 50
+
+Parsed = Optional[Tuple[str, str]]
+
+
+def legacy_parse(title: str, channel: Optional[str] = None) -> Parsed:
+    """The parser YouTubeClient used before title_parser."""
+    if " - " in title:
+        artist, track = title.split(" - ", 1)
+        track = track.split("(")[0].split("[")[0].strip()
+        artist = artist.strip()
+        if artist and track:
+            return artist, track
+    return None
+
+
+def legacy_page(titles: List[str], channels: List[Optional[str]]) -> List[Parsed]:
+    return [legacy_parse(title, channel) for title, channel in zip(titles, channels)]
+
+
+def current_page(titles: List[str], channels: List[Optional[str]]) -> List[Parsed]:
+    return [(p.artist, p.track) if p else None for p in parse_titles(titles, channels)]
+
+
+def load_corpus():
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def accuracy(parse: Callable, corpus) -> Tuple[int, int]:
+    """(correct, wasted): wasted counts parses that send a wrong search."""
+    parsed = parse([e["title"] for e in corpus], [e["channel"] for e in corpus])
+    correct = wasted = 0
+    for result, entry in zip(parsed, corpus):
+        expected = (entry["artist"], entry["track"]) if entry["artist"] else None
+        if result == expected:
+            correct += 1
+        elif result is not None:
+            wasted += 1
+    return correct, wasted
+
+
+def throughput(parse: Callable, corpus, pages: int) -> float:
+    titles = [e["title"] for e in corpus]
+    channels = [e["channel"] for e in corpus]
+    while len(titles) < PAGE_SIZE:
+        titles, channels = titles * 2, channels * 2
+    page = (titles[:PAGE_SIZE], channels[:PAGE_SIZE])
+
+    start = time.perf_counter()
+    for _ in range(pages):
+        parse(*page)
+    return pages * PAGE_SIZE / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    print(f"{len(corpus)} labelled titles, {args.pages} pages of {PAGE_SIZE}")
+    for name, parse in (("legacy", legacy_page), ("title_parser", current_page)):
+        correct, wasted = accuracy(parse, corpus)
+        rate = throughput(parse, corpus, args.pages)
+        print(
+            f"{name:>12}: {correct / len(corpus):6.1%} correct, "
+            f"{wasted:3d} wasted searches, {rate:12,.0f} titles/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import logging
+import redis
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+
+from clients.search_cache import RedisCache
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+SPOTIFY_PLAYLISTS_CACHE_TTL = int(os.getenv("SPOTIFY_PLAYLISTS_CACHE_TTL", "300"))
+# Spotify user tokens live for an hour, so a profile cached under one can
+# outlive every playlist listing cached for its user.
+SPOTIFY_PROFILE_CACHE_TTL = int(os.getenv("SPOTIFY_PROFILE_CACHE_TTL", "3600"))
+YOUTUBE_PLAYLISTS_CACHE_TTL = int(os.getenv("YOUTUBE_PLAYLISTS_CACHE_TTL", "300"))
+# An OAuth grant always belongs to the same channel.
+YOUTUBE_CHANNEL_CACHE_TTL = int(
+    os.getenv("YOUTUBE_CHANNEL_CACHE_TTL", str(7 * 24 * 3600))
+)
+PLAYLIST_CACHE_MAX_ENTRIES = int(os.getenv("PLAYLIST_CACHE_MAX_ENTRIES", "50000"))
+
+
+class SpotifyPlaylistCache(RedisCache):
+    """
+    Per-user cache of the /spotify/playlists listing (the playlists the user
+    owns) and of the /me profile, keyed on the hashed access token so the
+    listing can be found without calling /me first. A transfer that writes
+    to one of the user's playlists invalidates the listing, whose track
+    counts are then out of date.
+    """
+
+    def __init__(
+        self,
+        ttl: int = SPOTIFY_PLAYLISTS_CACHE_TTL,
+        profile_ttl: int = SPOTIFY_PROFILE_CACHE_TTL,
+        max_entries: int = PLAYLIST_CACHE_MAX_ENTRIES,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        super().__init__("playlists:spotify", ttl, max_entries, redis_client)
+        self.profile_ttl = profile_ttl
+
+    def get_profile(self, access_token: str) -> Optional[Dict[str, Any]]:
+        return self.get("profile", access_token)
+
+    def set_profile(self, access_token: str, profile: Dict[str, Any]) -> None:
+        self.set("profile", access_token, value=profile, ttl=self.profile_ttl)
+
+    def get_playlists(self, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self.get("playlists", user_id)
+
+    def set_playlists(self, user_id: str, playlists: List[Dict[str, Any]]) -> None:
+        self.set("playlists", user_id, value=playlists)
+
+    def invalidate(self, access_token: str) -> None:
+        """Drop the listing of the user `access_token` belongs to."""
+        profile = self.get_profile(access_token)
+        if profile:
+            self.delete("playlists", profile["id"])
+            logger.info(f"Invalidated cached Spotify playlists of {profile['id']}")
+
+
+class YouTubePlaylistCache(RedisCache):
+    """
+    Per-channel cache of the /youtube/playlists listing. A session finds its
+    channel through its OAuth grant (the refresh token, which outlives
+    access-token refreshes), so every session of a channel shares one
+    listing and a cache hit costs no channels.list or playlists.list quota.
+    """
+
+    def __init__(
+        self,
+        ttl: int = YOUTUBE_PLAYLISTS_CACHE_TTL,
+        channel_ttl: int = YOUTUBE_CHANNEL_CACHE_TTL,
+        max_entries: int = PLAYLIST_CACHE_MAX_ENTRIES,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        super().__init__("playlists:youtube", ttl, max_entries, redis_client)
+        self.channel_ttl = channel_ttl
+
+    def get_channel(self, grant: str) -> Optional[str]:
+        return self.get("channel", grant)
+
+    def set_channel(self, grant: str, channel_id: str) -> None:
+        self.set("channel", grant, value=channel_id, ttl=self.channel_ttl)
+
+    def get_playlists(self, channel_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self.get("playlists", channel_id)
+
+    def set_playlists(self, channel_id: str, playlists: List[Dict[str, Any]]) -> None:
+        self.set("playlists", channel_id, value=playlists)
+
+    def invalidate(self, channel_id: str) -> None:
+        self.delete("playlists", channel_id)
@@ -0,0 +1,139 @@
+import os
+import time
+import threading
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+SPOTIFY_API_HOST = "api.spotify.com"
+SPOTIFY_ACCOUNTS_HOST = "accounts.spotify.com"
+YOUTUBE_API_HOST = "www.googleapis.com"
+
+# (starting rate, ceiling) in requests per second for each host.
+HOST_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    SPOTIFY_API_HOST: (
+        float(os.getenv("SPOTIFY_RATE_LIMIT", "10")),
+        float(os.getenv("SPOTIFY_RATE_LIMIT_MAX", "25")),
+    ),
+    SPOTIFY_ACCOUNTS_HOST: (2.0, 5.0),
+    YOUTUBE_API_HOST: (
+        float(os.getenv("YOUTUBE_RATE_LIMIT", "5")),
+        float(os.getenv("YOUTUBE_RATE_LIMIT_MAX", "10")),
+    ),
+}
+DEFAULT_RATE_LIMIT = (5.0, 10.0)
+
+# Retries after a throttled (429) or failed (5xx) response.
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "4"))
+# Longest Retry-After we are willing to sleep through inside a task.
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if value is None or not isinstance(value, (str, bytes, int, float)):
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("ascii", "ignore")
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket for a single host whose refill rate follows AIMD:
+    every successful response adds `increase` requests/second up to
+    `max_rate`, every throttled or failed response multiplies the rate by
+    `decrease`. A Retry-After value pauses the bucket for all callers.
+
+    The limiter is thread-safe and shared by every client in the process.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.5,
+        burst: Optional[float] = None,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.max_rate = max_rate or rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst or max(1.0, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, self._clock() + retry_after
+                )
+        logger.warning(
+            f"Rate limited, slowing to {self.rate:.2f} req/s"
+            + (f" and pausing {retry_after:.1f}s" if retry_after else "")
+        )
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter for `host`, creating it on first use."""
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                rate, max_rate = HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+                limiter = AdaptiveRateLimiter(rate, max_rate=max_rate)
+                _limiters[host] = limiter
+    return limiter
@@ -0,0 +1,212 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+import unicodedata
+import redis
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+
+from config.redis_client import get_redis
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+MATCH_CACHE_TTL = int(os.getenv("MATCH_CACHE_TTL", str(30 * 24 * 3600)))
+MATCH_CACHE_MAX_ENTRIES = int(os.getenv("MATCH_CACHE_MAX_ENTRIES", "200000"))
+YOUTUBE_SEARCH_CACHE_TTL = int(
+    os.getenv("YOUTUBE_SEARCH_CACHE_TTL", str(30 * 24 * 3600))
+)
+YOUTUBE_SEARCH_CACHE_MISS_TTL = int(
+    os.getenv("YOUTUBE_SEARCH_CACHE_MISS_TTL", str(24 * 3600))
+)
+YOUTUBE_SEARCH_CACHE_MAX_ENTRIES = int(
+    os.getenv("YOUTUBE_SEARCH_CACHE_MAX_ENTRIES", "200000")
+)
+
+# After a Redis error the cache stays disabled this long, so an outage costs
+# one failed round trip instead of one per track.
+CACHE_RETRY_INTERVAL = 30.0
+
+_WHITESPACE = re.compile(r"\s+")
+_DASHES = re.compile(r"\s*[-\u2010-\u2015]\s*")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Case-fold, unicode-normalize and collapse whitespace for cache keys."""
+    value = unicodedata.normalize("NFKC", value or "").casefold()
+    return _WHITESPACE.sub(" ", value).strip()
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """Normalize an "artist - track" search query, including dash variants."""
+    return _DASHES.sub(" - ", normalize_text(query))
+
+
+class RedisCache:
+    """
+    JSON values in Redis with a TTL and a cap on the number of entries.
+    Entries are tracked in a sorted set by write time and the oldest are
+    evicted once the cap is exceeded; we cannot rely on maxmemory eviction
+    because the same Redis holds the Celery broker queues.
+
+    Every Redis error is logged and treated as a miss, so a cache outage
+    slows transfers down but never fails them.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        max_entries: int,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._redis = redis_client
+        self.index_key = f"playlifts:{namespace}:index"
+        self.stats_key = f"playlifts:{namespace}:stats"
+        self.hits = 0
+        self.misses = 0
+        self._disabled_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or get_redis()
+
+    def _key(self, *parts: str) -> str:
+        digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+        return f"playlifts:{self.namespace}:{digest}"
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _failed(self, action: str, error: Exception) -> None:
+        logger.warning(f"{self.namespace} cache {action} failed: {error}")
+        self._disabled_until = time.monotonic() + CACHE_RETRY_INTERVAL
+
+    def get(self, *parts: str) -> Optional[Any]:
+        """Return the cached value for `parts`, or None on a miss."""
+        value = None
+        if self._available():
+            try:
+                raw = self.redis.get(self._key(*parts))
+                if raw is not None:
+                    value = json.loads(raw)
+            except (redis.RedisError, ValueError) as e:
+                self._failed("read", e)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, *parts: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store `value` for `parts` and evict the oldest entries over the cap."""
+        if not self._available():
+            return
+
+        key = self._key(*parts)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(key, json.dumps(value, separators=(",", ":")), ex=ttl or self.ttl)
+            pipe.zadd(self.index_key, {key: time.time()})
+            pipe.zcard(self.index_key)
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = self.redis.zpopmin(self.index_key, size - self.max_entries)
+                if evicted:
+                    self.redis.delete(*[member for member, _ in evicted])
+        except redis.RedisError as e:
+            self._failed("write", e)
+
+    def delete(self, *parts: str) -> None:
+        """Drop the cached value for `parts`."""
+        if not self._available():
+            return
+        key = self._key(*parts)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.zrem(self.index_key, key)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._failed("delete", e)
+
+    def flush_stats(self) -> Dict[str, int]:
+        """
+        Add the hits and misses counted since the last flush to the shared
+        counters in Redis. Returns the counts that were flushed.
+        """
+        with self._lock:
+            counts = {"hits": self.hits, "misses": self.misses}
+            self.hits = self.misses = 0
+
+        if self._available() and (counts["hits"] or counts["misses"]):
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.hincrby(self.stats_key, "hits", counts["hits"])
+                pipe.hincrby(self.stats_key, "misses", counts["misses"])
+                pipe.execute()
+            except redis.RedisError as e:
+                self._failed("stats", e)
+        return counts
+
+
+class SpotifyMatchCache(RedisCache):
+    """
+    Shared cache of Spotify search matches keyed on normalized artist and
+    track, holding the compact dict returned by SpotifyClient.search_song.
+    """
+
+    def __init__(
+        self,
+        ttl: int = MATCH_CACHE_TTL,
+        max_entries: int = MATCH_CACHE_MAX_ENTRIES,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        super().__init__("match:spotify", ttl, max_entries, redis_client)
+
+    def get_match(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
+        return self.get(normalize_text(artist), normalize_text(track))
+
+    def set_match(self, artist: str, track: str, match: Dict[str, Any]) -> None:
+        self.set(normalize_text(artist), normalize_text(track), value=match)
+
+
+class YouTubeSearchCache(RedisCache):
+    """
+    Shared cache of YouTube search.list results keyed on the normalized
+    query. Each search costs 100 quota units, so misses (no video found) are
+    cached too, with a shorter TTL so newly uploaded videos are picked up.
+    """
+
+    def __init__(
+        self,
+        ttl: int = YOUTUBE_SEARCH_CACHE_TTL,
+        miss_ttl: int = YOUTUBE_SEARCH_CACHE_MISS_TTL,
+        max_entries: int = YOUTUBE_SEARCH_CACHE_MAX_ENTRIES,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        super().__init__("search:youtube", ttl, max_entries, redis_client)
+        self.miss_ttl = miss_ttl
+
+    def get_results(self, query: str, max_results: int) -> Optional[List[Dict]]:
+        return self.get(normalize_query(query), str(max_results))
+
+    def set_results(self, query: str, max_results: int, results: List[Dict]) -> None:
+        self.set(
+            normalize_query(query),
+            str(max_results),
+            value=results,
+            ttl=self.ttl if results else self.miss_ttl,
+        )
@@ -1,80 +1,245 @@
 import os
 import base64
+import hashlib
 import requests
 import time
 import logging
-from typing import Optional, List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+from clients.http_session import get_session, DEFAULT_TIMEOUT
+from clients.rate_limiter import (
+    get_rate_limiter,
+    parse_retry_after,
+    RATE_LIMIT_MAX_RETRIES,
+)
+from clients.token_store import (
+    get_token_store,
+    load_refresh_token,
+    save_refresh_token,
+)
+
 load_dotenv(override=True)
 
 logger = logging.getLogger(__name__)
 
+# Spotify caps POST /playlists/{id}/tracks at 100 URIs per request.
+PLAYLIST_ADD_BATCH_SIZE = 100
+# PUT /me/tracks accepts at most 50 IDs per request.
+LIBRARY_SAVE_BATCH_SIZE = 50
+# GET /playlists/{id}/tracks returns at most 100 items per page.
+PLAYLIST_TRACKS_PAGE_SIZE = 100
+# GET /me/playlists returns at most 50 playlists per page.
+USER_PLAYLISTS_PAGE_SIZE = 50
+PLAYLIST_TRACK_FIELDS = "items(track(name,artists(name))),total"
+PLAYLIST_TRACK_ID_FIELDS = "items(track(id,name,artists(name))),total"
+PLAYLIST_FETCH_CONCURRENCY = int(os.getenv("SPOTIFY_PLAYLIST_FETCH_CONCURRENCY", "4"))
+SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+
+def _user_token_name(user_token_key: str) -> str:
+    return f"spotify:user:{user_token_key}"
+
+
+def save_user_tokens(access_token: str, refresh_token: str, expires_in: int) -> str:
+    """
+    Keep a user's tokens server-side so that the API and workers can refresh
+    the access token. Returns the key to pass as SpotifyClient's
+    user_token_key.
+    """
+    user_token_key = hashlib.sha1(refresh_token.encode("utf-8")).hexdigest()
+    name = _user_token_name(user_token_key)
+    save_refresh_token(name, refresh_token)
+    get_token_store(name).set(access_token, expires_in)
+    return user_token_key
+
 
 class SpotifyClient:
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+        match_cache=None,
+        user_token_key: Optional[str] = None,
+    ):
         """
         Initialize Spotify client.
 
         Args:
             api_token: User access token (for user-specific operations)
                       If None, will use Client Credentials for public data
+            session: HTTP session to send requests through.
+                     Defaults to the process-wide pooled session.
+            timeout: (connect, read) timeout in seconds for every request
+            match_cache: Optional SpotifyMatchCache consulted by search_song
+            user_token_key: Key returned by save_user_tokens. The user token
+                            is then refreshed before it expires and on 401s.
         """
         self.api_token = api_token
+        self.session = session or get_session()
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.match_cache = match_cache
         self.client_id = os.getenv("SPOTIFY_CLIENT_ID")
         self.client_secret = os.getenv("SPOTIFY_CLIENT_SECRET")
         self.base_url = "https://api.spotify.com/v1"
         self._app_token = None
         self._app_token_expires_at = 0
+        self._user_token_name = None
+        self._user_tokens = None
+        if user_token_key:
+            self._user_token_name = _user_token_name(user_token_key)
+            self._user_tokens = get_token_store(self._user_token_name)
 
         if not self.client_id or not self.client_secret:
             raise ValueError("SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET must be set")
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session, paced by the host's shared
+        rate limiter. 429s are retried after Retry-After; 5xx responses slow
+        the limiter down and are retried for every method except POST, where
+        the write may already have been applied. A 401 on the user token is
+        retried once after refreshing it, if the client can refresh it.
+        """
+        limiter = get_rate_limiter(urlparse(url).netloc)
+        send = getattr(self.session, method.lower())
+        refreshed = False
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            limiter.acquire()
+            response = send(url, timeout=self.timeout, **kwargs)
+
+            status = response.status_code
+            headers = kwargs.get("headers") or {}
+            auth = headers.get("Authorization", "")
+            if (
+                status == 401
+                and not refreshed
+                and self._user_tokens is not None
+                and auth.startswith("Bearer ")
+            ):
+                refreshed = True
+                # Another thread may have refreshed the token while this
+                # request was in flight; only the token it was sent with is stale.
+                sent = auth[len("Bearer ") :]
+                token = self._current_user_token(stale=sent)
+                if token and token != sent:
+                    logger.info("Spotify user token was rejected, retrying")
+                    kwargs["headers"] = {**headers, "Authorization": f"Bearer {token}"}
+                    continue
+            if status == 429 or status >= 500:
+                retry_after = None
+                if status == 429:
+                    retry_after = (
+                        parse_retry_after(response.headers.get("Retry-After")) or 1.0
+                    )
+                limiter.on_throttle(retry_after)
+
+                if attempt < RATE_LIMIT_MAX_RETRIES and (
+                    status == 429 or method.upper() != "POST"
+                ):
+                    logger.warning(
+                        f"{method.upper()} {url} returned {status}, retrying"
+                    )
+                    continue
+            else:
+                limiter.on_success()
+            return response
+
+        return response
+
+    def _basic_auth_headers(self) -> Dict[str, str]:
+        auth_str = f"{self.client_id}:{self.client_secret}"
+        auth_b64 = base64.b64encode(auth_str.encode("ascii")).decode("ascii")
+        return {
+            "Authorization": f"Basic {auth_b64}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+    def _fetch_app_token(self) -> Tuple[str, int]:
+        """Request a new Client Credentials token: (access_token, expires_in)."""
+        headers = self._basic_auth_headers()
+        data = {"grant_type": "client_credentials"}
+
+        response = self._request(
+            "POST",
+            SPOTIFY_TOKEN_URL,
+            headers=headers,
+            data=data,
+        )
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to get app token: {response.status_code} - {response.text}"
+            )
+
+        token_data = response.json()
+        logger.info("Successfully obtained Spotify app token")
+        return token_data["access_token"], token_data.get("expires_in", 3600)
+
     def get_app_token(self) -> bool:
         """
         Get or refresh the Client Credentials (app-only) token.
         This token can access public playlists without user authentication.
+        It is shared with every other client through the app token store, so
+        only one process requests a new one when it expires.
         """
-        current_time = time.time()
-
-        if self._app_token and current_time < self._app_token_expires_at:
+        if self._app_token and time.time() < self._app_token_expires_at:
             return True
 
         try:
-            auth_str = f"{self.client_id}:{self.client_secret}"
-            auth_bytes = auth_str.encode("ascii")
-            auth_b64 = base64.b64encode(auth_bytes).decode("ascii")
-
-            headers = {
-                "Authorization": f"Basic {auth_b64}",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-
-            data = {"grant_type": "client_credentials"}
-
-            response = requests.post(
-                "https://accounts.spotify.com/api/token", headers=headers, data=data
+            store = get_token_store(f"spotify:app:{self.client_id}")
+            self._app_token, self._app_token_expires_at = store.get(
+                self._fetch_app_token
             )
-
-            if response.status_code == 200:
-                token_data = response.json()
-                self._app_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
-                self._app_token_expires_at = (
-                    current_time + expires_in - 60
-                )  # 1 minute buffer
-                logger.info("Successfully obtained Spotify app token")
-                return True
-            else:
-                logger.error(
-                    f"Failed to get app token: {response.status_code} - {response.text}"
-                )
-                return False
-
+            return True
         except Exception as e:
             logger.error(f"Error getting app token: {str(e)}")
             return False
 
+    def _refresh_user_token(self) -> Tuple[str, int]:
+        """Exchange the user's stored refresh token for a new access token."""
+        refresh_token = load_refresh_token(self._user_token_name)
+        if not refresh_token:
+            raise Exception("No refresh token stored for this user")
+
+        response = self._request(
+            "POST",
+            SPOTIFY_TOKEN_URL,
+            headers=self._basic_auth_headers(),
+            data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+        )
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to refresh user token: {response.status_code} - {response.text}"
+            )
+
+        token_data = response.json()
+        if token_data.get("refresh_token"):
+            save_refresh_token(self._user_token_name, token_data["refresh_token"])
+        logger.info("Refreshed Spotify user token")
+        return token_data["access_token"], token_data.get("expires_in", 3600)
+
+    def _current_user_token(self, stale: Optional[str] = None) -> Optional[str]:
+        """
+        Return the user token, refreshed through the shared token store when
+        it is about to expire or was rejected as `stale`. Clients without a
+        user_token_key keep the token they were created with.
+        """
+        if self._user_tokens is not None:
+            try:
+                self.api_token, _ = self._user_tokens.get(
+                    self._refresh_user_token, stale=stale
+                )
+            except Exception as e:
+                logger.error(f"Error refreshing user token: {str(e)}")
+        return self.api_token
+
     def _get_headers(self, use_app_token: bool = False) -> Dict[str, str]:
         """Get headers for API requests."""
         if use_app_token:
@@ -82,78 +247,194 @@ class SpotifyClient:
                 raise Exception("Failed to get app token")
             token = self._app_token
         else:
-            if not self.api_token:
+            token = self._current_user_token()
+            if not token:
                 raise Exception("No user token available")
-            token = self.api_token
 
         return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    def get_tracks_from_playlist(self, playlist_id: str) -> List[Dict[str, Any]]:
+    def _get_playlist_tracks_page(
+        self,
+        playlist_id: str,
+        offset: int,
+        headers: Dict[str, str],
+        fields: str = PLAYLIST_TRACK_FIELDS,
+    ) -> Dict[str, Any]:
+        """Fetch one page of a playlist's tracks, projected to the fields we use."""
+        params = {
+            "offset": offset,
+            "limit": PLAYLIST_TRACKS_PAGE_SIZE,
+            "fields": fields,
+        }
+
+        response = self._request(
+            "GET",
+            f"{self.base_url}/playlists/{playlist_id}/tracks",
+            headers=headers,
+            params=params,
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 404:
+            raise Exception(f"Playlist {playlist_id} not found or is private")
+        elif response.status_code == 401:
+            raise Exception("Authentication failed - playlist may be private")
+        else:
+            raise Exception(f"API error: {response.status_code} - {response.text}")
+
+    def iter_track_pages(
+        self,
+        playlist_id: str,
+        concurrency: int = PLAYLIST_FETCH_CONCURRENCY,
+        on_total: Optional[Callable[[int], None]] = None,
+        include_ids: bool = False,
+        use_app_token: bool = True,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the tracks of a PUBLIC playlist one page at a time, in playlist
+        order, as dicts with only 'track' and 'artist' keys ('id' too with
+        include_ids). Pass use_app_token=False to read the user's own,
+        possibly private, playlists.
+        The first page tells us the playlist's total (passed to on_total);
+        the remaining offsets are then fetched concurrently, at most
+        `concurrency` pages ahead of the consumer.
         """
-        Get up to 15 tracks from a PUBLIC Spotify playlist using Client Credentials.
+        headers = self._get_headers(use_app_token=use_app_token)
+        fields = PLAYLIST_TRACK_ID_FIELDS if include_ids else PLAYLIST_TRACK_FIELDS
+
+        def fetch(offset):
+            return self._get_playlist_tracks_page(playlist_id, offset, headers, fields)
+
+        first = fetch(0)
+        total = first.get("total") or 0
+        if on_total:
+            on_total(total)
+        yield self._parse_playlist_items(first.get("items", []), include_ids)
+
+        offsets = iter(
+            range(PLAYLIST_TRACKS_PAGE_SIZE, total, PLAYLIST_TRACKS_PAGE_SIZE)
+        )
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            window = deque(
+                executor.submit(fetch, offset)
+                for offset in islice(offsets, max(1, concurrency))
+            )
+            while window:
+                data = window.popleft().result()
+                for offset in islice(offsets, 1):
+                    window.append(executor.submit(fetch, offset))
+                yield self._parse_playlist_items(data.get("items", []), include_ids)
+
+    def _parse_playlist_items(
+        self, items: List[Dict[str, Any]], include_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        tracks = []
+        for item in items:
+            track = item.get("track")
+            if track and track.get("name"):
+                artists = [artist["name"] for artist in track.get("artists", [])]
+                parsed = {"track": track["name"], "artist": ", ".join(artists)}
+                if include_ids:
+                    parsed["id"] = track.get("id")
+                tracks.append(parsed)
+        return tracks
+
+    def get_tracks_from_playlist(
+        self, playlist_id: str, max_tracks: Optional[int] = 15
+    ) -> List[Dict[str, Any]]:
+        """
+        Get tracks from a PUBLIC Spotify playlist using Client Credentials.
+        Returns at most `max_tracks` tracks, or the whole playlist when
+        max_tracks is None.
         Returns a list of dicts with only 'track' and 'artist' keys for frontend compatibility.
         """
         try:
-            headers = self._get_headers(use_app_token=True)
             tracks = []
-            offset = 0
-            limit = 50
-            max_tracks = 15
-
-            while len(tracks) < max_tracks:
-                url = f"{self.base_url}/playlists/{playlist_id}/tracks"
-                params = {
-                    "offset": offset,
-                    "limit": limit,
-                    "fields": "items(track(name,artists(name))),next",
-                }
-
-                response = requests.get(url, headers=headers, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    for item in items:
-                        if len(tracks) >= max_tracks:
-                            break
-                        track = item.get("track")
-                        if track and track.get("name"):
-                            artists = [
-                                artist["name"] for artist in track.get("artists", [])
-                            ]
-                            tracks.append(
-                                {"track": track["name"], "artist": ", ".join(artists)}
-                            )
-
-                    if not data.get("next") or len(tracks) >= max_tracks:
-                        break
-
-                    offset += limit
-
-                elif response.status_code == 404:
-                    raise Exception(f"Playlist {playlist_id} not found or is private")
-                elif response.status_code == 401:
-                    raise Exception("Authentication failed - playlist may be private")
-                else:
-                    raise Exception(
-                        f"API error: {response.status_code} - {response.text}"
-                    )
-
-            logger.info(
-                f"Retrieved {len(tracks)} tracks (max 15) from playlist {playlist_id}"
-            )
+            pages = self.iter_track_pages(playlist_id)
+            for page in pages:
+                tracks.extend(page)
+                if max_tracks is not None and len(tracks) >= max_tracks:
+                    pages.close()
+                    tracks = tracks[:max_tracks]
+                    break
+
+            logger.info(f"Retrieved {len(tracks)} tracks from playlist {playlist_id}")
             return tracks
 
         except Exception as e:
             logger.error(f"Error getting tracks from playlist {playlist_id}: {str(e)}")
             raise
 
+    def get_current_user(self) -> Dict[str, Any]:
+        """Get the profile of the user whose token this client holds."""
+        response = self._request(
+            "GET", f"{self.base_url}/me", headers=self._get_headers()
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch user profile: {response.status_code}")
+        return response.json()
+
+    def get_user_playlists(
+        self, user_id: str, concurrency: int = PLAYLIST_FETCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the playlists `user_id` owns, in the order /me/playlists lists
+        them. The first page tells us the total; the remaining 50-playlist
+        pages are then fetched concurrently.
+        """
+        headers = self._get_headers()
+
+        def fetch(offset):
+            response = self._request(
+                "GET",
+                f"{self.base_url}/me/playlists",
+                headers=headers,
+                params={"limit": USER_PLAYLISTS_PAGE_SIZE, "offset": offset},
+            )
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch playlists: {response.status_code}")
+            return response.json()
+
+        first = fetch(0)
+        pages = [first]
+        offsets = range(
+            USER_PLAYLISTS_PAGE_SIZE, first.get("total") or 0, USER_PLAYLISTS_PAGE_SIZE
+        )
+        if offsets:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                pages.extend(executor.map(fetch, offsets))
+
+        playlists = []
+        for page in pages:
+            for playlist in page.get("items") or []:
+                if not playlist or playlist["owner"]["id"] != user_id:
+                    continue
+                images = playlist.get("images")
+                playlists.append(
+                    {
+                        "id": playlist["id"],
+                        "name": playlist["name"],
+                        "tracks_count": playlist["tracks"]["total"],
+                        "owner": playlist["owner"]["display_name"],
+                        "public": playlist.get("public", False),
+                        "cover_image": images[0]["url"] if images else None,
+                    }
+                )
+        return playlists
+
     def search_song(self, artist: str, track: str) -> Dict[str, Any]:
         """
         Search for a song on Spotify.
         Uses user token if available, otherwise uses app token.
+        Matches are served from and stored in the match cache when one is set.
         """
+        if self.match_cache:
+            cached = self.match_cache.get_match(artist, track)
+            if cached is not None:
+                return cached
+
         try:
             use_app_token = self.api_token is None
             headers = self._get_headers(use_app_token=use_app_token)
@@ -162,8 +443,11 @@ class SpotifyClient:
 
             params = {"q": query, "type": "track", "limit": 1}
 
-            response = requests.get(
-                f"{self.base_url}/search", headers=headers, params=params
+            response = self._request(
+                "GET",
+                f"{self.base_url}/search",
+                headers=headers,
+                params=params,
             )
 
             if response.status_code == 200:
@@ -176,7 +460,7 @@ class SpotifyClient:
                         artist["name"] for artist in track_data.get("artists", [])
                     ]
 
-                    return {
+                    match = {
                         "id": track_data["id"],
                         "name": track_data["name"],
                         "artist": ", ".join(artists),
@@ -186,6 +470,9 @@ class SpotifyClient:
                         .get("images", [{}])[0]
                         .get("url"),
                     }
+                    if self.match_cache:
+                        self.match_cache.set_match(artist, track, match)
+                    return match
                 else:
                     raise Exception(f"No results found for '{artist} - {track}'")
             else:
@@ -210,7 +497,8 @@ class SpotifyClient:
 
             data = {"uris": [f"spotify:track:{song_data['id']}"]}
 
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/playlists/{playlist_id}/tracks",
                 headers=headers,
                 json=data,
@@ -231,6 +519,50 @@ class SpotifyClient:
             logger.error(f"Error adding song to playlist: {str(e)}")
             return False
 
+    def add_songs_to_playlist(
+        self, songs: List[Dict[str, Any]], playlist_id: str
+    ) -> List[bool]:
+        """
+        Add several songs to a Spotify playlist in batches of up to 100 URIs.
+        Songs are inserted in the order given.
+        Returns one success flag per song, in the same order as `songs`.
+        """
+        if not self.api_token:
+            raise Exception("User token required for playlist modification")
+
+        results = [False] * len(songs)
+        valid = [i for i, song in enumerate(songs) if song.get("id")]
+
+        for start in range(0, len(valid), PLAYLIST_ADD_BATCH_SIZE):
+            chunk = valid[start : start + PLAYLIST_ADD_BATCH_SIZE]
+            try:
+                headers = self._get_headers(use_app_token=False)
+
+                data = {"uris": [f"spotify:track:{songs[i]['id']}" for i in chunk]}
+
+                response = self._request(
+                    "POST",
+                    f"{self.base_url}/playlists/{playlist_id}/tracks",
+                    headers=headers,
+                    json=data,
+                )
+
+                if response.status_code in [200, 201]:
+                    for i in chunk:
+                        results[i] = True
+                    logger.info(
+                        f"Successfully added {len(chunk)} songs to playlist {playlist_id}"
+                    )
+                else:
+                    logger.error(
+                        f"Failed to add {len(chunk)} songs to playlist: {response.status_code} - {response.text}"
+                    )
+
+            except Exception as e:
+                logger.error(f"Error adding songs to playlist: {str(e)}")
+
+        return results
+
     def add_song_to_spotify(self, song_data: Dict[str, Any]) -> bool:
         """
         Add a song to user's Liked Songs.
@@ -244,8 +576,11 @@ class SpotifyClient:
 
             data = {"ids": [song_data["id"]]}
 
-            response = requests.put(
-                f"{self.base_url}/me/tracks", headers=headers, json=data
+            response = self._request(
+                "PUT",
+                f"{self.base_url}/me/tracks",
+                headers=headers,
+                json=data,
             )
 
             if response.status_code == 200:
@@ -260,3 +595,44 @@ class SpotifyClient:
         except Exception as e:
             logger.error(f"Error adding song to liked songs: {str(e)}")
             return False
+
+    def save_songs_to_library(self, songs: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Save several songs to user's Liked Songs in batches of up to 50 IDs.
+        Duplicate IDs are only sent once and share the same outcome.
+        Returns one success flag per song, in the same order as `songs`.
+        """
+        if not self.api_token:
+            raise Exception("User token required for adding to liked songs")
+
+        unique_ids = list(dict.fromkeys(song["id"] for song in songs if song.get("id")))
+        saved = {}
+
+        for start in range(0, len(unique_ids), LIBRARY_SAVE_BATCH_SIZE):
+            chunk = unique_ids[start : start + LIBRARY_SAVE_BATCH_SIZE]
+            try:
+                headers = self._get_headers(use_app_token=False)
+
+                response = self._request(
+                    "PUT",
+                    f"{self.base_url}/me/tracks",
+                    headers=headers,
+                    json={"ids": chunk},
+                )
+
+                success = response.status_code == 200
+                if success:
+                    logger.info(f"Successfully added {len(chunk)} songs to liked songs")
+                else:
+                    logger.error(
+                        f"Failed to add {len(chunk)} songs to liked songs: {response.status_code} - {response.text}"
+                    )
+
+            except Exception as e:
+                logger.error(f"Error adding songs to liked songs: {str(e)}")
+                success = False
+
+            for track_id in chunk:
+                saved[track_id] = success
+
+        return [saved.get(song.get("id"), False) for song in songs]
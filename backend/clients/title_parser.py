@@ -0,0 +1,136 @@
+import re
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# "Artist - Track" with any dash; en and em dashes also split without spaces.
+_SEPARATOR = re.compile(r"\s+[-\u2010-\u2012\u2212\uff0d]+\s+|\s*[\u2013-\u2015]\s*")
+_PIPE = re.compile(r"\s*[|\u2502\uff5c]\s*")
+# A bracketed group; unclosed groups at the end of a title count too.
+_BRACKET = re.compile(r"\s*[(\[{\u3010\uff08]([^)\]}\u3011\uff09]*)[)\]}\u3011\uff09]?")
+_QUOTED = re.compile(
+    r"^(.+?)\s+[\"'\u2018\u201c\u00ab](.+?)[\"'\u2019\u201d\u00bb](?:\s|$)"
+)
+_HASHTAG = re.compile(r"\s*#\w+")
+_WHITESPACE = re.compile(r"\s+")
+_TOPIC = re.compile(r"\s+-\s+topic$", re.I)
+
+_FEAT_GROUP = re.compile(r"^(?:feat\.?|ft\.?|featuring|with)\s+(.+)$", re.I)
+_FEAT_TAIL = re.compile(r"\s+(?:feat\.?|ft\.?|featuring)\s+(.+)$", re.I)
+_LIVE = re.compile(r"\blive\b", re.I)
+_VERSION = re.compile(
+    r"\b(?:remix|rmx|mix|edit|version|acoustic|unplugged|instrumental|bootleg"
+    r"|flip|sped up|slowed)\b",
+    re.I,
+)
+_NOISE_WORDS = re.compile(
+    r"\b(?:official|music|video|audio|lyrics?|visuali[sz]er|hd|hq|4k)\b", re.I
+)
+_NOISE_TAIL = re.compile(
+    r"\s+(?:official\s+(?:music\s+)?(?:video|audio|lyric\s+video|visuali[sz]er)"
+    r"|lyrics?\s+video|with\s+lyrics|lyrics|hd|hq|4k)$",
+    re.I,
+)
+_EDGE_CHARS = (
+    " -\u2010\u2011\u2012\u2013\u2014\u2015|:;,~\"'\u201c\u201d\u2018\u2019\u00ab\u00bb"
+)
+
+
+class ParsedTitle(NamedTuple):
+    artist: str
+    track: str
+    featured: Tuple[str, ...] = ()
+
+
+def _clean(value: str) -> str:
+    return _WHITESPACE.sub(" ", value).strip(_EDGE_CHARS)
+
+
+def _split_feat(value: str, featured: List[str]) -> str:
+    match = _FEAT_TAIL.search(value)
+    if match:
+        featured.append(_clean(match.group(1)))
+        value = value[: match.start()]
+    return value
+
+
+def _classify(part: str, featured: List[str], versions: List[str]) -> None:
+    """
+    Sort a bracketed group or trailing " - ..." part of a title: featured
+    artists and version markers (remix, live, ...) are kept, which turns
+    everything else (official video, lyrics, remaster, ...) into noise.
+    """
+    part = _clean(part)
+    match = _FEAT_GROUP.match(part)
+    if match:
+        featured.append(_clean(match.group(1)))
+    elif _LIVE.search(part):
+        versions.append("Live")
+    elif _VERSION.search(part):
+        version = _clean(_NOISE_WORDS.sub("", part))
+        if version:
+            versions.append(version)
+
+
+def parse_title(
+    title: Optional[str], channel_title: Optional[str] = None
+) -> Optional[ParsedTitle]:
+    """
+    Split a YouTube video title into the artist and track to search Spotify
+    for, or None if it does not name both. Uploads by "<Artist> - Topic"
+    channels are titled with the track alone, so their artist comes from
+    `channel_title`.
+    """
+    if not title:
+        return None
+
+    featured: List[str] = []
+    versions: List[str] = []
+
+    def bracket(match):
+        _classify(match.group(1), featured, versions)
+        return " "
+
+    text = _BRACKET.sub(bracket, _HASHTAG.sub("", title))
+    parts = [part for part in _SEPARATOR.split(text) if part.strip()]
+
+    topic = _TOPIC.search(channel_title or "")
+    if topic:
+        artist, track, rest = channel_title[: topic.start()], text, []
+        if parts:
+            track, rest = parts[0], parts[1:]
+    elif len(parts) >= 2:
+        artist, track, rest = parts[0], parts[1], parts[2:]
+    else:
+        pipe_parts = _PIPE.split(text)
+        quoted = _QUOTED.match(text)
+        if len(pipe_parts) >= 2:
+            track, artist, rest = pipe_parts[0], pipe_parts[1], pipe_parts[2:]
+        elif quoted:
+            artist, track, rest = quoted.group(1), quoted.group(2), []
+        else:
+            return None
+
+    # "Artist - Track | Official Video": whatever follows a pipe is extra.
+    track_parts = _PIPE.split(track)
+    track, rest = track_parts[0], track_parts[1:] + rest
+    for part in rest:
+        _classify(part, featured, versions)
+
+    artist = _clean(_split_feat(artist, featured))
+    track = _clean(_NOISE_TAIL.sub("", _clean(_split_feat(track, featured))))
+    if not artist or not track:
+        return None
+    if versions:
+        track = f"{track} ({' '.join(versions)})"
+    return ParsedTitle(artist, track, tuple(f for f in featured if f))
+
+
+def parse_titles(
+    titles: Sequence[Optional[str]],
+    channel_titles: Optional[Sequence[Optional[str]]] = None,
+) -> List[Optional[ParsedTitle]]:
+    """Parse a page of titles (and their uploaders' channel titles) at once."""
+    if channel_titles is None:
+        return [parse_title(title) for title in titles]
+    return [
+        parse_title(title, channel) for title, channel in zip(titles, channel_titles)
+    ]
@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+import redis
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from dotenv import load_dotenv
+
+from config.redis_client import get_redis
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# How long a refresher holds the lease, and so the longest anyone else waits
+# for it before refreshing on its own.
+TOKEN_REFRESH_LEASE_SECONDS = float(os.getenv("TOKEN_REFRESH_LEASE_SECONDS", "10"))
+TOKEN_REFRESH_POLL_INTERVAL = 0.1
+# Tokens are treated as expired this long before they actually expire.
+TOKEN_EXPIRY_MARGIN = 60
+
+# Seconds a user's refresh token is kept after they last signed in.
+REFRESH_TOKEN_TTL = int(os.getenv("REFRESH_TOKEN_TTL", str(30 * 24 * 3600)))
+# Token stores a process keeps in memory; the least recently used go first.
+TOKEN_STORE_CACHE_SIZE = int(os.getenv("TOKEN_STORE_CACHE_SIZE", "1000"))
+
+# Returns (access_token, expires_in seconds).
+TokenFetcher = Callable[[], Tuple[str, int]]
+
+
+class SharedTokenStore:
+    """
+    An access token shared by every thread of a process and, through Redis,
+    by every API and worker process. Once it expires, one caller takes a
+    lease in Redis and fetches a new token while the others wait for it to
+    appear; within a process a lock keeps threads from racing to Redis.
+
+    A Redis error falls back to fetching the token locally, so an outage
+    costs extra token requests but never fails one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lease_seconds: float = TOKEN_REFRESH_LEASE_SECONDS,
+        expiry_margin: float = TOKEN_EXPIRY_MARGIN,
+        redis_client: Optional[redis.Redis] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.key = f"playlifts:token:{name}"
+        self.lease_key = f"{self.key}:lease"
+        self.lease_seconds = lease_seconds
+        self.expiry_margin = expiry_margin
+        self._redis = redis_client
+        self._clock = clock
+        self._sleep = sleep
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self.refreshes = 0
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or get_redis()
+
+    def _usable(
+        self, token: Optional[str], expires_at: float, stale: Optional[str]
+    ) -> bool:
+        return bool(token) and token != stale and self._clock() < expires_at
+
+    def get(
+        self, fetch: TokenFetcher, stale: Optional[str] = None
+    ) -> Tuple[str, float]:
+        """
+        Return (access_token, expires_at), calling `fetch` only if no valid
+        token is held by this process or in Redis and no other process is
+        already fetching one. Pass the token a request was just rejected
+        with as `stale` to have it replaced.
+        """
+        token, expires_at = self._token, self._expires_at
+        if self._usable(token, expires_at, stale):
+            return token, expires_at
+
+        with self._lock:
+            if self._usable(self._token, self._expires_at, stale):
+                return self._token, self._expires_at
+            try:
+                token, expires_at = self._get_shared(fetch, stale)
+            except redis.RedisError as e:
+                logger.warning(f"Shared token {self.key} unavailable: {e}")
+                token, expires_at = self._fetch(fetch)
+            self._token, self._expires_at = token, expires_at
+            return token, expires_at
+
+    def set(self, token: str, expires_in: float) -> None:
+        """Store a token obtained elsewhere, e.g. from an OAuth callback."""
+        expires_at = self._clock() + expires_in - self.expiry_margin
+        with self._lock:
+            self._token, self._expires_at = token, expires_at
+        self._write(token, expires_at)
+
+    def _fetch(self, fetch: TokenFetcher) -> Tuple[str, float]:
+        token, expires_in = fetch()
+        self.refreshes += 1
+        return token, self._clock() + expires_in - self.expiry_margin
+
+    def _read(self, stale: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        raw = self.redis.get(self.key)
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        if not self._usable(data["access_token"], data["expires_at"], stale):
+            return None
+        return data["access_token"], data["expires_at"]
+
+    def _get_shared(
+        self, fetch: TokenFetcher, stale: Optional[str]
+    ) -> Tuple[str, float]:
+        deadline = self._clock() + self.lease_seconds
+        while True:
+            shared = self._read(stale)
+            if shared:
+                return shared
+
+            lease = uuid.uuid4().hex
+            if self.redis.set(
+                self.lease_key, lease, nx=True, px=int(self.lease_seconds * 1000)
+            ):
+                try:
+                    token, expires_at = self._fetch(fetch)
+                    self._write(token, expires_at)
+                    return token, expires_at
+                finally:
+                    self._release(lease)
+
+            if self._clock() >= deadline:
+                # Whoever holds the lease is stuck; stop waiting for them.
+                return self._fetch(fetch)
+            self._sleep(TOKEN_REFRESH_POLL_INTERVAL)
+
+    def _write(self, token: str, expires_at: float) -> None:
+        ttl = int(expires_at - self._clock())
+        if ttl <= 0:
+            return
+        try:
+            self.redis.set(
+                self.key,
+                json.dumps({"access_token": token, "expires_at": expires_at}),
+                ex=ttl,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to share token {self.key}: {e}")
+
+    def _release(self, lease: str) -> None:
+        try:
+            if self.redis.get(self.lease_key) == lease.encode():
+                self.redis.delete(self.lease_key)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to release token lease {self.lease_key}: {e}")
+
+
+def save_refresh_token(
+    name: str, refresh_token: str, ttl: int = REFRESH_TOKEN_TTL
+) -> None:
+    """Keep a user's refresh token server-side, next to their access token."""
+    try:
+        get_redis().set(f"playlifts:token:{name}:refresh", refresh_token, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to save refresh token {name}: {e}")
+
+
+def load_refresh_token(name: str) -> Optional[str]:
+    """Return the refresh token saved for `name`, or None."""
+    raw = get_redis().get(f"playlifts:token:{name}:refresh")
+    return raw.decode() if isinstance(raw, bytes) else raw
+
+
+_stores: "OrderedDict[str, SharedTokenStore]" = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def get_token_store(name: str, **kwargs) -> SharedTokenStore:
+    """
+    Return the process-wide token store for `name`, creating it on first use
+    with `kwargs` passed to SharedTokenStore. Only the TOKEN_STORE_CACHE_SIZE
+    most recently used stores are kept; an evicted user's token is still in
+    Redis, so their next store picks it up from there.
+    """
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            store = _stores[name] = SharedTokenStore(name, **kwargs)
+            while len(_stores) > TOKEN_STORE_CACHE_SIZE:
+                _stores.popitem(last=False)
+        else:
+            _stores.move_to_end(name)
+    return store
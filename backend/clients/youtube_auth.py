@@ -0,0 +1,103 @@
+import os
+import hashlib
+from datetime import datetime
+from typing import Any, Dict
+from dotenv import load_dotenv
+from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request as GoogleRequest
+
+from clients.token_store import SharedTokenStore, get_token_store
+
+load_dotenv(override=True)
+
+# Access tokens are refreshed this many seconds before they expire. It must
+# exceed google-auth's own refresh threshold (3m45s) so that credentials in
+# use always find an already refreshed token in the store.
+YOUTUBE_TOKEN_REFRESH_MARGIN = int(os.getenv("YOUTUBE_TOKEN_REFRESH_MARGIN", "300"))
+
+
+def youtube_token_data(credentials: Credentials) -> Dict[str, Any]:
+    """The form YouTube credentials are kept in the session and task args."""
+    return {
+        "token": credentials.token,
+        "refresh_token": credentials.refresh_token,
+        "token_uri": credentials.token_uri,
+        "client_id": credentials.client_id,
+        "client_secret": credentials.client_secret,
+        "scopes": credentials.scopes,
+    }
+
+
+def _token_store(token_data: Dict[str, Any]) -> SharedTokenStore:
+    grant = f"{token_data['client_id']}\x1f{token_data['refresh_token']}"
+    user = hashlib.sha1(grant.encode("utf-8")).hexdigest()
+    return get_token_store(
+        f"youtube:{user}", expiry_margin=YOUTUBE_TOKEN_REFRESH_MARGIN
+    )
+
+
+class SharedCredentials(Credentials):
+    """
+    Google OAuth credentials whose access token lives in the user's shared
+    token store, so the API and every worker thread holding them see the
+    same token and only one of them refreshes it.
+    """
+
+    def __init__(self, token_data: Dict[str, Any], store: SharedTokenStore):
+        # The token is always taken from the store, by the first refresh().
+        super().__init__(
+            token=None,
+            refresh_token=token_data["refresh_token"],
+            token_uri=token_data["token_uri"],
+            client_id=token_data["client_id"],
+            client_secret=token_data["client_secret"],
+            scopes=token_data["scopes"],
+        )
+        self._store = store
+
+    def _refresh_from_google(self, request):
+        Credentials.refresh(self, request)
+        if self.expiry is None:
+            return self.token, 3600
+        return self.token, (self.expiry - datetime.utcnow()).total_seconds()
+
+    def refresh(self, request):
+        # Credentials that are still valid are only refreshed after the API
+        # rejected their token, which the store must then replace.
+        stale = self.token if self.valid else None
+        token, expires_at = self._store.get(
+            lambda: self._refresh_from_google(request), stale=stale
+        )
+        self.token = token
+        self.expiry = datetime.utcfromtimestamp(expires_at + self._store.expiry_margin)
+
+
+def save_youtube_credentials(credentials: Credentials) -> Dict[str, Any]:
+    """
+    Share freshly granted credentials so that nobody refreshes them before
+    they are due. Returns their token data.
+    """
+    token_data = youtube_token_data(credentials)
+    if credentials.refresh_token and credentials.expiry:
+        expires_in = (credentials.expiry - datetime.utcnow()).total_seconds()
+        _token_store(token_data).set(credentials.token, expires_in)
+    return token_data
+
+
+def youtube_credentials(token_data: Dict[str, Any]) -> Credentials:
+    """
+    Build credentials holding the user's current access token, refreshing
+    it first if it is about to expire. Raises if the refresh fails.
+    """
+    if not token_data.get("refresh_token"):
+        return Credentials(
+            token=token_data["token"],
+            token_uri=token_data["token_uri"],
+            client_id=token_data["client_id"],
+            client_secret=token_data["client_secret"],
+            scopes=token_data["scopes"],
+        )
+
+    credentials = SharedCredentials(token_data, _token_store(token_data))
+    credentials.refresh(GoogleRequest())
+    return credentials
@@ -1,5 +1,66 @@
+import threading
+import httplib2
+import google_auth_httplib2
 import googleapiclient.discovery
 import youtube_dl
+from typing import Any, Dict, Optional
+from googleapiclient import discovery_cache
+from googleapiclient.errors import HttpError
+
+from clients.rate_limiter import (
+    get_rate_limiter,
+    parse_retry_after,
+    RATE_LIMIT_MAX_RETRIES,
+    YOUTUBE_API_HOST,
+)
+from clients.title_parser import parse_titles
+
+# 403 reasons that mean "slow down", as opposed to quotaExceeded which lasts
+# until the daily quota resets and is not worth retrying.
+RATE_LIMIT_REASONS = ("ratelimitexceeded", "userratelimitexceeded")
+
+# Only what title parsing, duplicate checks and paging need from
+# playlistItems.list. The uploader's channel title names the artist of
+# "<Artist> - Topic" uploads.
+PLAYLIST_ITEM_FIELDS = (
+    "nextPageToken,pageInfo/totalResults,"
+    "items/snippet(title,videoOwnerChannelTitle,resourceId/videoId)"
+)
+PLAYLIST_PAGE_SIZE = 50
+# Only what the playlist picker shows from playlists.list.
+PLAYLIST_LIST_FIELDS = "nextPageToken,items(id,snippet/title)"
+
+_services: Dict[Optional[str], Any] = {}
+_services_lock = threading.Lock()
+
+
+def _build_service(api_key: Optional[str]) -> Any:
+    # Requests are always executed with YouTubeClient._http(), so the service
+    # gets a bare Http just to keep the build from looking up default
+    # credentials.
+    document = discovery_cache.get_static_doc("youtube", "v3")
+    if document is None:
+        return googleapiclient.discovery.build(
+            "youtube", "v3", developerKey=api_key, http=httplib2.Http()
+        )
+    return googleapiclient.discovery.build_from_document(
+        document, developerKey=api_key, http=httplib2.Http()
+    )
+
+
+def get_youtube_service(api_key: Optional[str] = None) -> Any:
+    """
+    Return the process-wide YouTube service for `api_key` (None for OAuth
+    clients), built from the static discovery document on first use. It
+    holds no credentials, so it is shared by every user and thread.
+    """
+    service = _services.get(api_key)
+    if service is None:
+        with _services_lock:
+            service = _services.get(api_key)
+            if service is None:
+                service = _services[api_key] = _build_service(api_key)
+    return service
 
 
 class Playlist(object):
@@ -17,61 +78,166 @@ class Song(object):
         return f"{self.artist} - {self.track}"
 
 
+class PlaylistPage(object):
+    def __init__(self, songs, item_count, total, next_page_token=None, video_ids=None):
+        self.songs = songs
+        self.item_count = item_count
+        self.total = total
+        self.next_page_token = next_page_token
+        self.video_ids = video_ids or []
+
+
 class YouTubeClient(object):
-    def __init__(self, credentials=None, api_key=None):
+    def __init__(self, credentials=None, api_key=None, search_cache=None):
         youtube_dl.utils.std_headers["User-Agent"] = (
             "facebookexternalhit/1.1 (+http://www.facebook.com/externalhit_uatext.php)"
         )
 
-        self.youtube_client = None
+        self.credentials = credentials
+        self.search_cache = search_cache
+        self._local = threading.local()
         if credentials:
-            self.youtube_client = googleapiclient.discovery.build(
-                "youtube", "v3", credentials=credentials
-            )
+            self.youtube_client = get_youtube_service()
         elif api_key:
-            self.youtube_client = googleapiclient.discovery.build(
-                "youtube", "v3", developerKey=api_key
-            )
+            self.youtube_client = get_youtube_service(api_key)
         else:
             raise ValueError("YouTubeClient requires credentials or api_key")
 
-    def get_videos_from_playlist(self, playlist_id):
-        songs = []
-        request = self.youtube_client.playlistItems().list(
-            playlistId=playlist_id, part="snippet", maxResults=50
-        )
-        response = request.execute()
+    def _http(self):
+        """
+        httplib2 connections are not thread-safe, so every thread that
+        executes requests through this client gets its own.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = httplib2.Http()
+            if self.credentials:
+                http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=http)
+            self._local.http = http
+        return http
+
+    def _execute(self, request):
+        """
+        Execute an API request paced by the shared YouTube rate limiter.
+        Throttled requests are retried after backing off; server errors are
+        retried too, except for inserts, which may already have been applied.
+        """
+        limiter = get_rate_limiter(YOUTUBE_API_HOST)
 
-        for item in response["items"]:
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            limiter.acquire()
             try:
-                title = item["snippet"]["title"]
-
-                if " - " in title:
-                    artist, track = title.split(" - ", 1)
-                    track = track.split("(")[0].split("[")[0].strip()
-                    artist = artist.strip()
-                    if artist and track:
-                        songs.append(Song(artist, track))
-            except:
+                response = request.execute(http=self._http())
+            except HttpError as e:
+                status = e.resp.status
+                throttled = status == 429 or (
+                    status == 403
+                    and any(
+                        r in str(e.error_details).lower() for r in RATE_LIMIT_REASONS
+                    )
+                )
+                if not throttled and status < 500:
+                    raise
+
+                retry_after = parse_retry_after(e.resp.get("retry-after"))
+                limiter.on_throttle(retry_after or (1.0 if throttled else None))
+                if attempt >= RATE_LIMIT_MAX_RETRIES or (
+                    not throttled and request.method == "POST"
+                ):
+                    raise
                 continue
-        return songs
+
+            limiter.on_success()
+            return response
+
+    def iter_playlist_pages(self, playlist_id, page_size=PLAYLIST_PAGE_SIZE):
+        """
+        Yield a PlaylistPage per playlistItems.list page, following
+        nextPageToken until the whole playlist has been read. The next page is
+        only requested once the caller asks for it, so memory stays bounded
+        by the page size.
+        """
+        page_token = None
+        while True:
+            request = self.youtube_client.playlistItems().list(
+                playlistId=playlist_id,
+                part="snippet",
+                maxResults=page_size,
+                fields=PLAYLIST_ITEM_FIELDS,
+                pageToken=page_token,
+            )
+            response = self._execute(request)
+
+            items = response.get("items", [])
+            snippets = [item.get("snippet") or {} for item in items]
+            video_ids = [
+                video_id
+                for video_id in (
+                    (snippet.get("resourceId") or {}).get("videoId")
+                    for snippet in snippets
+                )
+                if video_id
+            ]
+            parsed = parse_titles(
+                [snippet.get("title") for snippet in snippets],
+                [snippet.get("videoOwnerChannelTitle") for snippet in snippets],
+            )
+            songs = [Song(p.artist, p.track) for p in parsed if p]
+
+            page_token = response.get("nextPageToken")
+            total = response.get("pageInfo", {}).get("totalResults", len(items))
+            yield PlaylistPage(songs, len(items), total, page_token, video_ids)
+
+            if not page_token:
+                break
+
+    def iter_videos_from_playlist(self, playlist_id):
+        """Yield the Song for every parseable video, page by page."""
+        for page in self.iter_playlist_pages(playlist_id):
+            yield from page.songs
+
+    def get_videos_from_playlist(self, playlist_id):
+        return list(self.iter_videos_from_playlist(playlist_id))
+
+    def get_channel_id(self):
+        """The id of the authenticated user's channel, or None without one."""
+        request = self.youtube_client.channels().list(
+            part="id", mine=True, fields="items/id"
+        )
+        items = self._execute(request).get("items") or []
+        return items[0]["id"] if items else None
 
     def get_playlists(self):
+        """All of the authenticated user's playlists, 50 per playlists.list call."""
         playlists = []
-        request = self.youtube_client.playlists().list(
-            part="snippet", mine=True, maxResults=50
-        )
-        response = request.execute()
-        for item in response.get("items", []):
-            playlists.append({"id": item["id"], "title": item["snippet"]["title"]})
-        return playlists
+        page_token = None
+        while True:
+            request = self.youtube_client.playlists().list(
+                part="snippet",
+                mine=True,
+                maxResults=PLAYLIST_PAGE_SIZE,
+                pageToken=page_token,
+                fields=PLAYLIST_LIST_FIELDS,
+            )
+            response = self._execute(request)
+            for item in response.get("items", []):
+                playlists.append({"id": item["id"], "title": item["snippet"]["title"]})
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return playlists
 
     def search_videos(self, query, max_results=25):
+        if self.search_cache:
+            cached = self.search_cache.get_results(query, max_results)
+            if cached is not None:
+                return cached
+
         results = []
         request = self.youtube_client.search().list(
             q=query, part="snippet", maxResults=max_results, type="video"
         )
-        response = request.execute()
+        response = self._execute(request)
         for item in response.get("items", []):
             results.append(
                 {
@@ -81,6 +247,9 @@ class YouTubeClient(object):
                     "thumbnail": item["snippet"]["thumbnails"]["default"]["url"],
                 }
             )
+
+        if self.search_cache:
+            self.search_cache.set_results(query, max_results, results)
         return results
 
     def add_video_to_playlist(self, playlist_id, video_id):
@@ -94,5 +263,5 @@ class YouTubeClient(object):
         request = self.youtube_client.playlistItems().insert(
             part="snippet", body=request_body
         )
-        response = request.execute()
+        response = self._execute(request)
         return response
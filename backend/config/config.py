@@ -3,6 +3,8 @@ from flask_cors import CORS
 import os
 from dotenv import load_dotenv
 
+from config.redis_session import RedisSessionInterface
+
 load_dotenv(override=True)
 
 app = Flask(__name__)
@@ -21,3 +23,4 @@ CORS(
 )
 
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
+app.session_interface = RedisSessionInterface()
@@ -0,0 +1,38 @@
+import os
+import threading
+import redis
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+
+_client: Optional[redis.Redis] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_redis() -> redis.Redis:
+    """
+    Return the process-wide Redis client for the Redis instance Celery
+    already uses as broker and result backend. Rebuilt after a fork so
+    worker processes never share connections with their parent.
+    """
+    global _client, _client_pid
+
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+
+    with _client_lock:
+        if _client is None or _client_pid != pid:
+            _client = redis.Redis.from_url(
+                REDIS_URL,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                health_check_interval=30,
+            )
+            _client_pid = pid
+        return _client
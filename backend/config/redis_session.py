@@ -0,0 +1,136 @@
+import os
+import re
+import secrets
+import logging
+import redis
+from typing import Optional
+from dotenv import load_dotenv
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from config.redis_client import get_redis
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a session is kept in Redis after it was last written.
+SESSION_TTL = int(os.getenv("SESSION_TTL", str(30 * 24 * 3600)))
+
+_SESSION_ID = re.compile(r"^[A-Za-z0-9_-]{43}$")
+
+
+def _new_session_id() -> str:
+    return secrets.token_urlsafe(32)
+
+
+class RedisSession(CallbackDict, SessionMixin):
+    """Session data loaded from Redis, marked modified on every change."""
+
+    def __init__(self, initial=None, sid: Optional[str] = None, new: bool = False):
+        def on_update(session):
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid or _new_session_id()
+        self.new = new
+        self.modified = False
+
+
+class RedisSessionInterface(SessionInterface):
+    """
+    Server-side sessions in the Redis Celery already uses. The cookie only
+    holds a random session id; the data is stored as compact tagged JSON
+    under playlifts:session:<id> and written back only when it changes, so
+    any API replica can serve any user.
+
+    If Redis is unavailable the request gets an empty session, as if the
+    user had logged out, instead of failing.
+    """
+
+    serializer = TaggedJSONSerializer()
+    session_class = RedisSession
+
+    def __init__(
+        self, ttl: int = SESSION_TTL, redis_client: Optional[redis.Redis] = None
+    ):
+        self.ttl = ttl
+        self._redis = redis_client
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or get_redis()
+
+    @staticmethod
+    def _key(sid: str) -> str:
+        return f"playlifts:session:{sid}"
+
+    def open_session(self, app, request) -> RedisSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid or not _SESSION_ID.match(sid):
+            return self.session_class(new=True)
+
+        try:
+            raw = self.redis.get(self._key(sid))
+            if raw is not None:
+                return self.session_class(self.serializer.loads(raw), sid=sid)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to load session: {e}")
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable session: {e}")
+        # Unknown or expired ids are never reused.
+        return self.session_class(new=True)
+
+    def save_session(self, app, session: RedisSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if not session:
+            if session.modified:
+                try:
+                    self.redis.delete(self._key(session.sid))
+                except redis.RedisError as e:
+                    logger.warning(f"Failed to delete session: {e}")
+                response.delete_cookie(
+                    name,
+                    domain=domain,
+                    path=path,
+                    secure=secure,
+                    samesite=samesite,
+                    httponly=httponly,
+                )
+                response.vary.add("Cookie")
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        try:
+            self.redis.set(
+                self._key(session.sid),
+                self.serializer.dumps(dict(session)),
+                ex=self.ttl,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to save session: {e}")
+            return
+
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+        response.vary.add("Cookie")
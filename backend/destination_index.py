@@ -0,0 +1,73 @@
+import logging
+from typing import Iterable, Optional, Set, Tuple
+
+from clients.search_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+def _song_keys(artist: Optional[str], track: Optional[str]) -> Set[Tuple[str, str]]:
+    """
+    One (artist, track) key per credited artist, so "A, B - Song" on one side
+    matches "A - Song" on the other.
+    """
+    track = normalize_text(track)
+    if not track:
+        return set()
+    artists = [normalize_text(name) for name in (artist or "").split(",")]
+    return {(name, track) for name in artists if name}
+
+
+class DestinationIndex(object):
+    """
+    In-memory set of what the destination playlist already contains, loaded
+    once before a transfer: the Spotify track IDs or YouTube videoIds, plus
+    normalized artist/track keys. A source track whose key is present skips
+    the search; a match whose ID is present skips the write.
+    """
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self.ids: Set[str] = {item_id for item_id in ids if item_id}
+        self.songs: Set[Tuple[str, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(
+        self,
+        item_id: Optional[str] = None,
+        artist: Optional[str] = None,
+        track: Optional[str] = None,
+    ) -> None:
+        if item_id:
+            self.ids.add(item_id)
+        self.songs.update(_song_keys(artist, track))
+
+    def contains_id(self, item_id: Optional[str]) -> bool:
+        return bool(item_id) and item_id in self.ids
+
+    def contains_song(self, artist: Optional[str], track: Optional[str]) -> bool:
+        return not self.songs.isdisjoint(_song_keys(artist, track))
+
+    @classmethod
+    def from_spotify_playlist(cls, spotify_client, playlist_id: str):
+        """Load a Spotify playlist with the user's token (it may be private)."""
+        index = cls()
+        for page in spotify_client.iter_track_pages(
+            playlist_id, include_ids=True, use_app_token=False
+        ):
+            for track in page:
+                index.add(track.get("id"), track["artist"], track["track"])
+        logger.info(f"Destination playlist already has {len(index)} tracks")
+        return index
+
+    @classmethod
+    def from_youtube_playlist(cls, youtube_client, playlist_id: str):
+        """Load a YouTube playlist, 50 items per playlistItems.list call."""
+        index = cls()
+        for page in youtube_client.iter_playlist_pages(playlist_id):
+            index.ids.update(page.video_ids)
+            for song in page.songs:
+                index.add(None, song.artist, song.track)
+        logger.info(f"Destination playlist already has {len(index)} videos")
+        return index
@@ -0,0 +1,109 @@
+import os
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+from dotenv import load_dotenv
+
+from task_events import publish_task_event
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# A progress write needs at least this many seconds since the previous one...
+TASK_PROGRESS_INTERVAL = float(os.getenv("TASK_PROGRESS_INTERVAL", "1"))
+# ...and at least this many percentage points of progress since it.
+TASK_PROGRESS_MIN_DELTA = float(os.getenv("TASK_PROGRESS_MIN_DELTA", "1"))
+
+
+def progress_meta(current: int, total: int, status: str) -> Dict[str, Any]:
+    return {
+        "current": current,
+        "total": total,
+        "progress": current / total * 100 if total else 0,
+        "status": status,
+    }
+
+
+def report_progress(task, current, total, status, task_id=None) -> None:
+    """Write one PROGRESS state to the result backend and publish it."""
+    meta = progress_meta(current, total, status)
+    task.update_state(task_id=task_id, state="PROGRESS", meta=meta)
+    publish_task_event(
+        task_id or task.request.id, "progress", dict(meta, state="PROGRESS")
+    )
+
+
+class ProgressReporter(object):
+    """
+    Coalesces a task's progress updates so each transfer makes a bounded
+    number of result-backend writes, however many tracks it has.
+
+    An update is written when it starts a new phase, completes the current
+    one (current >= total) or is forced; otherwise only once at least
+    `min_interval` seconds and `min_delta` percentage points have passed
+    since the last write. That caps a phase at about 100 / min_delta
+    writes. A held-back update is kept and written by flush().
+    """
+
+    def __init__(
+        self,
+        task,
+        task_id: Optional[str] = None,
+        min_interval: float = TASK_PROGRESS_INTERVAL,
+        min_delta: float = TASK_PROGRESS_MIN_DELTA,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.task = task
+        self.task_id = task_id
+        self.min_interval = min_interval
+        self.min_delta = min_delta
+        self.clock = clock
+        self.writes = 0
+
+        self._phase = None
+        self._written_at = None
+        self._written_progress = None
+        self._pending = None
+
+    def update(
+        self,
+        current: int,
+        total: int,
+        status: str,
+        phase: Optional[str] = None,
+        force: bool = False,
+    ) -> bool:
+        """Report progress; returns True when it was written."""
+        progress = progress_meta(current, total, status)["progress"]
+        self._pending = (current, total, status, progress)
+        new_phase = phase is not None and phase != self._phase
+        if phase is not None:
+            self._phase = phase
+
+        if not (
+            force
+            or new_phase
+            or self._written_at is None
+            or (total and current >= total)
+            or (
+                self.clock() - self._written_at >= self.min_interval
+                and progress - self._written_progress >= self.min_delta
+            )
+        ):
+            return False
+        self._write()
+        return True
+
+    def flush(self) -> None:
+        """Write the last held-back update, if any."""
+        if self._pending is not None:
+            self._write()
+
+    def _write(self) -> None:
+        current, total, status, progress = self._pending
+        report_progress(self.task, current, total, status, task_id=self.task_id)
+        self._pending = None
+        self._written_at = self.clock()
+        self._written_progress = progress
+        self.writes += 1
@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import logging
+import redis
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+
+from config.redis_client import get_redis
+from transfer_results import summarize_result
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# A comment line is sent this often so proxies keep idle streams open.
+SSE_HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))
+# Streams are closed after this long; EventSource reconnects on its own and
+# gets a fresh status snapshot, so no web worker thread is held forever.
+SSE_MAX_DURATION = float(os.getenv("SSE_MAX_DURATION", "300"))
+SSE_RETRY_MS = 3000
+
+# Events after which a task publishes nothing more.
+TERMINAL_EVENTS = ("done", "failed")
+
+
+def task_channel(task_id: str) -> str:
+    return f"playlifts:task-events:{task_id}"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def publish_task_event(
+    task_id: Optional[str],
+    event: str,
+    data: Dict[str, Any],
+    redis_client: Optional[redis.Redis] = None,
+) -> None:
+    """
+    Publish one event for `task_id`. Publishing never fails a task: without
+    a listener or without Redis the event is simply dropped, and clients can
+    still fall back to /tasks/status.
+    """
+    if not task_id:
+        return
+    try:
+        (redis_client or get_redis()).publish(
+            task_channel(task_id), _dumps({"event": event, "data": data})
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Could not publish {event} event for task {task_id}: {e}")
+
+
+class TaskEvents:
+    """
+    Publishes the events of one transfer task. Every payload has the same
+    shape as the matching /tasks/status response, plus "tracks" events with
+    the per-track outcomes written since the previous one.
+    """
+
+    def __init__(
+        self, task_id: Optional[str], redis_client: Optional[redis.Redis] = None
+    ):
+        self.task_id = task_id
+        self._redis = redis_client
+        self._sent = {"success": 0, "failed": 0, "skipped": 0}
+
+    def _publish(self, event: str, data: Dict[str, Any]) -> None:
+        publish_task_event(self.task_id, event, data, self._redis)
+
+    def tracks(
+        self,
+        successful: List[Any],
+        failed: List[Any],
+        skipped: Optional[List[Any]] = None,
+    ) -> None:
+        """Publish the entries added to the result lists since the last call."""
+        tracks = []
+        for status, entries in (
+            ("success", successful),
+            ("failed", failed),
+            ("skipped", skipped or []),
+        ):
+            tracks.extend(
+                {"status": status, "track": entry}
+                for entry in entries[self._sent[status] :]
+            )
+            self._sent[status] = len(entries)
+        if tracks:
+            self._publish("tracks", {"tracks": tracks})
+
+    def done(self, result: Dict[str, Any]) -> None:
+        self._publish(
+            "done",
+            {"state": "SUCCESS", "result": summarize_result(result), "progress": 100},
+        )
+
+    def failed(self, error: Exception) -> None:
+        self._publish(
+            "failed",
+            {
+                "state": "FAILURE",
+                "error": str(error),
+                "error_type": type(error).__name__,
+                "progress": 0,
+            },
+        )
+
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {_dumps(data)}\n\n"
+
+
+def stream_task_events(
+    task_id: str,
+    snapshot: Callable[[], Dict[str, Any]],
+    redis_client: Optional[redis.Redis] = None,
+    heartbeat: float = SSE_HEARTBEAT_INTERVAL,
+    max_duration: float = SSE_MAX_DURATION,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[str]:
+    """
+    Yield Server-Sent Events for one task. We subscribe before taking the
+    status snapshot so nothing published in between is missed; the snapshot
+    is sent first as a "status" event and ends the stream if the task has
+    already finished. Published events follow as they arrive until a
+    terminal event, with a heartbeat comment whenever the task is quiet.
+    """
+    pubsub = (redis_client or get_redis()).pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(task_channel(task_id))
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+
+        status = snapshot()
+        yield format_sse("status", status)
+        if status.get("state") in ("SUCCESS", "FAILURE"):
+            return
+
+        deadline = clock() + max_duration
+        while clock() < deadline:
+            message = pubsub.get_message(timeout=heartbeat)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            payload = json.loads(message["data"])
+            yield format_sse(payload["event"], payload["data"])
+            if payload["event"] in TERMINAL_EVENTS:
+                return
+    finally:
+        pubsub.close()
@@ -1,112 +1,581 @@
 import os
-import time
 import logging
+import itertools
+import threading
+import redis
 
 from dotenv import load_dotenv
-from celery import current_task
+from celery import chord, current_task
 from config.celery_config import celery
 from celery.exceptions import Ignore
 
-from clients.youtube_client import YouTubeClient
-from clients.spotify_client import SpotifyClient
-from google.oauth2.credentials import Credentials
+from clients.youtube_client import YouTubeClient, Song
+from clients.youtube_auth import youtube_credentials
+from clients.spotify_client import (
+    SpotifyClient,
+    PLAYLIST_ADD_BATCH_SIZE,
+    LIBRARY_SAVE_BATCH_SIZE,
+)
+from clients.search_cache import SpotifyMatchCache, YouTubeSearchCache
+from clients.playlist_cache import SpotifyPlaylistCache
+from config.redis_client import get_redis
+from transfer_pipeline import PipelineItem, TransferPipeline
+from transfer_checkpoint import TransferCheckpoint
+from destination_index import DestinationIndex
+from task_events import TaskEvents
+from transfer_results import build_result
+from progress_reporter import (
+    TASK_PROGRESS_MIN_DELTA,
+    ProgressReporter,
+    report_progress,
+)
 
 load_dotenv(override=True)
 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 
+# Playlists with at least this many tracks are matched by chunk subtasks
+# spread across workers; 0 disables fan-out.
+TRANSFER_FANOUT_THRESHOLD = int(os.getenv("TRANSFER_FANOUT_THRESHOLD", "500"))
+TRANSFER_FANOUT_CHUNK_SIZE = int(os.getenv("TRANSFER_FANOUT_CHUNK_SIZE", "200"))
+# Lifetime of the shared "tracks matched" counter, same as result_expires.
+FANOUT_COUNTER_TTL = 3600
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@celery.task(bind=True)
-def transfer_playlist_task(self, access_token, playlist_id, target_playlist_id):
+class TransferTask(celery.Task):
+    """
+    Base of the tasks that produce a transfer result. "done" is published
+    from on_success, which Celery calls only after storing SUCCESS, so a
+    client fetching /tasks/<id>/results on "done" always finds the result.
+    """
+
+    def on_success(self, retval, task_id, args, kwargs):
+        TaskEvents(task_id).done(retval)
+
+
+def _normalize_song(song):
+    """Normalization stage for YouTube -> Spotify: tidy the parsed title parts."""
+    artist, track = (song.artist or "").strip(), (song.track or "").strip()
+    if not artist or not track:
+        raise Exception("Could not read artist and track from video title")
+    return Song(artist, track)
+
+
+def _youtube_query(track):
+    """Normalization stage for Spotify -> YouTube: build the search query."""
+    return f"{track['artist']} - {track['track']}"
+
+
+def _flush_spotify_writes(
+    spotify_client, pending, target_playlist_id, successful, failed, saved_ids=None
+):
+    """
+    Write a batch of (source song, Spotify match) pairs and record the outcome
+    of each one, keeping the source order.
+    saved_ids: for Liked Songs, a dict of track ID -> outcome shared across
+    batches so a track that appears several times is only saved once.
+    """
+    if not pending:
+        return
+
+    matches = [spotify_song_data for _, spotify_song_data in pending]
+    if target_playlist_id:
+        results = spotify_client.add_songs_to_playlist(matches, target_playlist_id)
+    else:
+        if saved_ids is None:
+            saved_ids = {}
+        unsaved = [m for m in matches if m.get("id") not in saved_ids]
+        if unsaved:
+            for match, success in zip(
+                unsaved, spotify_client.save_songs_to_library(unsaved)
+            ):
+                saved_ids[match.get("id")] = success
+        results = [saved_ids.get(match.get("id"), False) for match in matches]
+
+    for (song, spotify_song_data), success in zip(pending, results):
+        if success:
+            successful.append(
+                {
+                    "artist": spotify_song_data["artist"],
+                    "track": spotify_song_data["name"],
+                    "artwork_url": spotify_song_data.get("artwork_url"),
+                }
+            )
+        else:
+            failed.append(
+                {
+                    "artist": song.artist,
+                    "track": song.track,
+                    "reason": "Failed to add to Spotify",
+                }
+            )
+
+
+def _write_spotify_batch(
+    spotify_client,
+    batch,
+    target_playlist_id,
+    successful,
+    failed,
+    saved_ids,
+    skipped=None,
+    destination=None,
+):
+    """
+    Write a batch of matched PipelineItems whose sources are Songs. Songs
+    the destination already contains (a None match from the key check, or a
+    matched ID already in the playlist) go to `skipped` instead.
+    """
+    pending = []
+    for item in batch:
+        song = item.source
+        if item.error is not None:
+            failed.append(
+                {
+                    "artist": song.artist,
+                    "track": song.track,
+                    "reason": str(item.error),
+                }
+            )
+        elif destination is not None and (
+            item.match is None or destination.contains_id(item.match.get("id"))
+        ):
+            skipped.append({"artist": song.artist, "track": song.track})
+        else:
+            pending.append((song, item.match))
+
+    _flush_spotify_writes(
+        spotify_client, pending, target_playlist_id, successful, failed, saved_ids
+    )
+
+
+def _write_youtube_item(
+    youtube_client,
+    youtube_playlist_id,
+    item,
+    successful,
+    failed,
+    skipped=None,
+    destination=None,
+):
+    """
+    Insert one matched PipelineItem whose source is a Spotify track dict,
+    unless the destination already contains it.
+    """
+    track = item.source
+    query = item.normalized
+    try:
+        if item.error is not None:
+            raise item.error
+
+        if destination is not None and (
+            item.match is None
+            or (item.match and destination.contains_id(item.match[0]["videoId"]))
+        ):
+            skipped.append(track)
+            logger.info(f"Already in playlist: {_youtube_query(track)}")
+        elif item.match:
+            video_id = item.match[0]["videoId"]
+            youtube_client.add_video_to_playlist(youtube_playlist_id, video_id)
+            successful.append(track)
+            logger.info(f"Successfully added: {query}")
+        else:
+            failed.append({"track": track, "reason": "No YouTube video found"})
+            logger.warning(f"No YouTube video found for: {query}")
+
+    except Exception as e:
+        error_msg = str(e)
+        failed.append({"track": track, "reason": error_msg})
+        logger.error(
+            f"Error processing track {track.get('track', 'Unknown')} by {track.get('artist', 'Unknown')}: {error_msg}"
+        )
+
+
+def _should_fan_out(total):
+    return TRANSFER_FANOUT_THRESHOLD > 0 and total >= TRANSFER_FANOUT_THRESHOLD
+
+
+def _chunks(items, size=None):
+    size = size or TRANSFER_FANOUT_CHUNK_SIZE
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _fanout_counter_key(parent_id):
+    return f"playlifts:fanout:{parent_id}:matched"
+
+
+def _match_chunk(chunk, normalize, match):
+    """
+    Match one fan-out chunk through the pipeline and return JSON-serializable
+    results in chunk order: {"source", "match", "error"}.
+    """
+    results = []
+
+    def collect(batch):
+        for item in batch:
+            results.append(
+                {
+                    "source": item.source,
+                    "match": item.match,
+                    "error": str(item.error) if item.error is not None else None,
+                }
+            )
+
+    TransferPipeline(
+        [chunk],
+        normalize=normalize,
+        match=match,
+        write=collect,
+        batch_size=len(chunk),
+    ).run()
+    return results
+
+
+def _chunk_items(chunk_results, to_source=lambda source: source):
+    """Flatten chord results back into PipelineItems in playlist order."""
+    items = []
+    for index, result in enumerate(itertools.chain.from_iterable(chunk_results)):
+        item = PipelineItem(index, to_source(result["source"]))
+        item.match = result.get("match")
+        if result.get("error") is not None:
+            item.error = Exception(result["error"])
+        items.append(item)
+    return items
+
+
+def _report_chunk_matched(task, parent_id, count, total):
+    """Add a finished chunk to the parent's shared counter and report it."""
+    try:
+        client = get_redis()
+        key = _fanout_counter_key(parent_id)
+        matched = client.incrby(key, count)
+        client.expire(key, FANOUT_COUNTER_TTL)
+    except redis.RedisError as e:
+        logger.warning(f"Could not update fan-out progress: {e}")
+        return
+
+    # Chunks finish on different workers, so instead of a shared reporter
+    # only the chunk that crosses the next TASK_PROGRESS_MIN_DELTA step
+    # (or finishes matching) writes the parent's progress.
+    matched = min(matched, total)
+    step = total * TASK_PROGRESS_MIN_DELTA / 100
+    if matched < total and step and (matched - count) // step == matched // step:
+        return
+    report_progress(
+        task, matched, total, f"Matched {matched}/{total} songs", task_id=parent_id
+    )
+
+
+def _load_checkpoint(task):
+    """
+    Return the task's checkpoint, holding a previous attempt's progress when
+    the task was redelivered. Disabled when the task runs without an id.
+    """
+    checkpoint = TransferCheckpoint(task.request.id)
+    if task.request.id:
+        checkpoint.load()
+    else:
+        checkpoint.enabled = False
+    return checkpoint
+
+
+def _invalidate_spotify_playlists(access_token, target_playlist_id):
+    """Track counts in the user's cached playlist listing are now stale."""
+    if target_playlist_id:
+        SpotifyPlaylistCache().invalidate(access_token)
+
+
+def _clear_chunk_counter(parent_id):
+    try:
+        get_redis().delete(_fanout_counter_key(parent_id))
+    except redis.RedisError as e:
+        logger.warning(f"Could not clear fan-out progress: {e}")
+
+
+@celery.task(bind=True, base=TransferTask)
+def transfer_playlist_task(
+    self, access_token, playlist_id, target_playlist_id, spotify_token_key=None
+):
     """
     YouTube -> Spotify transfer.
     access_token: Spotify *user* token (must have modify scopes).
     playlist_id: YouTube playlist ID (source).
     target_playlist_id: Spotify playlist ID (dest) OR None -> save to Liked Songs.
+    spotify_token_key: key of the user's server-side tokens (save_user_tokens),
+        used to refresh access_token when it expires mid-transfer.
     """
     try:
         youtube_client = YouTubeClient(api_key=YOUTUBE_API_KEY)
-        spotify_client = SpotifyClient(api_token=access_token)
-
-        songs = youtube_client.get_videos_from_playlist(playlist_id)
-        total_songs = len(songs)
-
-        successful_transfers = []
-        failed_transfers = []
-
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": total_songs,
-                "progress": 0,
-                "status": f"Starting transfer of {total_songs} songs...",
-            },
-        )
-
-        for i, song in enumerate(songs):
-            try:
-                if i > 0 and i % 10 == 0:
-                    time.sleep(1)  # basic rate pacing
-
-                spotify_song_data = spotify_client.search_song(song.artist, song.track)
-                if target_playlist_id:
-                    success = spotify_client.add_song_to_playlist(
-                        spotify_song_data, target_playlist_id
-                    )
-                else:
-                    success = spotify_client.add_song_to_spotify(spotify_song_data)
-
-                if success:
-                    successful_transfers.append(
-                        {
-                            "artist": spotify_song_data["artist"],
-                            "track": spotify_song_data["name"],
-                            "artwork_url": spotify_song_data.get("artwork_url"),
-                        }
-                    )
-                else:
-                    failed_transfers.append(
-                        {
-                            "artist": song.artist,
-                            "track": song.track,
-                            "reason": "Failed to add to Spotify",
-                        }
-                    )
-            except Exception as e:
-                failed_transfers.append(
-                    {"artist": song.artist, "track": song.track, "reason": str(e)}
-                )
+        match_cache = SpotifyMatchCache()
+        spotify_client = SpotifyClient(
+            api_token=access_token,
+            match_cache=match_cache,
+            user_token_key=spotify_token_key,
+        )
+
+        reporter = ProgressReporter(self)
+        reporter.update(0, 0, "Fetching YouTube playlist...", phase="fetching")
+
+        # Liked Songs saves are idempotent, so only playlists are checked.
+        destination = (
+            DestinationIndex.from_spotify_playlist(spotify_client, target_playlist_id)
+            if target_playlist_id
+            else None
+        )
+
+        page_iter = iter(youtube_client.iter_playlist_pages(playlist_id))
+        first_page = next(page_iter, None)
+        source_pages = (
+            itertools.chain([first_page], page_iter) if first_page is not None else []
+        )
 
-            if i % 2 == 0 or i == total_songs - 1:
-                progress = (i + 1) / total_songs * 100 if total_songs else 100
-                self.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": i + 1,
-                        "total": total_songs,
-                        "progress": progress,
-                        "status": f"Processed {i + 1}/{total_songs} songs",
-                    },
+        if first_page is not None and _should_fan_out(first_page.total):
+            songs = [
+                {"artist": song.artist, "track": song.track}
+                for page in source_pages
+                for song in page.songs
+            ]
+            present = []
+            if destination is not None:
+                present = [
+                    song
+                    for song in songs
+                    if destination.contains_song(song["artist"], song["track"])
+                ]
+                songs = [
+                    song
+                    for song in songs
+                    if not destination.contains_song(song["artist"], song["track"])
+                ]
+            logger.info(
+                f"Fanning out {len(songs)} songs in chunks of {TRANSFER_FANOUT_CHUNK_SIZE}"
+            )
+            return self.replace(
+                chord(
+                    [
+                        match_spotify_chunk_task.s(
+                            access_token,
+                            chunk,
+                            self.request.id,
+                            len(songs),
+                            spotify_token_key=spotify_token_key,
+                        )
+                        for chunk in _chunks(songs)
+                    ],
+                    write_spotify_chunks_task.s(
+                        access_token,
+                        target_playlist_id,
+                        present,
+                        sorted(destination.ids) if destination is not None else None,
+                        spotify_token_key=spotify_token_key,
+                    ),
                 )
+            )
+
+        checkpoint = _load_checkpoint(self)
+        successful_transfers = checkpoint.successful
+        failed_transfers = checkpoint.failed
+        skipped_transfers = checkpoint.skipped
+        saved_ids = checkpoint.saved_ids
+        progress = {"total": 0, "processed": checkpoint.cursor, "fetched": 0}
+        # pages() runs on the pipeline's source thread, write() on this one.
+        progress_lock = threading.Lock()
+        events = TaskEvents(self.request.id)
+
+        def pages():
+            for page in source_pages:
+                with progress_lock:
+                    progress["fetched"] += page.item_count
+                    progress["total"] = max(page.total, progress["fetched"])
+                    # Videos whose titles could not be parsed count as processed.
+                    progress["processed"] += page.item_count - len(page.songs)
+                yield page.songs
+
+        def match(song):
+            if destination is not None and destination.contains_song(
+                song.artist, song.track
+            ):
+                return None
+            return spotify_client.search_song(song.artist, song.track)
+
+        def write(batch):
+            _write_spotify_batch(
+                spotify_client,
+                batch,
+                target_playlist_id,
+                successful_transfers,
+                failed_transfers,
+                saved_ids,
+                skipped_transfers,
+                destination,
+            )
+            checkpoint.commit(
+                batch[-1].index + 1,
+                successful_transfers,
+                failed_transfers,
+                saved_ids,
+                skipped_transfers,
+            )
+            events.tracks(successful_transfers, failed_transfers, skipped_transfers)
+
+            with progress_lock:
+                progress["processed"] += len(batch)
+                total = progress["total"]
+                current = min(progress["processed"], total)
+            reporter.update(
+                current,
+                total,
+                f"Processed {current}/{total} songs",
+                phase="transferring",
+            )
+
+        TransferPipeline(
+            pages(),
+            normalize=_normalize_song,
+            match=match,
+            write=write,
+            batch_size=(
+                PLAYLIST_ADD_BATCH_SIZE
+                if target_playlist_id
+                else LIBRARY_SAVE_BATCH_SIZE
+            ),
+            start=checkpoint.cursor,
+            checkpoint=checkpoint,
+        ).run()
+        reporter.flush()
+        checkpoint.clear()
+        _invalidate_spotify_playlists(access_token, target_playlist_id)
+
+        cache_stats = match_cache.flush_stats()
+        logger.info(
+            f"Spotify match cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+        )
 
-        return {
-            "success": {
-                "count": len(successful_transfers),
-                "songs": successful_transfers,
-            },
-            "failed": {"count": len(failed_transfers), "songs": failed_transfers},
-        }
+        return build_result(successful_transfers, failed_transfers, skipped_transfers)
 
+    except Ignore:
+        raise
     except Exception as e:
         logger.error(f"Task failed with error: {str(e)}", exc_info=True)
+        TaskEvents(self.request.id).failed(e)
         raise
 
 
 @celery.task(bind=True)
+def match_spotify_chunk_task(
+    self, access_token, songs, parent_id, total, spotify_token_key=None
+):
+    """
+    Fan-out chunk of a YouTube -> Spotify transfer: search Spotify for each
+    {"artist", "track"} in `songs` and return the matches in order.
+    """
+    try:
+        match_cache = SpotifyMatchCache()
+        spotify_client = SpotifyClient(
+            api_token=access_token,
+            match_cache=match_cache,
+            user_token_key=spotify_token_key,
+        )
+
+        results = _match_chunk(
+            songs,
+            normalize=lambda song: _normalize_song(Song(song["artist"], song["track"])),
+            match=lambda song: spotify_client.search_song(song.artist, song.track),
+        )
+
+        match_cache.flush_stats()
+        _report_chunk_matched(self, parent_id, len(songs), total)
+        return results
+
+    except Exception as e:
+        logger.error(f"Chunk failed with error: {str(e)}", exc_info=True)
+        TaskEvents(parent_id).failed(e)
+        raise
+
+
+@celery.task(bind=True, base=TransferTask)
+def write_spotify_chunks_task(
+    self,
+    chunk_results,
+    access_token,
+    target_playlist_id,
+    already_present=None,
+    destination_ids=None,
+    spotify_token_key=None,
+):
+    """
+    Chord body of a fanned-out YouTube -> Spotify transfer. It runs under
+    the original task id, writes every chunk's matches in playlist order and
+    returns the same result as transfer_playlist_task.
+    already_present: songs the parent found in the destination by name.
+    destination_ids: track IDs already in the destination playlist.
+    """
+    try:
+        spotify_client = SpotifyClient(
+            api_token=access_token, user_token_key=spotify_token_key
+        )
+        items = _chunk_items(
+            chunk_results, lambda song: Song(song["artist"], song["track"])
+        )
+        total = len(items)
+        batch_size = (
+            PLAYLIST_ADD_BATCH_SIZE if target_playlist_id else LIBRARY_SAVE_BATCH_SIZE
+        )
+
+        checkpoint = _load_checkpoint(self)
+        successful_transfers = checkpoint.successful
+        failed_transfers = checkpoint.failed
+        skipped_transfers = checkpoint.skipped
+        saved_ids = checkpoint.saved_ids
+        events = TaskEvents(self.request.id)
+        reporter = ProgressReporter(self)
+        destination = (
+            DestinationIndex(destination_ids) if destination_ids is not None else None
+        )
+        for start in range(checkpoint.cursor, total, batch_size):
+            _write_spotify_batch(
+                spotify_client,
+                items[start : start + batch_size],
+                target_playlist_id,
+                successful_transfers,
+                failed_transfers,
+                saved_ids,
+                skipped_transfers,
+                destination,
+            )
+            current = min(start + batch_size, total)
+            checkpoint.commit(
+                current,
+                successful_transfers,
+                failed_transfers,
+                saved_ids,
+                skipped_transfers,
+            )
+            events.tracks(successful_transfers, failed_transfers, skipped_transfers)
+            reporter.update(
+                current, total, f"Processed {current}/{total} songs", phase="writing"
+            )
+
+        checkpoint.clear()
+        _clear_chunk_counter(self.request.id)
+        _invalidate_spotify_playlists(access_token, target_playlist_id)
+
+        return build_result(
+            successful_transfers,
+            failed_transfers,
+            (already_present or []) + skipped_transfers,
+        )
+
+    except Exception as e:
+        logger.error(f"Task failed with error: {str(e)}", exc_info=True)
+        TaskEvents(self.request.id).failed(e)
+        raise
+
+
+@celery.task(bind=True, base=TransferTask)
 def transfer_spotify_to_youtube_task(
     self,
     _unused_access_token,
@@ -130,92 +599,223 @@ def transfer_spotify_to_youtube_task(
         if not spotify_client.get_app_token():
             raise Exception("Failed to get Spotify app token")
 
-        credentials = Credentials(
-            token=youtube_token_data["token"],
-            refresh_token=youtube_token_data.get("refresh_token"),
-            token_uri=youtube_token_data["token_uri"],
-            client_id=youtube_token_data["client_id"],
-            client_secret=youtube_token_data["client_secret"],
-            scopes=youtube_token_data["scopes"],
-        )
-        youtube_client = YouTubeClient(credentials=credentials)
-
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": 0,
-                "progress": 0,
-                "status": "Fetching Spotify playlist...",
-            },
-        )
-
-        tracks = spotify_client.get_tracks_from_playlist(spotify_playlist_id)
-        total_tracks = len(tracks)
-
-        logger.info(f"Found {total_tracks} tracks in Spotify playlist")
-
-        successful = []
-        failed = []
-
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": total_tracks,
-                "progress": 0,
-                "status": "Starting transfer...",
-            },
-        )
-
-        for i, track in enumerate(tracks):
-            try:
-                query = f"{track['artist']} - {track['track']}"
-                logger.info(f"Searching YouTube for: {query}")
-
-                search_results = youtube_client.search_videos(query, max_results=1)
-                if search_results:
-                    video_id = search_results[0]["videoId"]
-                    youtube_client.add_video_to_playlist(youtube_playlist_id, video_id)
-                    successful.append(track)
-                    logger.info(f"Successfully added: {query}")
-                else:
-                    failed.append({"track": track, "reason": "No YouTube video found"})
-                    logger.warning(f"No YouTube video found for: {query}")
-
-                if i % 5 == 0:
-                    time.sleep(1)
-
-            except Exception as e:
-                error_msg = str(e)
-                failed.append({"track": track, "reason": error_msg})
-                logger.error(
-                    f"Error processing track {track.get('track', 'Unknown')} by {track.get('artist', 'Unknown')}: {error_msg}"
+        search_cache = YouTubeSearchCache()
+        youtube_client = YouTubeClient(
+            credentials=youtube_credentials(youtube_token_data),
+            search_cache=search_cache,
+        )
+
+        reporter = ProgressReporter(self)
+        reporter.update(0, 0, "Fetching Spotify playlist...", phase="fetching")
+
+        progress = {"total": 0, "processed": 0}
+
+        def on_total(total):
+            progress["total"] = total
+            logger.info(f"Found {total} tracks in Spotify playlist")
+            reporter.update(0, total, "Starting transfer...", phase="transferring")
+
+        destination = DestinationIndex.from_youtube_playlist(
+            youtube_client, youtube_playlist_id
+        )
+
+        def search_track(query):
+            logger.info(f"Searching YouTube for: {query}")
+            return youtube_client.search_videos(query, max_results=1)
+
+        track_pages = spotify_client.iter_track_pages(
+            spotify_playlist_id, on_total=on_total
+        )
+        first_page = next(track_pages, None)
+        source_pages = (
+            itertools.chain([first_page], track_pages) if first_page is not None else []
+        )
+
+        if first_page is not None and _should_fan_out(progress["total"]):
+            tracks = list(itertools.chain.from_iterable(source_pages))
+            present = [
+                track
+                for track in tracks
+                if destination.contains_song(track["artist"], track["track"])
+            ]
+            tracks = [
+                track
+                for track in tracks
+                if not destination.contains_song(track["artist"], track["track"])
+            ]
+            logger.info(
+                f"Fanning out {len(tracks)} tracks in chunks of {TRANSFER_FANOUT_CHUNK_SIZE}"
+            )
+            return self.replace(
+                chord(
+                    [
+                        match_youtube_chunk_task.s(
+                            chunk, youtube_token_data, self.request.id, len(tracks)
+                        )
+                        for chunk in _chunks(tracks)
+                    ],
+                    write_youtube_chunks_task.s(
+                        youtube_playlist_id,
+                        youtube_token_data,
+                        present,
+                        sorted(destination.ids),
+                    ),
                 )
+            )
+
+        checkpoint = _load_checkpoint(self)
+        successful = checkpoint.successful
+        failed = checkpoint.failed
+        skipped = checkpoint.skipped
+        progress["processed"] = checkpoint.cursor
+        events = TaskEvents(self.request.id)
+
+        def normalize(track):
+            # None marks a track the destination already has: no search.
+            if destination.contains_song(track["artist"], track["track"]):
+                return None
+            return _youtube_query(track)
+
+        def match(query):
+            return None if query is None else search_track(query)
+
+        def write(batch):
+            for item in batch:
+                _write_youtube_item(
+                    youtube_client,
+                    youtube_playlist_id,
+                    item,
+                    successful,
+                    failed,
+                    skipped,
+                    destination,
+                )
+                checkpoint.commit(item.index + 1, successful, failed, skipped=skipped)
+                events.tracks(successful, failed, skipped)
 
-            if i % 2 == 0 or i == total_tracks - 1:
-                progress = (i + 1) / total_tracks * 100 if total_tracks else 100
-                self.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": i + 1,
-                        "total": total_tracks,
-                        "progress": progress,
-                        "status": f"Processed {i + 1}/{total_tracks} tracks",
-                    },
+                progress["processed"] += 1
+                i = progress["processed"]
+                reporter.update(
+                    i, progress["total"], f"Processed {i}/{progress['total']} tracks"
                 )
 
-        result = {
-            "success": {"count": len(successful), "tracks": successful},
-            "failed": {"count": len(failed), "tracks": failed},
-        }
+        TransferPipeline(
+            source_pages,
+            normalize=normalize,
+            match=match,
+            write=write,
+            start=checkpoint.cursor,
+            checkpoint=checkpoint,
+        ).run()
+        reporter.flush()
+        checkpoint.clear()
+
+        cache_stats = search_cache.flush_stats()
+        logger.info(
+            f"YouTube search cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+        )
+
+        result = build_result(successful, failed, skipped)
 
         logger.info(
             f"Transfer completed: {len(successful)} successful, {len(failed)} failed"
         )
         return result
 
+    except Ignore:
+        raise
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Task failed with error: {error_msg}", exc_info=True)
+        TaskEvents(self.request.id).failed(e)
+        raise
+
+
+@celery.task(bind=True)
+def match_youtube_chunk_task(self, tracks, youtube_token_data, parent_id, total):
+    """
+    Fan-out chunk of a Spotify -> YouTube transfer: search YouTube for each
+    track in `tracks` and return the results in order.
+    """
+    try:
+        search_cache = YouTubeSearchCache()
+        youtube_client = YouTubeClient(
+            credentials=youtube_credentials(youtube_token_data),
+            search_cache=search_cache,
+        )
+
+        results = _match_chunk(
+            tracks,
+            normalize=_youtube_query,
+            match=lambda query: youtube_client.search_videos(query, max_results=1),
+        )
+
+        search_cache.flush_stats()
+        _report_chunk_matched(self, parent_id, len(tracks), total)
+        return results
+
+    except Exception as e:
+        logger.error(f"Chunk failed with error: {str(e)}", exc_info=True)
+        TaskEvents(parent_id).failed(e)
+        raise
+
+
+@celery.task(bind=True, base=TransferTask)
+def write_youtube_chunks_task(
+    self,
+    chunk_results,
+    youtube_playlist_id,
+    youtube_token_data,
+    already_present=None,
+    destination_ids=None,
+):
+    """
+    Chord body of a fanned-out Spotify -> YouTube transfer. It runs under
+    the original task id, inserts every chunk's videos in playlist order and
+    returns the same result as transfer_spotify_to_youtube_task.
+    already_present: tracks the parent found in the destination by name.
+    destination_ids: videoIds already in the destination playlist.
+    """
+    try:
+        youtube_client = YouTubeClient(
+            credentials=youtube_credentials(youtube_token_data)
+        )
+        items = _chunk_items(chunk_results)
+        total = len(items)
+
+        checkpoint = _load_checkpoint(self)
+        successful = checkpoint.successful
+        failed = checkpoint.failed
+        skipped = checkpoint.skipped
+        events = TaskEvents(self.request.id)
+        reporter = ProgressReporter(self)
+        destination = (
+            DestinationIndex(destination_ids) if destination_ids is not None else None
+        )
+        for i, item in enumerate(items[checkpoint.cursor :], checkpoint.cursor + 1):
+            item.normalized = _youtube_query(item.source)
+            _write_youtube_item(
+                youtube_client,
+                youtube_playlist_id,
+                item,
+                successful,
+                failed,
+                skipped,
+                destination,
+            )
+            checkpoint.commit(i, successful, failed, skipped=skipped)
+            events.tracks(successful, failed, skipped)
+            reporter.update(i, total, f"Processed {i}/{total} tracks", phase="writing")
+
+        checkpoint.clear()
+        _clear_chunk_counter(self.request.id)
+
+        logger.info(
+            f"Transfer completed: {len(successful)} successful, {len(failed)} failed"
+        )
+        return build_result(successful, failed, (already_present or []) + skipped)
+
+    except Exception as e:
+        logger.error(f"Task failed with error: {str(e)}", exc_info=True)
+        TaskEvents(self.request.id).failed(e)
         raise
@@ -9,10 +9,24 @@ The tests are organized by component and cover:
 
 - Flask app routes and endpoints (test_app.py)
 - Celery tasks and asynchronous processing (test_tasks.py)
+- Streaming transfer pipeline stages (test_transfer_pipeline.py)
+- Resumable transfer checkpoints (test_transfer_checkpoint.py)
+- Destination playlist duplicate checks (test_destination_index.py)
+- Task status and paginated results endpoints (test_task_status.py)
+- Compact transfer results (test_transfer_results.py)
+- Task progress events and the SSE stream (test_task_events.py)
+- Coalesced task progress reporting (test_progress_reporter.py)
 - Database models and operations (test_models.py)
 - Configuration and environment setup (test_config.py)
 - Spotify API client functionality (test_spotify_client.py)
 - YouTube API client functionality (test_youtube_client.py)
+- Shared per-host rate limiting (test_rate_limiter.py)
+- Redis-backed search caches (test_search_cache.py)
+- Cached Spotify and YouTube playlist listings (test_playlist_cache.py)
+- Shared access tokens with single-flight refresh (test_token_store.py)
+- Redis-backed server-side sessions (test_redis_session.py)
+- Shared YouTube OAuth credentials (test_youtube_auth.py)
+- YouTube title normalization and its labelled corpus (test_title_parser.py)
 
 Test Categories:
 - Unit tests: Test individual components in isolation
@@ -2,6 +2,218 @@ import pytest
 from unittest.mock import MagicMock
 
 
+class FakeRedis:
+    """
+    Minimal in-memory stand-in for the redis-py commands the backend uses.
+    TTLs are recorded but never expire.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.zsets = {}
+        self.hashes = {}
+        self.lists = {}
+        self.subscribers = {}
+
+    @staticmethod
+    def _key(key):
+        return key.decode() if isinstance(key, bytes) else key
+
+    def get(self, key):
+        value = self.data.get(self._key(key))
+        return value.encode() if isinstance(value, str) else value
+
+    def set(self, key, value, ex=None, nx=False, px=None):
+        key = self._key(key)
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex or px:
+            self.ttls[key] = ex or px / 1000
+        return True
+
+    def delete(self, *keys):
+        removed = 0
+        for key in map(self._key, keys):
+            for store in (self.data, self.zsets, self.hashes, self.lists):
+                if store.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def incrby(self, key, amount=1):
+        key = self._key(key)
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    def expire(self, key, seconds):
+        key = self._key(key)
+        if any(key in store for store in (self.data, self.hashes, self.lists)):
+            self.ttls[key] = seconds
+            return True
+        return False
+
+    def rpush(self, key, *values):
+        items = self.lists.setdefault(self._key(key), [])
+        items.extend(v.encode() if isinstance(v, str) else v for v in values)
+        return len(items)
+
+    def lrange(self, key, start, end):
+        items = self.lists.get(self._key(key), [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def zadd(self, key, mapping):
+        zset = self.zsets.setdefault(self._key(key), {})
+        for member, score in mapping.items():
+            zset[member.encode() if isinstance(member, str) else member] = score
+        return len(mapping)
+
+    def zrem(self, key, *members):
+        zset = self.zsets.get(self._key(key), {})
+        removed = 0
+        for member in members:
+            member = member.encode() if isinstance(member, str) else member
+            if zset.pop(member, None) is not None:
+                removed += 1
+        return removed
+
+    def zcard(self, key):
+        return len(self.zsets.get(self._key(key), {}))
+
+    def zpopmin(self, key, count=1):
+        zset = self.zsets.get(self._key(key), {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    def hincrby(self, key, field, amount=1):
+        fields = self.hashes.setdefault(self._key(key), {})
+        fields[field] = fields.get(field, 0) + amount
+        return fields[field]
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.hashes.setdefault(self._key(key), {})
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        for name, item in updates.items():
+            fields[name.encode() if isinstance(name, str) else name] = (
+                item.encode() if isinstance(item, str) else item
+            )
+        return len(updates)
+
+    def hget(self, key, field):
+        field = field.encode() if isinstance(field, str) else field
+        return self.hashes.get(self._key(key), {}).get(field)
+
+    def hdel(self, key, *fields):
+        hash_fields = self.hashes.get(self._key(key), {})
+        removed = 0
+        for field in fields:
+            field = field.encode() if isinstance(field, str) else field
+            if hash_fields.pop(field, None) is not None:
+                removed += 1
+        return removed
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(self._key(key), {}))
+
+    def hlen(self, key):
+        return len(self.hashes.get(self._key(key), {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def publish(self, channel, message):
+        subscribers = self.subscribers.get(self._key(channel), [])
+        for pubsub in subscribers:
+            pubsub.messages.append(
+                {"type": "message", "channel": channel, "data": message}
+            )
+        return len(subscribers)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    """Collects published messages; get_message() returns None when idle."""
+
+    def __init__(self, client):
+        self.client = client
+        self.messages = []
+        self.timeouts = []
+        self.closed = False
+
+    def subscribe(self, *channels):
+        for channel in channels:
+            self.client.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        if self.messages:
+            return self.messages.pop(0)
+        self.timeouts.append(timeout)
+        return None
+
+    def close(self):
+        for subscribers in self.client.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+        self.closed = True
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        results = [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+        self.calls = []
+        return results
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis for cache and store tests."""
+    return FakeRedis()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Give every test fresh per-host rate limiters."""
+    from clients import rate_limiter
+
+    rate_limiter._limiters.clear()
+    yield
+    rate_limiter._limiters.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_token_stores(monkeypatch):
+    """Give every test fresh shared token stores backed by an in-memory Redis."""
+    from clients import token_store
+
+    redis_client = FakeRedis()
+    monkeypatch.setattr(token_store, "get_redis", lambda: redis_client)
+    token_store._stores.clear()
+    yield
+    token_store._stores.clear()
+
+
 @pytest.fixture
 def mock_spotify_session():
     """Mock Spotify session data."""
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+from backend.clients.youtube_client import PlaylistPage, Song
+from backend.destination_index import DestinationIndex
+
+
+class TestDestinationIndex:
+    """Test the destination playlist index used to skip duplicates."""
+
+    def test_contains_song_normalizes_and_splits_artists(self):
+        index = DestinationIndex()
+        index.add("id1", "Artist A, Artist B", "Song")
+
+        assert index.contains_song("artist a", " SONG ")
+        assert index.contains_song("Artist B, Artist C", "Song")
+        assert not index.contains_song("Artist C", "Song")
+        assert not index.contains_song("Artist A", "Other Song")
+        assert not index.contains_song("Artist A", None)
+
+    def test_contains_id(self):
+        index = DestinationIndex(["id1", None])
+
+        assert index.contains_id("id1")
+        assert not index.contains_id("id2")
+        assert not index.contains_id(None)
+        assert len(index) == 1
+
+    def test_from_spotify_playlist(self):
+        """Test loading a Spotify playlist with the user's token."""
+        spotify_client = MagicMock()
+        spotify_client.iter_track_pages.return_value = iter(
+            [
+                [{"id": "id1", "track": "Song 1", "artist": "Artist"}],
+                [{"id": "id2", "track": "Song 2", "artist": "Artist"}],
+            ]
+        )
+
+        index = DestinationIndex.from_spotify_playlist(spotify_client, "playlist")
+
+        spotify_client.iter_track_pages.assert_called_once_with(
+            "playlist", include_ids=True, use_app_token=False
+        )
+        assert index.ids == {"id1", "id2"}
+        assert index.contains_song("Artist", "Song 2")
+        print("✓ Spotify destination index loaded")
+
+    def test_from_youtube_playlist(self):
+        """Test loading a YouTube playlist's videoIds and parsed titles."""
+        youtube_client = MagicMock()
+        youtube_client.iter_playlist_pages.return_value = iter(
+            [PlaylistPage([Song("Artist", "Song")], 2, 2, video_ids=["vid1", "vid2"])]
+        )
+
+        index = DestinationIndex.from_youtube_playlist(youtube_client, "playlist")
+
+        assert index.ids == {"vid1", "vid2"}
+        assert index.contains_song("Artist", "Song")
+        print("✓ YouTube destination index loaded")
@@ -0,0 +1,134 @@
+import importlib
+import redis
+from flask import session
+from unittest.mock import MagicMock, patch
+from backend.clients.playlist_cache import SpotifyPlaylistCache, YouTubePlaylistCache
+
+PLAYLISTS = [{"id": "pl1", "name": "Mine", "tracks_count": 3}]
+
+
+class TestSpotifyPlaylistCache:
+    """Test the per-user Spotify playlist listing cache."""
+
+    def test_profile_and_playlists_roundtrip(self, fake_redis):
+        cache = SpotifyPlaylistCache(redis_client=fake_redis)
+        cache.set_profile("token", {"id": "user1"})
+        cache.set_playlists("user1", PLAYLISTS)
+
+        assert cache.get_profile("token") == {"id": "user1"}
+        assert cache.get_playlists("user1") == PLAYLISTS
+        assert cache.get_playlists("user2") is None
+        assert not any("token" in key for key in fake_redis.data)
+
+    def test_invalidate_drops_listing_of_token_owner(self, fake_redis):
+        """Test that a transfer's token invalidates its user's listing."""
+        cache = SpotifyPlaylistCache(redis_client=fake_redis)
+        cache.set_profile("token", {"id": "user1"})
+        cache.set_playlists("user1", PLAYLISTS)
+        cache.set_playlists("user2", PLAYLISTS)
+
+        cache.invalidate("token")
+        cache.invalidate("unknown-token")
+
+        assert cache.get_playlists("user1") is None
+        assert cache.get_playlists("user2") == PLAYLISTS
+        assert fake_redis.zcard(cache.index_key) == 2
+        print("✓ Transfers invalidate the cached playlist listing")
+
+    def test_redis_errors_are_misses(self):
+        broken = MagicMock()
+        broken.get.side_effect = redis.ConnectionError("down")
+        broken.pipeline.side_effect = redis.ConnectionError("down")
+        cache = SpotifyPlaylistCache(redis_client=broken)
+
+        assert cache.get_playlists("user1") is None
+        cache.invalidate("token")
+
+
+class TestSpotifyPlaylistsRoute:
+    """Test that /spotify/playlists is served from the cache."""
+
+    def _get(self, app_module):
+        with patch.dict(
+            app_module.app.config, {"SECRET_KEY": "test-secret"}
+        ), app_module.app.test_request_context("/spotify/playlists"):
+            session["access_token"] = "token"
+            return app_module.spotify_playlists()
+
+    def test_second_request_is_cached(self, fake_redis):
+        app_module = importlib.import_module("backend.app")
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.get_current_user.return_value = {"id": "user1"}
+        mock_spotify_client.get_user_playlists.return_value = PLAYLISTS
+
+        with patch.object(
+            app_module, "SpotifyClient", return_value=mock_spotify_client
+        ), patch("clients.search_cache.get_redis", return_value=fake_redis):
+            first = self._get(app_module)
+            second = self._get(app_module)
+
+        assert first.get_json() == second.get_json() == {"playlists": PLAYLISTS}
+        mock_spotify_client.get_current_user.assert_called_once()
+        mock_spotify_client.get_user_playlists.assert_called_once_with("user1")
+        print("✓ Playlist listing and profile are cached")
+
+    def test_profile_error(self, fake_redis):
+        app_module = importlib.import_module("backend.app")
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.get_current_user.side_effect = Exception("401")
+
+        with patch.object(
+            app_module, "SpotifyClient", return_value=mock_spotify_client
+        ), patch("clients.search_cache.get_redis", return_value=fake_redis):
+            response, status = self._get(app_module)
+
+        assert status == 400
+        assert response.get_json() == {"error": "Failed to fetch user profile"}
+
+
+class TestYouTubePlaylistsRoute:
+    """Test the per-channel /youtube/playlists cache."""
+
+    def _get(self, app_module, token, query=""):
+        credentials = MagicMock(refresh_token=None, token=token)
+        with patch.object(
+            app_module, "get_youtube_credentials", return_value=credentials
+        ), app_module.app.test_request_context(f"/youtube/playlists{query}"):
+            return app_module.youtube_playlists().get_json()
+
+    def test_sessions_of_a_channel_share_the_listing(self, fake_redis):
+        app_module = importlib.import_module("backend.app")
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.get_channel_id.return_value = "channel1"
+        mock_youtube_client.get_playlists.return_value = PLAYLISTS
+
+        with patch.object(
+            app_module, "YouTubeClient", return_value=mock_youtube_client
+        ), patch("clients.search_cache.get_redis", return_value=fake_redis):
+            first = self._get(app_module, "token-a")
+            again = self._get(app_module, "token-a")
+            other_session = self._get(app_module, "token-b")
+
+        assert first == again == other_session == {"playlists": PLAYLISTS}
+        assert mock_youtube_client.get_channel_id.call_count == 2
+        mock_youtube_client.get_playlists.assert_called_once()
+        print("✓ YouTube playlist listing is shared per channel")
+
+    def test_refresh_reloads_listing(self, fake_redis):
+        app_module = importlib.import_module("backend.app")
+        cache = YouTubePlaylistCache(redis_client=fake_redis)
+        cache.set_channel("token-a", "channel1")
+        cache.set_playlists("channel1", [])
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.get_playlists.return_value = PLAYLISTS
+
+        with patch.object(
+            app_module, "YouTubeClient", return_value=mock_youtube_client
+        ), patch("clients.search_cache.get_redis", return_value=fake_redis):
+            cached = self._get(app_module, "token-a")
+            refreshed = self._get(app_module, "token-a", "?refresh=true")
+
+        assert cached == {"playlists": []}
+        assert refreshed == {"playlists": PLAYLISTS}
+        assert cache.get_playlists("channel1") == PLAYLISTS
+        mock_youtube_client.get_channel_id.assert_not_called()
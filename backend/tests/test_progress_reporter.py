@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock, patch
+from backend.progress_reporter import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reporter(**kwargs):
+    task = MagicMock()
+    task.request.id = None
+    clock = FakeClock()
+    reporter = ProgressReporter(task, clock=clock, **kwargs)
+    return reporter, task, clock
+
+
+def _written(task):
+    return [call.kwargs["meta"]["current"] for call in task.update_state.call_args_list]
+
+
+class TestProgressReporter:
+    """Test coalescing of task progress writes."""
+
+    def test_writes_bounded_by_percent_delta(self):
+        """Test that a large transfer writes about 100 / min_delta times."""
+        reporter, task, clock = _reporter(min_interval=0, min_delta=5)
+
+        for i in range(1, 10001):
+            clock.now += 0.01
+            reporter.update(i, 10000, f"Processed {i}/10000")
+
+        assert 20 <= reporter.writes <= 21
+        assert _written(task)[-1] == 10000
+        print("✓ Progress writes are bounded by the percent delta")
+
+    def test_writes_wait_for_interval(self):
+        reporter, task, clock = _reporter(min_interval=1, min_delta=0)
+
+        reporter.update(1, 100, "Processed 1/100")
+        reporter.update(2, 100, "Processed 2/100")
+        clock.now = 1.5
+        reporter.update(3, 100, "Processed 3/100")
+
+        assert _written(task) == [1, 3]
+
+    def test_phase_change_and_completion_always_flush(self):
+        reporter, task, clock = _reporter(min_interval=60, min_delta=50)
+
+        reporter.update(0, 0, "Fetching playlist...", phase="fetching")
+        reporter.update(0, 100, "Starting transfer...", phase="transferring")
+        reporter.update(1, 100, "Processed 1/100")
+        reporter.update(100, 100, "Processed 100/100")
+
+        assert _written(task) == [0, 0, 100]
+        progress = [
+            call.kwargs["meta"]["progress"] for call in task.update_state.call_args_list
+        ]
+        assert progress == [0, 0, 100]
+        print("✓ Phase changes and completion are always written")
+
+    def test_flush_writes_held_back_update(self):
+        reporter, task, clock = _reporter(min_interval=60, min_delta=50)
+
+        reporter.update(1, 100, "Processed 1/100")
+        reporter.update(2, 100, "Processed 2/100")
+        reporter.flush()
+        reporter.flush()
+
+        assert _written(task) == [1, 2]
+
+    def test_updates_are_published(self):
+        reporter, task, clock = _reporter()
+
+        with patch("backend.progress_reporter.publish_task_event") as publish:
+            reporter.update(5, 10, "Processed 5/10")
+
+        publish.assert_called_once_with(
+            None,
+            "progress",
+            {
+                "current": 5,
+                "total": 10,
+                "progress": 50.0,
+                "status": "Processed 5/10",
+                "state": "PROGRESS",
+            },
+        )
@@ -0,0 +1,86 @@
+import pytest
+from backend.clients.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Deterministic clock whose sleep just advances time."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test token bucket pacing."""
+
+    def test_burst_then_paced(self):
+        """Test that requests beyond the burst wait for tokens to refill."""
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(2.0, burst=2, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.slept == []
+
+        limiter.acquire()
+        assert clock.slept == [pytest.approx(0.5)]
+        print("✓ Token bucket paces requests after the burst")
+
+
+class TestAdaptiveBackoff:
+    """Test AIMD rate adjustments."""
+
+    def test_additive_increase_up_to_max(self):
+        """Test that successes raise the rate but never past max_rate."""
+        limiter = AdaptiveRateLimiter(2.0, max_rate=3.0, increase=0.5)
+        for _ in range(5):
+            limiter.on_success()
+        assert limiter.rate == 3.0
+        print("✓ Rate grows additively up to the ceiling")
+
+    def test_multiplicative_decrease_down_to_min(self):
+        """Test that throttles halve the rate but never below min_rate."""
+        limiter = AdaptiveRateLimiter(8.0, min_rate=1.0)
+        limiter.on_throttle()
+        assert limiter.rate == 4.0
+        for _ in range(5):
+            limiter.on_throttle()
+        assert limiter.rate == 1.0
+        print("✓ Rate shrinks multiplicatively down to the floor")
+
+    def test_retry_after_pauses_bucket(self):
+        """Test that Retry-After blocks the next acquire for that long."""
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(10.0, clock=clock, sleep=clock.sleep)
+
+        limiter.on_throttle(retry_after=3.0)
+        limiter.acquire()
+
+        assert sum(clock.slept) >= 3.0
+        print("✓ Retry-After pauses the limiter")
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_parse_seconds(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(b"1.5") == 1.5
+
+    def test_parse_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_parse_caps_long_waits(self):
+        assert parse_retry_after("86400") == 60.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,85 @@
+import redis
+from flask import Flask, session
+from unittest.mock import MagicMock
+from backend.config.redis_session import RedisSessionInterface
+
+
+def _app(redis_client):
+    app = Flask(__name__)
+    app.session_interface = RedisSessionInterface(ttl=600, redis_client=redis_client)
+
+    @app.route("/login")
+    def login():
+        session["access_token"] = "spotify-token"
+        session["expires_at"] = 1234567890.5
+        return "ok"
+
+    @app.route("/whoami")
+    def whoami():
+        return session.get("access_token", "")
+
+    @app.route("/logout")
+    def logout():
+        session.clear()
+        return "ok"
+
+    return app
+
+
+def _session_keys(fake_redis):
+    return [key for key in fake_redis.data if key.startswith("playlifts:session:")]
+
+
+class TestRedisSession:
+    """Test the Redis-backed server-side session."""
+
+    def test_cookie_holds_only_session_id(self, fake_redis):
+        """Test that data is kept in Redis and the cookie only has the id."""
+        client = _app(fake_redis).test_client()
+
+        response = client.get("/login")
+
+        cookie = response.headers["Set-Cookie"].split(";")[0].split("=", 1)[1]
+        assert len(cookie) == 43
+        assert _session_keys(fake_redis) == [f"playlifts:session:{cookie}"]
+        assert fake_redis.ttls[f"playlifts:session:{cookie}"] == 600
+        assert client.get("/whoami").data == b"spotify-token"
+        print("✓ Session data is stored server-side")
+
+    def test_unchanged_session_is_not_rewritten(self, fake_redis):
+        client = _app(fake_redis).test_client()
+        client.get("/login")
+        fake_redis.set = MagicMock()
+
+        response = client.get("/whoami")
+
+        fake_redis.set.assert_not_called()
+        assert "Set-Cookie" not in response.headers
+
+    def test_clear_deletes_session(self, fake_redis):
+        client = _app(fake_redis).test_client()
+        client.get("/login")
+
+        response = client.get("/logout")
+
+        assert _session_keys(fake_redis) == []
+        assert "session=;" in response.headers["Set-Cookie"]
+
+    def test_unknown_session_id_starts_new_session(self, fake_redis):
+        client = _app(fake_redis).test_client()
+        client.set_cookie("session", "x" * 43)
+
+        assert client.get("/whoami").data == b""
+        client.get("/login")
+        assert "playlifts:session:" + "x" * 43 not in fake_redis.data
+
+    def test_redis_errors_give_empty_session(self):
+        broken = MagicMock()
+        broken.get.side_effect = redis.ConnectionError("down")
+        broken.set.side_effect = redis.ConnectionError("down")
+        client = _app(broken).test_client()
+        client.set_cookie("session", "x" * 43)
+
+        assert client.get("/whoami").status_code == 200
+        assert "Set-Cookie" not in client.get("/login").headers
+        print("✓ Session store fails open when Redis is down")
@@ -0,0 +1,100 @@
+import pytest
+import redis
+from unittest.mock import MagicMock
+from backend.clients.search_cache import (
+    RedisCache,
+    SpotifyMatchCache,
+    YouTubeSearchCache,
+    normalize_query,
+    normalize_text,
+)
+
+
+class TestNormalization:
+    """Test cache key normalization."""
+
+    def test_normalize_text(self):
+        assert normalize_text("  The   Beatles ") == "the beatles"
+        assert normalize_text("ＡＢＣ") == "abc"
+        assert normalize_text(None) == ""
+
+    def test_normalize_query_dashes(self):
+        assert normalize_query("Artist – Song") == "artist - song"
+        assert normalize_query("ARTIST  -Song ") == "artist - song"
+
+
+class TestSpotifyMatchCache:
+    """Test the shared Spotify match cache."""
+
+    def test_match_roundtrip_with_normalized_key(self, fake_redis):
+        """Test that a stored match is found for equivalent artist/track."""
+        cache = SpotifyMatchCache(redis_client=fake_redis)
+        match = {"id": "track_id", "name": "Song", "artist": "Artist"}
+
+        assert cache.get_match("Artist", "Song") is None
+        cache.set_match("Artist", "Song", match)
+
+        assert cache.get_match(" artist ", "SONG") == match
+        assert cache.flush_stats() == {"hits": 1, "misses": 1}
+        assert fake_redis.hgetall("playlifts:match:spotify:stats") == {
+            "hits": 1,
+            "misses": 1,
+        }
+        print("✓ Match cache round trip works")
+
+    def test_size_cap_evicts_oldest(self, fake_redis):
+        """Test that the oldest entries are evicted past max_entries."""
+        cache = SpotifyMatchCache(max_entries=2, redis_client=fake_redis)
+        for i in range(3):
+            cache.set_match("Artist", f"Song {i}", {"id": str(i)})
+
+        assert cache.get_match("Artist", "Song 0") is None
+        assert cache.get_match("Artist", "Song 2") == {"id": "2"}
+        assert fake_redis.zcard(cache.index_key) == 2
+        print("✓ Match cache evicts the oldest entries")
+
+    def test_ttl_applied(self, fake_redis):
+        """Test that entries are written with the configured TTL."""
+        cache = SpotifyMatchCache(ttl=60, redis_client=fake_redis)
+        cache.set_match("Artist", "Song", {"id": "1"})
+        assert list(fake_redis.ttls.values()) == [60]
+
+
+class TestYouTubeSearchCache:
+    """Test the shared YouTube search cache."""
+
+    def test_hits_and_misses_use_separate_ttls(self, fake_redis):
+        """Test that empty results are cached with the shorter miss TTL."""
+        cache = YouTubeSearchCache(ttl=1000, miss_ttl=10, redis_client=fake_redis)
+        hit = [{"videoId": "abc", "title": "Song"}]
+
+        cache.set_results("Artist - Song", 1, hit)
+        cache.set_results("Nobody - Nothing", 1, [])
+
+        assert cache.get_results("artist – song", 1) == hit
+        assert cache.get_results("nobody - nothing", 1) == []
+        assert cache.get_results("Artist - Song", 5) is None
+        assert sorted(fake_redis.ttls.values()) == [10, 1000]
+        print("✓ YouTube search cache stores hits and misses")
+
+
+class TestCacheFailsOpen:
+    """Test behaviour when Redis is unavailable."""
+
+    def test_redis_errors_are_misses(self):
+        """Test that Redis errors count as misses and pause the cache."""
+        broken = MagicMock()
+        broken.get.side_effect = redis.ConnectionError("down")
+        cache = RedisCache("test", ttl=60, max_entries=10, redis_client=broken)
+
+        assert cache.get("key") is None
+        assert cache.get("key") is None
+        cache.set("key", value={"a": 1})
+
+        assert broken.get.call_count == 1
+        broken.pipeline.assert_not_called()
+        print("✓ Cache fails open when Redis is down")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from backend.clients.spotify_client import SpotifyClient
+from backend.clients.spotify_client import SpotifyClient, save_user_tokens
+from backend.clients.http_session import build_session
 
 
 class TestSpotifyClientInitialization:
@@ -38,7 +39,7 @@ class TestAppToken:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_app_token_success(self, mock_post):
         """Test successful app token retrieval."""
         mock_response = MagicMock()
@@ -63,7 +64,7 @@ class TestAppToken:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_app_token_failure(self, mock_post):
         """Test failed app token retrieval."""
         mock_response = MagicMock()
@@ -76,6 +77,32 @@ class TestAppToken:
         assert result is False
         print("✓ App token failure handled correctly")
 
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    def test_app_token_shared_between_clients(self, mock_post):
+        """Test that a new client reuses the app token of an earlier one."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": "test_token",
+            "expires_in": 3600,
+        }
+        mock_post.return_value = mock_response
+
+        assert SpotifyClient().get_app_token() is True
+        second = SpotifyClient()
+        assert second.get_app_token() is True
+
+        assert second._app_token == "test_token"
+        mock_post.assert_called_once()
+        print("✓ App token is shared between clients")
+
 
 class TestPlaylistTracks:
     """Test playlist tracks functionality."""
@@ -87,8 +114,8 @@ class TestPlaylistTracks:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_get_tracks_from_playlist_success(self, mock_get, mock_post):
         """Test successful playlist tracks retrieval."""
         # Mock the token request
@@ -126,8 +153,8 @@ class TestPlaylistTracks:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_get_tracks_from_playlist_not_found(self, mock_get, mock_post):
         """Test playlist not found error."""
         # Mock the token request
@@ -150,6 +177,183 @@ class TestPlaylistTracks:
             client.get_tracks_from_playlist("invalid_playlist_id")
         print("✓ Playlist not found error handled")
 
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_get_tracks_from_playlist_full_fetch(self, mock_get, mock_post):
+        """Test that a full fetch reads every offset and keeps playlist order."""
+        mock_post_response = MagicMock()
+        mock_post_response.status_code = 200
+        mock_post_response.json.return_value = {
+            "access_token": "test_token",
+            "expires_in": 3600,
+        }
+        mock_post.return_value = mock_post_response
+
+        def page(url, params=None, **kwargs):
+            offset = params["offset"]
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "items": [
+                    {"track": {"name": f"Song {i}", "artists": [{"name": "Artist"}]}}
+                    for i in range(offset, min(offset + 100, 350))
+                ],
+                "total": 350,
+            }
+            return response
+
+        mock_get.side_effect = page
+
+        client = SpotifyClient()
+        tracks = client.get_tracks_from_playlist("test_playlist_id", max_tracks=None)
+
+        assert [t["track"] for t in tracks] == [f"Song {i}" for i in range(350)]
+        offsets = sorted(
+            call[1]["params"]["offset"] for call in mock_get.call_args_list
+        )
+        assert offsets == [0, 100, 200, 300]
+        assert "total" in mock_get.call_args_list[0][1]["params"]["fields"]
+        print("✓ Full playlist fetch returns every track in order")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_get_tracks_from_playlist_capped(self, mock_get, mock_post):
+        """Test that a capped fetch stops after the first page it needs."""
+        mock_post_response = MagicMock()
+        mock_post_response.status_code = 200
+        mock_post_response.json.return_value = {
+            "access_token": "test_token",
+            "expires_in": 3600,
+        }
+        mock_post.return_value = mock_post_response
+
+        mock_get_response = MagicMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = {
+            "items": [
+                {"track": {"name": f"Song {i}", "artists": [{"name": "Artist"}]}}
+                for i in range(100)
+            ],
+            "total": 1000,
+        }
+        mock_get.return_value = mock_get_response
+
+        client = SpotifyClient()
+        tracks = client.get_tracks_from_playlist("test_playlist_id")
+
+        assert len(tracks) == 15
+        assert mock_get.call_count == 1
+        print("✓ Capped playlist fetch stops early")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.get")
+    def test_iter_track_pages_with_ids_uses_user_token(self, mock_get):
+        """Test reading the user's own playlist with track IDs."""
+        mock_get_response = MagicMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = {
+            "items": [
+                {
+                    "track": {
+                        "id": "track_id",
+                        "name": "Song",
+                        "artists": [{"name": "Artist"}],
+                    }
+                }
+            ],
+            "total": 1,
+        }
+        mock_get.return_value = mock_get_response
+
+        client = SpotifyClient(api_token="user_token")
+        pages = list(
+            client.iter_track_pages(
+                "test_playlist_id", include_ids=True, use_app_token=False
+            )
+        )
+
+        assert pages == [[{"track": "Song", "artist": "Artist", "id": "track_id"}]]
+        kwargs = mock_get.call_args[1]
+        assert kwargs["headers"]["Authorization"] == "Bearer user_token"
+        assert "track(id," in kwargs["params"]["fields"]
+        print("✓ Destination playlist read with IDs and the user token")
+
+
+class TestUserPlaylists:
+    """Test listing the user's own playlists."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.get")
+    def test_get_user_playlists_pages_by_total(self, mock_get):
+        """Test that pages after the first are requested by offset from total."""
+
+        def playlist(i, owner):
+            return {
+                "id": f"pl{i}",
+                "name": f"Playlist {i}",
+                "tracks": {"total": i},
+                "owner": {"id": owner, "display_name": owner},
+                "public": True,
+                "images": [{"url": f"https://img/{i}"}] if i % 2 else [],
+            }
+
+        def get(url, params=None, **kwargs):
+            offset = params["offset"]
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "items": [
+                    playlist(i, "me" if i % 3 else "other")
+                    for i in range(offset, min(offset + 50, 120))
+                ],
+                "total": 120,
+            }
+            return response
+
+        mock_get.side_effect = get
+
+        client = SpotifyClient(api_token="user_token")
+        playlists = client.get_user_playlists("me")
+
+        offsets = sorted(c[1]["params"]["offset"] for c in mock_get.call_args_list)
+        assert offsets == [0, 50, 100]
+        assert [p["id"] for p in playlists] == [f"pl{i}" for i in range(120) if i % 3]
+        assert playlists[0] == {
+            "id": "pl1",
+            "name": "Playlist 1",
+            "tracks_count": 1,
+            "owner": "me",
+            "public": True,
+            "cover_image": "https://img/1",
+        }
+        print("✓ User playlists are paged concurrently by total")
+
 
 class TestSearchSong:
     """Test song search functionality."""
@@ -161,8 +365,8 @@ class TestSearchSong:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_search_song_success(self, mock_get, mock_post):
         """Test successful song search."""
         # Mock the token request
@@ -206,8 +410,8 @@ class TestSearchSong:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_search_song_no_results(self, mock_get, mock_post):
         """Test song search with no results."""
         # Mock the token request
@@ -241,7 +445,7 @@ class TestAddSongToPlaylist:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_add_song_to_playlist_success(self, mock_post):
         """Test successful song addition to playlist."""
         mock_response = MagicMock()
@@ -268,7 +472,7 @@ class TestAddSongToPlaylist:
             "SPOTIFY_CLIENT_SECRET": "test_client_secret",
         },
     )
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_add_song_to_playlist_failure(self, mock_post):
         """Test failed song addition to playlist."""
         mock_response = MagicMock()
@@ -289,5 +493,384 @@ class TestAddSongToPlaylist:
         print("✓ Add song to playlist failure handled")
 
 
+class TestAddSongsToPlaylist:
+    """Test batched playlist inserts."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    def test_add_songs_to_playlist_batches_of_100(self, mock_post):
+        """Test that songs are sent in order, 100 URIs per request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_post.return_value = mock_response
+
+        client = SpotifyClient(api_token="test_user_token")
+        songs = [{"id": f"track{i}", "name": f"Song {i}"} for i in range(250)]
+
+        results = client.add_songs_to_playlist(songs, "test_playlist_id")
+
+        assert results == [True] * 250
+        assert mock_post.call_count == 3
+        sent = [
+            uri for call in mock_post.call_args_list for uri in call[1]["json"]["uris"]
+        ]
+        assert sent == [f"spotify:track:track{i}" for i in range(250)]
+        assert len(mock_post.call_args_list[0][1]["json"]["uris"]) == 100
+        print("✓ Add songs to playlist batches requests")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    def test_add_songs_to_playlist_partial_failure(self, mock_post):
+        """Test that a failed batch only marks its own songs as failed."""
+        ok_response = MagicMock()
+        ok_response.status_code = 201
+        bad_response = MagicMock()
+        bad_response.status_code = 500
+        mock_post.side_effect = [ok_response, bad_response]
+
+        client = SpotifyClient(api_token="test_user_token")
+        songs = [{"id": f"track{i}", "name": f"Song {i}"} for i in range(150)]
+        songs.insert(3, {"name": "No id"})
+
+        results = client.add_songs_to_playlist(songs, "test_playlist_id")
+
+        assert results[3] is False
+        assert results[:3] == [True] * 3
+        assert results[4:101] == [True] * 97
+        assert results[101:] == [False] * 50
+        print("✓ Add songs to playlist reports per-track failures")
+
+
+class TestSaveSongsToLibrary:
+    """Test batched Liked Songs saves."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.put")
+    def test_save_songs_to_library_dedupes_and_chunks(self, mock_put):
+        """Test that IDs are deduped and sent 50 per request."""
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        bad_response = MagicMock()
+        bad_response.status_code = 403
+        mock_put.side_effect = [ok_response, bad_response]
+
+        client = SpotifyClient(api_token="test_user_token")
+        songs = [{"id": f"track{i}", "name": f"Song {i}"} for i in range(60)]
+        songs.append({"id": "track55", "name": "Song 55 again"})
+        songs.append({"id": "track1", "name": "Song 1 again"})
+
+        results = client.save_songs_to_library(songs)
+
+        assert mock_put.call_count == 2
+        assert len(mock_put.call_args_list[0][1]["json"]["ids"]) == 50
+        assert len(mock_put.call_args_list[1][1]["json"]["ids"]) == 10
+        assert results[:50] == [True] * 50
+        assert results[50:60] == [False] * 10
+        assert results[60] is False
+        assert results[61] is True
+        print("✓ Save songs to library dedupes and maps failures back")
+
+
+class TestUserTokenRefresh:
+    """Test refreshing the user token from the server-side store."""
+
+    def _response(self, status_code, payload=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = payload or {}
+        return response
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.put")
+    def test_rejected_token_is_refreshed_and_retried(self, mock_put, mock_post):
+        """Test that a 401 refreshes the token once for every client."""
+        from clients.token_store import load_refresh_token
+
+        key = save_user_tokens("old_token", "refresh_1", 3600)
+        mock_put.side_effect = [self._response(401), self._response(200)]
+        mock_post.return_value = self._response(
+            200,
+            {
+                "access_token": "new_token",
+                "expires_in": 3600,
+                "refresh_token": "refresh_2",
+            },
+        )
+
+        client = SpotifyClient(api_token="old_token", user_token_key=key)
+        assert client.save_songs_to_library([{"id": "track1"}]) == [True]
+
+        assert mock_put.call_args[1]["headers"]["Authorization"] == "Bearer new_token"
+        assert mock_post.call_args[1]["data"] == {
+            "grant_type": "refresh_token",
+            "refresh_token": "refresh_1",
+        }
+        assert load_refresh_token(f"spotify:user:{key}") == "refresh_2"
+
+        mock_put.side_effect = None
+        mock_put.return_value = self._response(200)
+        other = SpotifyClient(api_token="old_token", user_token_key=key)
+        assert other.save_songs_to_library([{"id": "track2"}]) == [True]
+
+        assert mock_post.call_count == 1
+        assert mock_put.call_args[1]["headers"]["Authorization"] == "Bearer new_token"
+        print("✓ Rejected user token is refreshed once and retried")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.put")
+    def test_request_in_flight_during_refresh_is_retried(self, mock_put, mock_post):
+        """Test that a 401 for a token another thread already replaced is retried."""
+        key = save_user_tokens("new_token", "refresh_1", 3600)
+        mock_put.side_effect = [self._response(401), self._response(200)]
+
+        client = SpotifyClient(api_token="new_token", user_token_key=key)
+        response = client._request(
+            "PUT",
+            "https://api.spotify.com/v1/me/tracks",
+            headers={"Authorization": "Bearer old_token"},
+        )
+
+        assert response.status_code == 200
+        assert mock_put.call_args[1]["headers"]["Authorization"] == "Bearer new_token"
+        mock_post.assert_not_called()
+        print("✓ In-flight request is retried with the refreshed token")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    def test_clients_share_one_store(self):
+        """Test that every client for a user uses the process-wide store."""
+        key = save_user_tokens("token", "refresh_1", 3600)
+
+        first = SpotifyClient(api_token="token", user_token_key=key)
+        second = SpotifyClient(api_token="token", user_token_key=key)
+
+        assert first._user_tokens is second._user_tokens
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.put")
+    def test_token_is_refreshed_before_expiry(self, mock_put, mock_post):
+        key = save_user_tokens("old_token", "refresh_1", 30)
+        mock_put.return_value = self._response(200)
+        mock_post.return_value = self._response(
+            200, {"access_token": "new_token", "expires_in": 3600}
+        )
+
+        client = SpotifyClient(api_token="old_token", user_token_key=key)
+        assert client.save_songs_to_library([{"id": "track1"}]) == [True]
+
+        mock_put.assert_called_once()
+        assert mock_put.call_args[1]["headers"]["Authorization"] == "Bearer new_token"
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    @patch("requests.Session.put")
+    def test_without_token_key_401_is_not_retried(self, mock_put, mock_post):
+        mock_put.return_value = self._response(401)
+
+        client = SpotifyClient(api_token="old_token")
+        assert client.save_songs_to_library([{"id": "track1"}]) == [False]
+
+        mock_put.assert_called_once()
+        mock_post.assert_not_called()
+
+
+class TestHttpSession:
+    """Test pooled HTTP session handling."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    def test_clients_share_pooled_session(self):
+        """Test that clients in one process reuse the same session."""
+        first = SpotifyClient(api_token="token_a")
+        second = SpotifyClient()
+        assert first.session is second.session
+        print("✓ Spotify clients share a pooled session")
+
+    def test_build_session_configures_pool_and_retries(self):
+        """Test that the session adapter uses the requested pool and retries."""
+        session = build_session(pool_size=7, max_retries=2, backoff_factor=0.1)
+        adapter = session.get_adapter("https://api.spotify.com/v1")
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 2
+        assert "POST" not in adapter.max_retries.allowed_methods
+        print("✓ Session pool size and retry adapter are configurable")
+
+
+class TestRateLimiting:
+    """Test rate limit handling in the Spotify client."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.get")
+    def test_search_retries_after_429(self, mock_get):
+        """Test that a 429 is retried after Retry-After and slows the limiter."""
+        throttled_response = MagicMock()
+        throttled_response.status_code = 429
+        throttled_response.headers = {"Retry-After": "2"}
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        ok_response.headers = {}
+        ok_response.json.return_value = {
+            "tracks": {
+                "items": [{"id": "test_track_id", "name": "Test Song", "artists": []}]
+            }
+        }
+        mock_get.side_effect = [throttled_response, ok_response]
+
+        limiter = MagicMock()
+        with patch(
+            "backend.clients.spotify_client.get_rate_limiter", return_value=limiter
+        ):
+            client = SpotifyClient(api_token="test_user_token")
+            result = client.search_song("Test Artist", "Test Song")
+
+        assert result["id"] == "test_track_id"
+        assert mock_get.call_count == 2
+        assert limiter.acquire.call_count == 2
+        limiter.on_throttle.assert_called_once_with(2.0)
+        limiter.on_success.assert_called_once()
+        print("✓ Search retries after 429 with Retry-After")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.post")
+    def test_playlist_insert_not_retried_on_5xx(self, mock_post):
+        """Test that a 5xx on a playlist insert backs off but is not resent."""
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.headers = {}
+        mock_post.return_value = mock_response
+
+        limiter = MagicMock()
+        with patch(
+            "backend.clients.spotify_client.get_rate_limiter", return_value=limiter
+        ):
+            client = SpotifyClient(api_token="test_user_token")
+            results = client.add_songs_to_playlist(
+                [{"id": "test_track_id", "name": "Test Song"}], "test_playlist_id"
+            )
+
+        assert results == [False]
+        assert mock_post.call_count == 1
+        limiter.on_throttle.assert_called_once_with(None)
+        print("✓ Playlist inserts are not retried on 5xx")
+
+
+class TestSearchSongCache:
+    """Test search_song with a match cache."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.get")
+    def test_search_song_uses_cache(self, mock_get):
+        """Test that a cached match skips the search request."""
+        cache = MagicMock()
+        cache.get_match.return_value = {"id": "cached_id", "name": "Test Song"}
+
+        client = SpotifyClient(api_token="test_user_token", match_cache=cache)
+        result = client.search_song("Test Artist", "Test Song")
+
+        assert result["id"] == "cached_id"
+        mock_get.assert_not_called()
+        print("✓ Search song uses the match cache")
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SPOTIFY_CLIENT_ID": "test_client_id",
+            "SPOTIFY_CLIENT_SECRET": "test_client_secret",
+        },
+    )
+    @patch("requests.Session.get")
+    def test_search_song_stores_match(self, mock_get):
+        """Test that a fresh match is written to the cache."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "tracks": {
+                "items": [{"id": "test_track_id", "name": "Test Song", "artists": []}]
+            }
+        }
+        mock_get.return_value = mock_response
+        cache = MagicMock()
+        cache.get_match.return_value = None
+
+        client = SpotifyClient(api_token="test_user_token", match_cache=cache)
+        result = client.search_song("Test Artist", "Test Song")
+
+        cache.set_match.assert_called_once_with("Test Artist", "Test Song", result)
+        print("✓ Search song stores new matches")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,154 @@
+import json
+import importlib
+import redis
+from unittest.mock import MagicMock, patch
+from backend.task_events import (
+    TaskEvents,
+    publish_task_event,
+    stream_task_events,
+    task_channel,
+)
+
+
+def _events(chunks):
+    """Parse SSE chunks into (event, data) pairs, skipping comments."""
+    events = []
+    for chunk in chunks:
+        lines = dict(
+            line.split(": ", 1) for line in chunk.strip().split("\n") if ": " in line
+        )
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestTaskEvents:
+    """Test publishing task events over Redis pub/sub."""
+
+    def test_tracks_publishes_only_new_entries(self, fake_redis):
+        pubsub = fake_redis.pubsub()
+        pubsub.subscribe(task_channel("task-id"))
+        events = TaskEvents("task-id", redis_client=fake_redis)
+
+        successful, failed = [{"track": "Song 0"}], []
+        events.tracks(successful, failed)
+        failed.append({"track": "Song 1", "reason": "Not found"})
+        events.tracks(successful, failed)
+        events.tracks(successful, failed)
+
+        messages = [json.loads(m["data"]) for m in pubsub.messages]
+        assert [m["data"]["tracks"] for m in messages] == [
+            [{"status": "success", "track": {"track": "Song 0"}}],
+            [{"status": "failed", "track": {"track": "Song 1", "reason": "Not found"}}],
+        ]
+        print("✓ Track events carry only new outcomes")
+
+    def test_failed_matches_status_shape(self, fake_redis):
+        pubsub = fake_redis.pubsub()
+        pubsub.subscribe(task_channel("task-id"))
+        TaskEvents("task-id", redis_client=fake_redis).failed(ValueError("boom"))
+
+        message = json.loads(pubsub.messages[0]["data"])
+        assert message == {
+            "event": "failed",
+            "data": {
+                "state": "FAILURE",
+                "error": "boom",
+                "error_type": "ValueError",
+                "progress": 0,
+            },
+        }
+
+    def test_publish_never_raises(self):
+        """Test that a Redis outage does not fail the task."""
+        broken = MagicMock()
+        broken.publish.side_effect = redis.ConnectionError("down")
+
+        publish_task_event("task-id", "progress", {}, redis_client=broken)
+        publish_task_event(None, "progress", {}, redis_client=broken)
+        assert broken.publish.call_count == 1
+        print("✓ Publishing fails open")
+
+
+class TestStreamTaskEvents:
+    """Test the Server-Sent Events stream for one task."""
+
+    def test_relays_events_until_done(self, fake_redis):
+        stream = stream_task_events(
+            "task-id",
+            lambda: {"state": "PROGRESS", "progress": 10},
+            redis_client=fake_redis,
+        )
+        assert next(stream).startswith("retry:")
+        assert _events([next(stream)]) == [
+            ("status", {"state": "PROGRESS", "progress": 10})
+        ]
+
+        publish_task_event("task-id", "progress", {"progress": 50}, fake_redis)
+        TaskEvents("task-id", redis_client=fake_redis).done(
+            {"success": {"count": 1}, "tracks": {"encoding": "json", "rows": []}}
+        )
+        publish_task_event("task-id", "progress", {"progress": 99}, fake_redis)
+
+        assert _events(stream) == [
+            ("progress", {"progress": 50}),
+            (
+                "done",
+                {
+                    "state": "SUCCESS",
+                    "result": {"success": {"count": 1}},
+                    "progress": 100,
+                },
+            ),
+        ]
+        assert fake_redis.subscribers[task_channel("task-id")] == []
+        print("✓ Stream relays events until the task is done")
+
+    def test_finished_task_ends_after_snapshot(self, fake_redis):
+        chunks = list(
+            stream_task_events(
+                "task-id",
+                lambda: {"state": "SUCCESS", "result": {}, "progress": 100},
+                redis_client=fake_redis,
+            )
+        )
+
+        assert [event for event, _ in _events(chunks)] == ["status"]
+
+    def test_heartbeat_until_max_duration(self, fake_redis):
+        """Test that a quiet task gets keep-alives and the stream times out."""
+        ticks = iter(range(10))
+        chunks = list(
+            stream_task_events(
+                "task-id",
+                lambda: {"state": "PENDING", "progress": 0},
+                redis_client=fake_redis,
+                heartbeat=15,
+                max_duration=3,
+                clock=lambda: next(ticks),
+            )
+        )
+
+        assert chunks[2:] == [": keep-alive\n\n"] * 2
+        print("✓ Quiet streams send heartbeats and close after max duration")
+
+
+class TestStreamRoute:
+    """Test the /tasks/stream/<task_id> endpoint."""
+
+    def test_stream_response(self, fake_redis):
+        app_module = importlib.import_module("backend.app")
+
+        with patch("task_events.get_redis", return_value=fake_redis), patch.object(
+            app_module,
+            "_task_status_response",
+            return_value={"state": "SUCCESS", "result": {}, "progress": 100},
+        ):
+            response = app_module.app.test_client().get("/tasks/stream/task-id")
+            body = response.get_data(as_text=True)
+
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert response.headers["X-Accel-Buffering"] == "no"
+        assert "event: status" in body
+        print("✓ Stream route serves Server-Sent Events")
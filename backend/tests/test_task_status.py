@@ -0,0 +1,145 @@
+import importlib
+from unittest.mock import MagicMock, patch
+
+
+def _app_module():
+    return importlib.import_module("backend.app")
+
+
+class TestBulkTaskStatus:
+    """Test the bulk /tasks/status endpoint."""
+
+    def test_statuses_read_in_one_mget(self):
+        """Test that every task is read in a single MGET with the usual shapes."""
+        app_module = _app_module()
+        backend = app_module.celery.backend
+        stored = {
+            "progress-id": backend.encode(
+                {
+                    "status": "PROGRESS",
+                    "result": {"current": 5, "total": 10, "progress": 50.0},
+                }
+            ),
+            "success-id": backend.encode(
+                {"status": "SUCCESS", "result": {"success": {"count": 1}}}
+            ),
+            "failure-id": backend.encode(
+                {
+                    "status": "FAILURE",
+                    "result": {
+                        "exc_type": "ValueError",
+                        "exc_message": ["boom"],
+                        "exc_module": "builtins",
+                    },
+                }
+            ),
+        }
+
+        def mget(keys):
+            return [
+                stored.get(key.decode().replace("celery-task-meta-", ""))
+                for key in keys
+            ]
+
+        task_ids = ["progress-id", "success-id", "failure-id", "pending-id"]
+        with patch.object(backend, "mget", side_effect=mget) as mock_mget:
+            response = app_module.app.test_client().post(
+                "/tasks/status", json={"task_ids": task_ids + ["success-id"]}
+            )
+
+        mock_mget.assert_called_once()
+        assert len(mock_mget.call_args[0][0]) == len(task_ids)
+        tasks = response.get_json()["tasks"]
+        assert sorted(tasks) == sorted(task_ids)
+        assert tasks["progress-id"]["progress"] == 50.0
+        assert tasks["progress-id"]["status"] == "In progress..."
+        assert tasks["success-id"] == {
+            "state": "SUCCESS",
+            "result": {"success": {"count": 1}},
+            "progress": 100,
+        }
+        assert tasks["failure-id"]["error"] == "boom"
+        assert tasks["failure-id"]["error_type"] == "ValueError"
+        assert tasks["pending-id"]["state"] == "PENDING"
+        print("✓ Bulk task status reads all tasks in one round trip")
+
+    def test_rejects_invalid_task_ids(self):
+        client = _app_module().app.test_client()
+
+        assert client.post("/tasks/status", json={}).status_code == 400
+        assert client.post("/tasks/status", json={"task_ids": [""]}).status_code == 400
+        assert client.post("/tasks/status", json=["task-id"]).status_code == 400
+        assert client.post("/tasks/status", data="not json").status_code == 400
+
+    def test_rejects_too_many_task_ids(self):
+        app_module = _app_module()
+        task_ids = [f"task-{i}" for i in range(3)]
+
+        with patch.object(app_module, "TASK_STATUS_BATCH_LIMIT", 2):
+            response = app_module.app.test_client().post(
+                "/tasks/status", json={"task_ids": task_ids}
+            )
+
+        assert response.status_code == 400
+
+
+class TestTaskResults:
+    """Test the summary status and the paginated results endpoint."""
+
+    def _result(self):
+        from backend.transfer_results import build_result
+
+        return build_result(
+            [{"artist": "Artist", "track": f"Song {i}"} for i in range(3)],
+            [{"artist": "Artist", "track": "Song 3", "reason": "Not found"}],
+        )
+
+    def test_status_returns_only_counts(self):
+        app_module = _app_module()
+
+        response = app_module._task_status_from_meta(
+            "task-id", "SUCCESS", self._result()
+        )
+
+        assert response["result"] == {
+            "success": {"count": 3},
+            "failed": {"count": 1},
+            "skipped": {"count": 0},
+        }
+
+    def test_results_are_paginated(self):
+        app_module = _app_module()
+        task = MagicMock(state="SUCCESS", result=self._result())
+
+        with patch.object(app_module.celery, "AsyncResult", return_value=task):
+            client = app_module.app.test_client()
+            page = client.get("/tasks/task-id/results?offset=2&limit=10").get_json()
+            failed = client.get("/tasks/task-id/results?status=failed").get_json()
+
+        assert page["total"] == 4
+        assert [t["track"] for t in page["tracks"]] == ["Song 2", "Song 3"]
+        assert failed["tracks"] == [
+            {
+                "status": "failed",
+                "artist": "Artist",
+                "track": "Song 3",
+                "reason": "Not found",
+            }
+        ]
+        print("✓ Task results are paginated")
+
+    def test_results_of_unfinished_task(self):
+        app_module = _app_module()
+        task = MagicMock(state="PROGRESS")
+
+        with patch.object(app_module.celery, "AsyncResult", return_value=task):
+            response = app_module.app.test_client().get("/tasks/task-id/results")
+
+        assert response.status_code == 409
+
+    def test_results_reject_invalid_paging(self):
+        client = _app_module().app.test_client()
+
+        assert client.get("/tasks/task-id/results?limit=0").status_code == 400
+        assert client.get("/tasks/task-id/results?offset=x").status_code == 400
+        assert client.get("/tasks/task-id/results?status=lost").status_code == 400
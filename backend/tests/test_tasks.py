@@ -5,6 +5,12 @@ Simplified tests for core task functionality (without Celery decorators).
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from backend.clients.youtube_client import Song
+from backend.transfer_results import result_tracks
+
+
+def _tracks(result, status):
+    """Names of a transfer result's tracks with the given status."""
+    return [t["track"] for t in result_tracks(result, statuses=[status])[1]]
 
 
 class TestPlaylistTransferLogic:
@@ -207,5 +213,488 @@ class TestErrorHandling:
             assert str(e) == "API Error"
 
 
+class TestSpotifyWriteBatching:
+    """Test batched writes in the YouTube to Spotify task."""
+
+    def test_flush_spotify_writes_to_playlist(self):
+        """Test that a batch is written in one call and mapped back per song."""
+        from tasks import _flush_spotify_writes
+
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.add_songs_to_playlist.return_value = [True, False]
+
+        pending = [
+            (
+                Song("Artist 1", "Song 1"),
+                {"id": "id1", "name": "Song 1", "artist": "Artist 1"},
+            ),
+            (
+                Song("Artist 2", "Song 2"),
+                {"id": "id2", "name": "Song 2", "artist": "Artist 2"},
+            ),
+        ]
+        successful, failed = [], []
+
+        _flush_spotify_writes(
+            mock_spotify_client, pending, "target_playlist", successful, failed
+        )
+
+        mock_spotify_client.add_songs_to_playlist.assert_called_once()
+        assert [s["track"] for s in successful] == ["Song 1"]
+        assert [s["track"] for s in failed] == ["Song 2"]
+
+    def test_flush_spotify_writes_to_liked_songs(self):
+        """Test that Liked Songs batches skip tracks saved by earlier batches."""
+        from tasks import _flush_spotify_writes
+
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.save_songs_to_library.return_value = [True]
+
+        match = {"id": "id1", "name": "Song 1", "artist": "Artist 1"}
+        saved_ids = {"id0": False}
+        pending = [
+            (
+                Song("Artist 0", "Song 0"),
+                {"id": "id0", "name": "Song 0", "artist": "Artist 0"},
+            ),
+            (Song("Artist 1", "Song 1"), match),
+        ]
+        successful, failed = [], []
+
+        _flush_spotify_writes(
+            mock_spotify_client, pending, None, successful, failed, saved_ids
+        )
+
+        mock_spotify_client.save_songs_to_library.assert_called_once_with([match])
+        assert saved_ids == {"id0": False, "id1": True}
+        assert [s["track"] for s in successful] == ["Song 1"]
+        assert [s["track"] for s in failed] == ["Song 0"]
+
+
+class TestNormalizationStages:
+    """Test the normalization stages used by the transfer pipelines."""
+
+    def test_normalize_song_strips_parts(self):
+        from tasks import _normalize_song
+
+        song = _normalize_song(Song("  Test Artist ", "Test Song  "))
+        assert str(song) == "Test Artist - Test Song"
+
+    def test_normalize_song_rejects_empty_parts(self):
+        from tasks import _normalize_song
+
+        with pytest.raises(Exception):
+            _normalize_song(Song("Test Artist", "  "))
+
+    def test_youtube_query(self):
+        from tasks import _youtube_query
+
+        assert (
+            _youtube_query({"artist": "Test Artist", "track": "Test Song"})
+            == "Test Artist - Test Song"
+        )
+
+
+class TestFanOut:
+    """Test chunked fan-out of large transfers."""
+
+    def test_chunks(self):
+        from tasks import _chunks
+
+        assert _chunks(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+        assert _chunks([], 2) == []
+
+    def test_large_playlist_is_replaced_by_chord(self):
+        """Test that a large YouTube playlist fans out into chunk subtasks."""
+        from backend.clients.youtube_client import PlaylistPage
+        from tasks import transfer_playlist_task
+
+        songs = [Song(f"Artist {i}", f"Song {i}") for i in range(5)]
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.iter_playlist_pages.return_value = iter(
+            [PlaylistPage(songs[:3], 3, 5), PlaylistPage(songs[3:], 2, 5)]
+        )
+
+        with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+            "tasks.SpotifyClient"
+        ), patch("tasks.SpotifyMatchCache"), patch(
+            "tasks.TRANSFER_FANOUT_THRESHOLD", 5
+        ), patch(
+            "tasks.TRANSFER_FANOUT_CHUNK_SIZE", 2
+        ), patch.object(
+            transfer_playlist_task, "update_state"
+        ), patch.object(
+            transfer_playlist_task, "replace", return_value="replaced"
+        ) as mock_replace:
+            result = transfer_playlist_task.run("token", "yt_playlist", "sp_playlist")
+
+        assert result == "replaced"
+        sig = mock_replace.call_args[0][0]
+        header = list(sig.tasks)
+        assert len(header) == 3
+        assert header[0].args[1] == [
+            {"artist": "Artist 0", "track": "Song 0"},
+            {"artist": "Artist 1", "track": "Song 1"},
+        ]
+        assert header[2].args[3] == 5
+        assert sig.body.task == "tasks.write_spotify_chunks_task"
+        print("✓ Large playlist fans out into chunk subtasks")
+
+    def test_small_playlist_is_not_fanned_out(self):
+        """Test that playlists under the threshold run in a single task."""
+        from backend.clients.youtube_client import PlaylistPage
+        from tasks import transfer_playlist_task
+
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.iter_playlist_pages.return_value = iter(
+            [PlaylistPage([Song("Artist", "Song")], 1, 1)]
+        )
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.search_song.return_value = {
+            "id": "id1",
+            "name": "Song",
+            "artist": "Artist",
+        }
+        mock_spotify_client.add_songs_to_playlist.return_value = [True]
+
+        with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+            "tasks.SpotifyClient", return_value=mock_spotify_client
+        ), patch("tasks.SpotifyMatchCache"), patch(
+            "tasks.TRANSFER_FANOUT_THRESHOLD", 5
+        ), patch.object(
+            transfer_playlist_task, "update_state"
+        ), patch.object(
+            transfer_playlist_task, "replace"
+        ) as mock_replace:
+            result = transfer_playlist_task.run("token", "yt_playlist", "sp_playlist")
+
+        mock_replace.assert_not_called()
+        assert result["success"]["count"] == 1
+        print("✓ Small playlist runs in a single task")
+
+    def test_match_chunk_reports_to_parent(self, fake_redis):
+        """Test that a chunk returns ordered matches and bumps the parent counter."""
+        from tasks import match_spotify_chunk_task
+
+        def search_song(artist, track):
+            if track == "Song 1":
+                raise Exception("Not found")
+            return {"id": track, "name": track, "artist": artist}
+
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.search_song.side_effect = search_song
+        fake_redis.incrby("playlifts:fanout:parent-id:matched", 2)
+
+        songs = [{"artist": "Artist", "track": f"Song {i}"} for i in range(3)]
+        with patch("tasks.SpotifyClient", return_value=mock_spotify_client), patch(
+            "tasks.SpotifyMatchCache"
+        ), patch("tasks.get_redis", return_value=fake_redis), patch.object(
+            match_spotify_chunk_task, "update_state"
+        ) as mock_update_state:
+            results = match_spotify_chunk_task.run("token", songs, "parent-id", 10)
+
+        assert [r["source"] for r in results] == songs
+        assert [r["error"] for r in results] == [None, "Not found", None]
+        assert results[2]["match"]["id"] == "Song 2"
+        kwargs = mock_update_state.call_args[1]
+        assert kwargs["task_id"] == "parent-id"
+        assert kwargs["meta"]["current"] == 5
+        print("✓ Chunk matches are ordered and reported to the parent task")
+
+    def test_match_chunk_progress_is_coalesced(self, fake_redis):
+        """Test that a chunk below the next percent step skips the progress write."""
+        from tasks import match_spotify_chunk_task
+
+        fake_redis.incrby("playlifts:fanout:parent-id:matched", 2)
+        songs = [{"artist": "Artist", "track": f"Song {i}"} for i in range(3)]
+        with patch("tasks.SpotifyClient"), patch("tasks.SpotifyMatchCache"), patch(
+            "tasks.get_redis", return_value=fake_redis
+        ), patch.object(match_spotify_chunk_task, "update_state") as mock_update_state:
+            match_spotify_chunk_task.run("token", songs, "parent-id", 1000)
+
+        assert fake_redis.get("playlifts:fanout:parent-id:matched") == 5
+        mock_update_state.assert_not_called()
+
+    def test_write_spotify_chunks_keeps_result_shape(self, fake_redis):
+        """Test that the chord body writes in order and returns the usual result."""
+        from tasks import write_spotify_chunks_task
+
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.add_songs_to_playlist.side_effect = lambda songs, _: [
+            True
+        ] * len(songs)
+
+        def result(i, error=None):
+            return {
+                "source": {"artist": "Artist", "track": f"Song {i}"},
+                "match": (
+                    None
+                    if error
+                    else {"id": f"id{i}", "name": f"Song {i}", "artist": "Artist"}
+                ),
+                "error": error,
+            }
+
+        chunk_results = [[result(0), result(1, "Not found")], [result(2)]]
+        with patch("tasks.SpotifyClient", return_value=mock_spotify_client), patch(
+            "tasks.get_redis", return_value=fake_redis
+        ), patch.object(write_spotify_chunks_task, "update_state"):
+            outcome = write_spotify_chunks_task.run(chunk_results, "token", "playlist")
+
+        assert outcome["success"]["count"] == 2
+        assert _tracks(outcome, "success") == ["Song 0", "Song 2"]
+        assert result_tracks(outcome, statuses=["failed"])[1] == [
+            {
+                "status": "failed",
+                "artist": "Artist",
+                "track": "Song 1",
+                "reason": "Not found",
+            }
+        ]
+        print("✓ Fan-out writer returns the single-task result shape")
+
+    def test_write_youtube_chunks_keeps_result_shape(self, fake_redis):
+        """Test the Spotify to YouTube chord body."""
+        from tasks import write_youtube_chunks_task
+
+        mock_youtube_client = MagicMock()
+        track0 = {"artist": "Artist", "track": "Song 0"}
+        track1 = {"artist": "Artist", "track": "Song 1"}
+        chunk_results = [
+            [{"source": track0, "match": [{"videoId": "vid0"}], "error": None}],
+            [{"source": track1, "match": [], "error": None}],
+        ]
+
+        with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+            "tasks.get_redis", return_value=fake_redis
+        ), patch.object(write_youtube_chunks_task, "update_state"):
+            outcome = write_youtube_chunks_task.run(
+                chunk_results,
+                "yt_playlist",
+                {
+                    "token": "t",
+                    "token_uri": "u",
+                    "client_id": "c",
+                    "client_secret": "s",
+                    "scopes": [],
+                },
+            )
+
+        mock_youtube_client.add_video_to_playlist.assert_called_once_with(
+            "yt_playlist", "vid0"
+        )
+        assert outcome["success"] == {"count": 1}
+        assert outcome["failed"] == {"count": 1}
+        assert result_tracks(outcome) == (
+            2,
+            [
+                dict(track0, status="success"),
+                dict(track1, status="failed", reason="No YouTube video found"),
+            ],
+        )
+        print("✓ Spotify to YouTube fan-out writer returns the usual result shape")
+
+
+class TestDoneEvent:
+    """Test that "done" is published once the task result is stored."""
+
+    def test_done_is_published_on_success(self):
+        from transfer_results import build_result
+        import tasks
+
+        for task in (
+            tasks.transfer_playlist_task,
+            tasks.write_spotify_chunks_task,
+            tasks.transfer_spotify_to_youtube_task,
+            tasks.write_youtube_chunks_task,
+        ):
+            assert isinstance(task, tasks.TransferTask)
+
+        result = build_result([{"artist": "Artist", "track": "Song"}], [], [])
+        with patch("tasks.TaskEvents") as mock_events:
+            tasks.transfer_playlist_task.on_success(result, "task-id", (), {})
+
+        mock_events.assert_called_once_with("task-id")
+        mock_events.return_value.done.assert_called_once_with(result)
+        print("✓ Done event is published from on_success")
+
+
+class TestCheckpointResume:
+    """Test that redelivered transfer tasks resume from their checkpoint."""
+
+    def test_youtube_to_spotify_resumes_after_cursor(self, fake_redis):
+        """Test that committed songs are neither searched nor written again."""
+        from backend.clients.youtube_client import PlaylistPage
+        from transfer_checkpoint import TransferCheckpoint
+        from tasks import transfer_playlist_task
+
+        previous = TransferCheckpoint("task-id", redis_client=fake_redis)
+        previous.commit(
+            2,
+            [{"artist": "Artist", "track": "Song 0"}],
+            [{"artist": "Artist", "track": "Song 1", "reason": "Not found"}],
+        )
+        checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+        checkpoint.load()
+
+        songs = [Song("Artist", f"Song {i}") for i in range(4)]
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.iter_playlist_pages.return_value = iter(
+            [PlaylistPage(songs, 4, 4)]
+        )
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.search_song.side_effect = lambda artist, track: {
+            "id": track,
+            "name": track,
+            "artist": artist,
+        }
+        mock_spotify_client.add_songs_to_playlist.side_effect = lambda songs, _: [
+            True
+        ] * len(songs)
+
+        with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+            "tasks.SpotifyClient", return_value=mock_spotify_client
+        ), patch("tasks.SpotifyMatchCache"), patch(
+            "tasks._load_checkpoint", return_value=checkpoint
+        ), patch.object(
+            transfer_playlist_task, "update_state"
+        ):
+            result = transfer_playlist_task.run("token", "yt_playlist", "sp_playlist")
+
+        searched = [c[0][1] for c in mock_spotify_client.search_song.call_args_list]
+        assert sorted(searched) == ["Song 2", "Song 3"]
+        written = mock_spotify_client.add_songs_to_playlist.call_args[0][0]
+        assert [song["id"] for song in written] == ["Song 2", "Song 3"]
+        assert _tracks(result, "success") == ["Song 0", "Song 2", "Song 3"]
+        assert result["failed"]["count"] == 1
+        assert not fake_redis.lists
+        print("✓ Redelivered transfer resumes from its checkpoint")
+
+    def test_liked_songs_resume_keeps_saved_ids(self, fake_redis):
+        """Test that a resumed Liked Songs transfer does not save a track twice."""
+        from backend.clients.youtube_client import PlaylistPage
+        from transfer_checkpoint import TransferCheckpoint
+        from tasks import transfer_playlist_task
+
+        songs = [Song("Artist", name) for name in ["Song 0", "Song 1", "Song 0"]]
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.iter_playlist_pages.side_effect = lambda _: iter(
+            [PlaylistPage(songs, 3, 3)]
+        )
+        mock_spotify_client = MagicMock()
+        mock_spotify_client.search_song.side_effect = lambda artist, track: {
+            "id": track,
+            "name": track,
+            "artist": artist,
+        }
+        mock_spotify_client.save_songs_to_library.side_effect = [
+            [True],
+            Exception("Worker lost"),
+            [True],
+        ]
+
+        def attempt():
+            checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+            checkpoint.load()
+            with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+                "tasks.SpotifyClient", return_value=mock_spotify_client
+            ), patch("tasks.SpotifyMatchCache"), patch(
+                "tasks.LIBRARY_SAVE_BATCH_SIZE", 1
+            ), patch(
+                "tasks._load_checkpoint", return_value=checkpoint
+            ), patch(
+                "tasks.get_redis", return_value=fake_redis
+            ), patch.object(
+                transfer_playlist_task, "update_state"
+            ):
+                return transfer_playlist_task.run("token", "yt_playlist", None)
+
+        with pytest.raises(Exception, match="Worker lost"):
+            attempt()
+        result = attempt()
+
+        saved = [
+            [song["id"] for song in c[0][0]]
+            for c in mock_spotify_client.save_songs_to_library.call_args_list
+        ]
+        assert saved == [["Song 0"], ["Song 1"], ["Song 1"]]
+        assert _tracks(result, "success") == ["Song 0", "Song 1", "Song 0"]
+        print("✓ Resumed Liked Songs transfer reuses saved IDs")
+
+
+class TestSkipExistingTracks:
+    """Test that tracks already in the destination are skipped."""
+
+    def test_youtube_to_spotify_skips_present_songs(self):
+        """Test that known songs skip search and known IDs skip the write."""
+        from backend.clients.youtube_client import PlaylistPage
+        from tasks import transfer_playlist_task
+
+        songs = [Song("Artist", f"Song {i}") for i in range(3)]
+        mock_youtube_client = MagicMock()
+        mock_youtube_client.iter_playlist_pages.return_value = iter(
+            [PlaylistPage(songs, 3, 3)]
+        )
+        mock_spotify_client = MagicMock()
+        # Song 0 is present by name; Song 1's match is present by ID.
+        mock_spotify_client.iter_track_pages.return_value = iter(
+            [
+                [
+                    {"id": "id0", "track": "Song 0", "artist": "Artist"},
+                    {"id": "id1", "track": "Song 1 (Remastered)", "artist": "Artist"},
+                ]
+            ]
+        )
+        mock_spotify_client.search_song.side_effect = lambda artist, track: {
+            "id": f"id{track[-1]}",
+            "name": track,
+            "artist": artist,
+        }
+        mock_spotify_client.add_songs_to_playlist.side_effect = lambda songs, _: [
+            True
+        ] * len(songs)
+
+        with patch("tasks.YouTubeClient", return_value=mock_youtube_client), patch(
+            "tasks.SpotifyClient", return_value=mock_spotify_client
+        ), patch("tasks.SpotifyMatchCache"), patch.object(
+            transfer_playlist_task, "update_state"
+        ):
+            result = transfer_playlist_task.run("token", "yt_playlist", "sp_playlist")
+
+        searched = [c[0][1] for c in mock_spotify_client.search_song.call_args_list]
+        assert sorted(searched) == ["Song 1", "Song 2"]
+        written = mock_spotify_client.add_songs_to_playlist.call_args[0][0]
+        assert [song["id"] for song in written] == ["id2"]
+        assert result["success"]["count"] == 1
+        assert _tracks(result, "skipped") == ["Song 0", "Song 1"]
+        print("✓ Tracks already in the destination are skipped")
+
+    def test_write_youtube_item_skips_present_video(self):
+        """Test that a video already in the playlist is not inserted again."""
+        from destination_index import DestinationIndex
+        from transfer_pipeline import PipelineItem
+        from tasks import _write_youtube_item
+
+        mock_youtube_client = MagicMock()
+        track = {"artist": "Artist", "track": "Song"}
+        item = PipelineItem(0, track)
+        item.match = [{"videoId": "vid1"}]
+        successful, failed, skipped = [], [], []
+
+        _write_youtube_item(
+            mock_youtube_client,
+            "yt_playlist",
+            item,
+            successful,
+            failed,
+            skipped,
+            DestinationIndex(["vid1"]),
+        )
+
+        mock_youtube_client.add_video_to_playlist.assert_not_called()
+        assert skipped == [track]
+        assert successful == [] and failed == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
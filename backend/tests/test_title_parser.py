@@ -0,0 +1,71 @@
+import json
+import os
+from backend.clients.title_parser import ParsedTitle, parse_title, parse_titles
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "data", "title_corpus.jsonl")
+
+
+def load_corpus():
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestTitleParser:
+    """Test YouTube title normalization."""
+
+    def test_separators(self):
+        assert parse_title("Artist - Track") == ParsedTitle("Artist", "Track")
+        assert parse_title("Artist — Track") == ParsedTitle("Artist", "Track")
+        assert parse_title("Artist—Track") == ParsedTitle("Artist", "Track")
+        assert parse_title("Track | Artist") == ParsedTitle("Artist", "Track")
+        assert parse_title("Jay-Z - Track").artist == "Jay-Z"
+        assert parse_title("Just a title") is None
+        print("✓ Title separators are recognized")
+
+    def test_featured_artists_are_split_off(self):
+        parsed = parse_title("Artist — Track (Official Video) ft. X")
+
+        assert parsed == ParsedTitle("Artist", "Track", ("X",))
+        assert parse_title("Artist feat. Y - Track").featured == ("Y",)
+        print("✓ Featured artists are split off")
+
+    def test_version_markers_are_kept_and_noise_dropped(self):
+        assert parse_title("A - B (X Remix) [Official Video]").track == "B (X Remix)"
+        assert parse_title("A - B (Live at Wembley 1986)").track == "B (Live)"
+        assert parse_title("A - B - 2011 Remaster").track == "B"
+        assert parse_title("A - B (Lyrics) #shorts").track == "B"
+
+    def test_topic_channel_uploads(self):
+        """Test that "<Artist> - Topic" uploads take the artist from the channel."""
+        assert parse_title("Track", "Artist - Topic") == ParsedTitle("Artist", "Track")
+        assert parse_title("Track - Radio Edit", "Artist - Topic") == ParsedTitle(
+            "Artist", "Track (Radio Edit)"
+        )
+        assert parse_title("Track", "Some Uploader") is None
+        print("✓ Topic channel uploads are parsed")
+
+    def test_batch_matches_single_calls(self):
+        corpus = load_corpus()
+        titles = [entry["title"] for entry in corpus]
+        channels = [entry["channel"] for entry in corpus]
+
+        assert parse_titles(titles, channels) == [
+            parse_title(title, channel) for title, channel in zip(titles, channels)
+        ]
+        assert parse_titles(["A - B", None]) == [ParsedTitle("A", "B"), None]
+
+    def test_labelled_corpus_accuracy(self):
+        """Test accuracy on the labelled title corpus (see tests/data)."""
+        corpus = load_corpus()
+        parsed = parse_titles(
+            [entry["title"] for entry in corpus], [entry["channel"] for entry in corpus]
+        )
+        correct = sum(
+            ((p.artist, p.track) if p else (None, None))
+            == (entry["artist"], entry["track"])
+            for p, entry in zip(parsed, corpus)
+        )
+
+        accuracy = correct / len(corpus)
+        assert accuracy >= 0.95
+        print(f"✓ Title corpus accuracy {accuracy:.1%} ({correct}/{len(corpus)})")
@@ -0,0 +1,131 @@
+import json
+import threading
+import time
+import redis
+from unittest.mock import MagicMock
+from backend.clients.token_store import SharedTokenStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _store(fake_redis, **kwargs):
+    return SharedTokenStore("test", redis_client=fake_redis, **kwargs)
+
+
+class TestSharedTokenStore:
+    """Test the process-wide and Redis-shared token store."""
+
+    def test_token_is_shared_across_processes(self, fake_redis):
+        """Test that a token fetched by one process is reused by another."""
+        fetch = MagicMock(return_value=("app-token", 3600))
+        clock = FakeClock()
+        first = _store(fake_redis, clock=clock)
+        second = _store(fake_redis, clock=clock)
+
+        assert first.get(fetch)[0] == "app-token"
+        assert second.get(fetch)[0] == "app-token"
+        assert first.get(fetch)[0] == "app-token"
+
+        fetch.assert_called_once()
+        assert fake_redis.ttls["playlifts:token:test"] == 3600 - 60
+        assert "playlifts:token:test:lease" not in fake_redis.data
+        print("✓ Token is fetched once and shared through Redis")
+
+    def test_concurrent_callers_fetch_once(self, fake_redis):
+        """Test that threads waiting on an expired token share one refresh."""
+        store = _store(fake_redis)
+
+        def fetch():
+            time.sleep(0.05)
+            return "app-token", 3600
+
+        fetch = MagicMock(side_effect=fetch)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get(fetch)[0]))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["app-token"] * 8
+        fetch.assert_called_once()
+        print("✓ Concurrent callers share a single refresh")
+
+    def test_waits_for_lease_holder(self, fake_redis):
+        """Test that a caller waits for the process holding the lease."""
+        clock = FakeClock()
+        fake_redis.set("playlifts:token:test:lease", "other", nx=True, px=10000)
+
+        def sleep(seconds):
+            clock.now += seconds
+            fake_redis.set(
+                "playlifts:token:test",
+                json.dumps({"access_token": "shared", "expires_at": clock.now + 60}),
+            )
+
+        fetch = MagicMock()
+        store = _store(fake_redis, clock=clock, sleep=sleep)
+
+        assert store.get(fetch)[0] == "shared"
+        fetch.assert_not_called()
+
+    def test_stuck_lease_holder_is_not_waited_on_forever(self, fake_redis):
+        clock = FakeClock()
+        fake_redis.set("playlifts:token:test:lease", "other", nx=True, px=10000)
+
+        def sleep(seconds):
+            clock.now += seconds
+
+        fetch = MagicMock(return_value=("own", 3600))
+        store = _store(fake_redis, lease_seconds=1, clock=clock, sleep=sleep)
+
+        assert store.get(fetch)[0] == "own"
+        fetch.assert_called_once()
+
+    def test_expired_token_is_refreshed(self, fake_redis):
+        clock = FakeClock()
+        fetch = MagicMock(side_effect=[("old", 120), ("new", 3600)])
+        store = _store(fake_redis, clock=clock)
+
+        assert store.get(fetch)[0] == "old"
+        clock.now += 61
+        assert store.get(fetch)[0] == "new"
+        assert store.refreshes == 2
+
+    def test_redis_errors_fall_back_to_local_fetch(self):
+        broken = MagicMock()
+        broken.get.side_effect = redis.ConnectionError("down")
+        fetch = MagicMock(return_value=("app-token", 3600))
+        store = _store(broken)
+
+        assert store.get(fetch)[0] == "app-token"
+        assert store.get(fetch)[0] == "app-token"
+        fetch.assert_called_once()
+        print("✓ Token store falls back to local fetches without Redis")
+
+
+class TestTokenStoreRegistry:
+    """Test the process-wide registry of token stores."""
+
+    def test_least_recently_used_store_is_evicted(self, monkeypatch):
+        from clients import token_store
+
+        monkeypatch.setattr(token_store, "TOKEN_STORE_CACHE_SIZE", 2)
+        first = token_store.get_token_store("first", expiry_margin=300)
+        second = token_store.get_token_store("second")
+        assert token_store.get_token_store("first") is first
+        token_store.get_token_store("third")
+
+        assert list(token_store._stores) == ["first", "third"]
+        assert first.expiry_margin == 300
+        assert token_store.get_token_store("second") is not second
+        print("✓ Token store registry is bounded")
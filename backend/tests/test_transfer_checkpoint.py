@@ -0,0 +1,78 @@
+import redis
+from unittest.mock import MagicMock
+from backend.transfer_checkpoint import TransferCheckpoint
+
+
+class TestTransferCheckpoint:
+    """Test resumable transfer checkpoints."""
+
+    def test_new_task_has_no_checkpoint(self, fake_redis):
+        checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+
+        assert checkpoint.load() is False
+        assert checkpoint.cursor == 0
+        assert checkpoint.successful == []
+
+    def test_commit_and_resume(self, fake_redis):
+        """Test that a second attempt picks up the committed progress."""
+        first = TransferCheckpoint("task-id", ttl=60, redis_client=fake_redis)
+        successful, failed = [{"track": "Song 0"}], []
+        first.commit(1, successful, failed, {"id0": True})
+        successful.append({"track": "Song 2"})
+        failed.append({"track": "Song 1", "reason": "Not found"})
+        first.commit(3, successful, failed, {"id0": True, "id2": True})
+
+        # Only entries added since the previous commit are pushed.
+        assert len(fake_redis.lists[first.success_key]) == 2
+
+        second = TransferCheckpoint("task-id", redis_client=fake_redis)
+        assert second.load() is True
+        assert second.cursor == 3
+        assert second.successful == successful
+        assert second.failed == failed
+        assert second.saved_ids == {"id0": True, "id2": True}
+        assert fake_redis.ttls[first.cursor_key] == 60
+
+        # The task keeps adding to the loaded dict; those IDs still get saved.
+        second.saved_ids["id3"] = False
+        second.commit(4, successful, failed, second.saved_ids)
+        third = TransferCheckpoint("task-id", redis_client=fake_redis)
+        third.load()
+        assert third.saved_ids == {"id0": True, "id2": True, "id3": False}
+        print("✓ Checkpoint resumes committed progress")
+
+    def test_matches_dropped_once_committed(self, fake_redis):
+        """Test that recorded matches are kept only until their write commits."""
+        earlier = TransferCheckpoint("task-id", redis_client=fake_redis)
+        earlier.record_match(0, {"id": "id0"}, None)
+        earlier.record_match(1, None, "Not found")
+
+        checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+        assert checkpoint.load() is True
+        assert checkpoint.cursor == 0
+        assert checkpoint.get_match(1) == {"match": None, "error": "Not found"}
+
+        checkpoint.commit(1, [{"track": "Song 0"}], [])
+        assert checkpoint.get_match(0) is None
+        assert checkpoint.get_match(1) == {"match": None, "error": "Not found"}
+        print("✓ Committed matches are dropped")
+
+    def test_clear(self, fake_redis):
+        checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+        checkpoint.commit(1, [{"track": "Song 0"}], [])
+        checkpoint.clear()
+
+        assert TransferCheckpoint("task-id", redis_client=fake_redis).load() is False
+
+    def test_redis_errors_disable_checkpoint(self):
+        """Test that a Redis outage turns checkpointing off instead of failing."""
+        broken = MagicMock()
+        broken.pipeline.side_effect = redis.ConnectionError("down")
+        checkpoint = TransferCheckpoint("task-id", redis_client=broken)
+
+        assert checkpoint.load() is False
+        assert checkpoint.enabled is False
+        checkpoint.commit(1, [{"track": "Song 0"}], [])
+        assert checkpoint.get_match(0) is None
+        assert broken.pipeline.call_count == 1
+        print("✓ Checkpoint fails open")
@@ -0,0 +1,190 @@
+import time
+import threading
+import pytest
+from unittest.mock import MagicMock
+from backend.transfer_pipeline import TransferPipeline
+
+
+def collect(pages, normalize=lambda x: x, match=lambda x: x, **kwargs):
+    batches = []
+    TransferPipeline(
+        pages, normalize=normalize, match=match, write=batches.append, **kwargs
+    ).run()
+    return batches
+
+
+class TestPipelineOrdering:
+    """Test that matches reach the writer in source order."""
+
+    def test_matches_written_in_source_order(self):
+        """Test ordering when later items finish matching first."""
+
+        def slow_match(n):
+            time.sleep(0.005 * (10 - n % 10))
+            return n * 10
+
+        batches = collect(
+            [list(range(10)), list(range(10, 25))],
+            match=slow_match,
+            batch_size=4,
+            match_width=8,
+        )
+
+        items = [item for batch in batches for item in batch]
+        assert [item.index for item in items] == list(range(25))
+        assert [item.match for item in items] == [n * 10 for n in range(25)]
+        assert all(len(batch) <= 4 for batch in batches)
+        print("✓ Pipeline writes matches in source order")
+
+    def test_errors_recorded_per_item(self):
+        """Test that normalize and match errors mark only their own item."""
+
+        def normalize(n):
+            if n == 1:
+                raise Exception("Bad title")
+            return n
+
+        def match(n):
+            if n == 2:
+                raise Exception("No results")
+            return n
+
+        batches = collect([[0, 1, 2, 3]], normalize=normalize, match=match)
+        items = [item for batch in batches for item in batch]
+
+        assert [str(item.error) if item.error else None for item in items] == [
+            None,
+            "Bad title",
+            "No results",
+            None,
+        ]
+        assert items[1].match is None
+        print("✓ Pipeline records item errors")
+
+    def test_empty_source(self):
+        """Test that an empty source finishes without writing."""
+        assert collect([]) == []
+
+
+class TestPipelineBackpressure:
+    """Test that a slow writer bounds the work done ahead of it."""
+
+    def test_source_blocks_when_queues_are_full(self):
+        """Test that the source is not drained ahead of a blocked writer."""
+        pulled = []
+        release = threading.Event()
+
+        def pages():
+            for n in range(1000):
+                pulled.append(n)
+                yield [n]
+
+        def write(batch):
+            release.wait(timeout=5)
+
+        pipeline = TransferPipeline(
+            pages(),
+            normalize=lambda x: x,
+            match=lambda x: x,
+            write=write,
+            match_width=2,
+            queue_size=5,
+        )
+        runner = threading.Thread(target=pipeline.run)
+        runner.start()
+        time.sleep(0.3)
+
+        # Three queues of 5, four in-flight matches, one item being written.
+        assert len(pulled) < 30
+        release.set()
+        runner.join(timeout=10)
+        assert len(pulled) == 1000
+        print("✓ Pipeline applies backpressure")
+
+
+class TestPipelineFailures:
+    """Test that stage failures stop the pipeline and surface."""
+
+    def test_source_error_raised(self):
+        """Test that a failing source raises from run()."""
+
+        def pages():
+            yield [1, 2]
+            raise RuntimeError("Playlist not found")
+
+        with pytest.raises(RuntimeError, match="Playlist not found"):
+            collect(pages())
+
+    def test_writer_error_raised(self):
+        """Test that a failing writer stops the other stages."""
+
+        def write(batch):
+            raise RuntimeError("Write failed")
+
+        pipeline = TransferPipeline(
+            ([n] for n in range(10000)),
+            normalize=lambda x: x,
+            match=lambda x: x,
+            write=write,
+        )
+        with pytest.raises(RuntimeError, match="Write failed"):
+            pipeline.run()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
+
+
+class TestPipelineResume:
+    """Test resuming a pipeline from a checkpoint."""
+
+    def test_start_skips_committed_items(self):
+        """Test that items before `start` are neither matched nor written."""
+        matched = []
+
+        def match(n):
+            matched.append(n)
+            return n
+
+        batches = collect([list(range(5)), list(range(5, 8))], match=match, start=6)
+
+        items = [item for batch in batches for item in batch]
+        assert [item.index for item in items] == [6, 7]
+        assert sorted(matched) == [6, 7]
+
+    def test_recorded_matches_are_reused(self, fake_redis):
+        """Test that matches recorded by an earlier attempt skip the search."""
+        from backend.transfer_checkpoint import TransferCheckpoint
+
+        earlier = TransferCheckpoint("task-id", redis_client=fake_redis)
+        earlier.record_match(0, "earlier", None)
+        earlier.record_match(1, None, "Not found")
+        checkpoint = TransferCheckpoint("task-id", redis_client=fake_redis)
+        assert checkpoint.load() is True
+        matched = []
+
+        def match(n):
+            matched.append(n)
+            return f"new {n}"
+
+        batches = collect([[0, 1, 2]], match=match, checkpoint=checkpoint)
+
+        items = [item for batch in batches for item in batch]
+        assert [item.match for item in items] == ["earlier", None, "new 2"]
+        assert str(items[1].error) == "Not found"
+        assert matched == [2]
+        assert checkpoint.get_match(2) == {"match": "new 2", "error": None}
+        print("✓ Pipeline reuses checkpointed matches")
+
+    def test_fresh_checkpoint_is_not_read(self):
+        """Test that a task with nothing to resume does not look up matches."""
+        from backend.transfer_checkpoint import TransferCheckpoint
+
+        client = MagicMock()
+        checkpoint = TransferCheckpoint("task-id", redis_client=client)
+
+        batches = collect([[0, 1, 2]], match=lambda n: n, checkpoint=checkpoint)
+
+        assert [item.match for batch in batches for item in batch] == [0, 1, 2]
+        client.hget.assert_not_called()
+        print("✓ Fresh checkpoints skip match lookups")
@@ -0,0 +1,94 @@
+import json
+from backend.transfer_results import build_result, result_tracks, summarize_result
+
+SUCCESSFUL = [
+    {"artist": "Artist", "track": "Song 0", "artwork_url": "https://img/0.jpg"},
+    {"artist": "Artist", "track": "Song 1"},
+]
+FAILED = [
+    {"artist": "Artist", "track": "Song 2", "reason": "Not found"},
+    {"track": {"artist": "Artist", "track": "Song 3"}, "reason": "No video"},
+]
+SKIPPED = [{"artist": "Artist", "track": "Song 4"}]
+
+
+class TestTransferResults:
+    """Test compact transfer results."""
+
+    def test_rows_round_trip(self):
+        result = build_result(SUCCESSFUL, FAILED, SKIPPED, compress_min_bytes=0)
+
+        assert result["tracks"]["encoding"] == "json"
+        assert result_tracks(result) == (
+            5,
+            [
+                {
+                    "status": "success",
+                    "artist": "Artist",
+                    "track": "Song 0",
+                    "artwork_url": "https://img/0.jpg",
+                },
+                {"status": "success", "artist": "Artist", "track": "Song 1"},
+                {
+                    "status": "failed",
+                    "artist": "Artist",
+                    "track": "Song 2",
+                    "reason": "Not found",
+                },
+                {
+                    "status": "failed",
+                    "artist": "Artist",
+                    "track": "Song 3",
+                    "reason": "No video",
+                },
+                {"status": "skipped", "artist": "Artist", "track": "Song 4"},
+            ],
+        )
+        print("✓ Compact rows expand back to per-track outcomes")
+
+    def test_large_results_are_compressed(self):
+        """Test that big row sets are stored compressed and still readable."""
+        successful = [
+            {"artist": "Artist", "track": f"Song {i}", "artwork_url": "https://img"}
+            for i in range(1000)
+        ]
+        plain = build_result(successful, [], compress_min_bytes=0)
+        compressed = build_result(successful, [], compress_min_bytes=1024)
+
+        assert compressed["tracks"]["encoding"] == "zlib"
+        assert len(json.dumps(compressed)) < len(json.dumps(plain)) / 5
+        assert result_tracks(compressed) == result_tracks(plain)
+        print("✓ Large results are compressed")
+
+    def test_paging_and_status_filter(self):
+        result = build_result(SUCCESSFUL, FAILED, SKIPPED)
+
+        total, tracks = result_tracks(result, offset=1, limit=2)
+        assert total == 5
+        assert [t["track"] for t in tracks] == ["Song 1", "Song 2"]
+
+        total, tracks = result_tracks(result, statuses=["failed", "skipped"])
+        assert total == 3
+        assert [t["track"] for t in tracks] == ["Song 2", "Song 3", "Song 4"]
+
+    def test_summary_has_only_counts(self):
+        result = build_result(SUCCESSFUL, FAILED, SKIPPED)
+
+        assert summarize_result(result) == {
+            "success": {"count": 2},
+            "failed": {"count": 2},
+            "skipped": {"count": 1},
+        }
+
+    def test_reads_results_stored_with_full_lists(self):
+        """Test results stored before the compact format are still paged."""
+        legacy = {
+            "success": {"count": 1, "songs": SUCCESSFUL[:1]},
+            "failed": {"count": 1, "tracks": FAILED[1:]},
+        }
+
+        assert summarize_result(legacy) == {
+            "success": {"count": 1},
+            "failed": {"count": 1},
+        }
+        assert [t["track"] for t in result_tracks(legacy)[1]] == ["Song 0", "Song 3"]
@@ -0,0 +1,120 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from google.oauth2.credentials import Credentials
+from backend.clients.youtube_auth import save_youtube_credentials, youtube_credentials
+
+TOKEN_DATA = {
+    "token": "session-token",
+    "refresh_token": "refresh-token",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "client_id": "client-id",
+    "client_secret": "client-secret",
+    "scopes": ["https://www.googleapis.com/auth/youtube.force-ssl"],
+}
+
+
+def _google_refresh(token="refreshed-token", delay=0.0):
+    def refresh(credentials, request):
+        time.sleep(delay)
+        credentials.token = token
+        credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    return patch.object(Credentials, "refresh", autospec=True, side_effect=refresh)
+
+
+class TestYouTubeAuth:
+    """Test YouTube credentials shared through the token store."""
+
+    def test_granted_token_is_used_without_refresh(self):
+        """Test that a token saved at login is reused until it is due."""
+        granted = Credentials(
+            token="granted-token",
+            expiry=datetime.utcnow() + timedelta(hours=1),
+            **{k: v for k, v in TOKEN_DATA.items() if k != "token"},
+        )
+        token_data = save_youtube_credentials(granted)
+
+        with _google_refresh() as google_refresh:
+            credentials = youtube_credentials(token_data)
+
+        google_refresh.assert_not_called()
+        assert credentials.token == "granted-token"
+        assert credentials.valid
+        print("✓ Granted YouTube token is reused")
+
+    def test_concurrent_requests_refresh_once(self):
+        """Test that overlapping requests share one refresh."""
+        tokens = []
+
+        def load():
+            tokens.append(youtube_credentials(TOKEN_DATA).token)
+
+        with _google_refresh(delay=0.05) as google_refresh:
+            threads = [threading.Thread(target=load) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert google_refresh.call_count == 1
+        assert tokens == ["refreshed-token"] * 5
+        print("✓ Concurrent YouTube refreshes are deduplicated")
+
+    def test_token_is_refreshed_ahead_of_expiry(self):
+        granted = Credentials(
+            token="granted-token",
+            expiry=datetime.utcnow() + timedelta(minutes=4),
+            **{k: v for k, v in TOKEN_DATA.items() if k != "token"},
+        )
+        token_data = save_youtube_credentials(granted)
+
+        with _google_refresh() as google_refresh:
+            credentials = youtube_credentials(token_data)
+
+        google_refresh.assert_called_once()
+        assert credentials.token == "refreshed-token"
+
+    def test_credentials_in_use_pick_up_shared_refresh(self):
+        """Test that a worker's credentials refresh through the store."""
+        with _google_refresh("first"):
+            credentials = youtube_credentials(TOKEN_DATA)
+        credentials.expiry = datetime.utcnow()
+
+        with _google_refresh("second") as google_refresh:
+            credentials.before_request(MagicMock(), "GET", "https://yt", {})
+
+        google_refresh.assert_not_called()
+        assert credentials.token == "first"
+        assert credentials.valid
+
+    def test_rejected_token_is_replaced(self):
+        """Test that a 401 on a still valid token refreshes it from Google."""
+        with _google_refresh("first"):
+            credentials = youtube_credentials(TOKEN_DATA)
+        assert credentials.valid
+
+        with _google_refresh("second") as google_refresh:
+            credentials.refresh(MagicMock())
+
+        google_refresh.assert_called_once()
+        assert credentials.token == "second"
+        print("✓ Rejected YouTube token is refreshed")
+
+    def test_credentials_share_one_store(self):
+        """Test that every credentials object for a user uses the same store."""
+        with _google_refresh():
+            first = youtube_credentials(TOKEN_DATA)
+            second = youtube_credentials(TOKEN_DATA)
+
+        assert first._store is second._store
+
+    def test_credentials_without_refresh_token(self):
+        token_data = dict(TOKEN_DATA, refresh_token=None)
+
+        with _google_refresh() as google_refresh:
+            credentials = youtube_credentials(token_data)
+
+        google_refresh.assert_not_called()
+        assert credentials.token == "session-token"
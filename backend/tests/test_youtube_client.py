@@ -25,6 +25,25 @@ class TestYouTubeClientInitialization:
             YouTubeClient()
         print("✓ YouTube client raises error when no credentials provided")
 
+    def test_service_is_built_once_per_process(self):
+        """Test that clients share one service built from the static document."""
+        from backend.clients import youtube_client
+
+        with patch.dict(youtube_client._services, clear=True), patch(
+            "googleapiclient.discovery.build_from_document",
+            wraps=youtube_client.googleapiclient.discovery.build_from_document,
+        ) as mock_build:
+            first = YouTubeClient(credentials=MagicMock())
+            second = YouTubeClient(credentials=MagicMock())
+            keyed = YouTubeClient(api_key="test_api_key")
+            YouTubeClient(api_key="test_api_key")
+
+        assert first.youtube_client is second.youtube_client
+        assert keyed.youtube_client is not first.youtube_client
+        assert mock_build.call_count == 2
+        assert first.credentials is not second.credentials
+        print("✓ YouTube service is built once per process")
+
 
 class TestPlaylistClass:
     """Test Playlist class."""
@@ -51,7 +70,7 @@ class TestSongClass:
 class TestGetVideosFromPlaylist:
     """Test getting videos from playlist."""
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_get_videos_from_playlist_success(self, mock_build):
         """Test successful video retrieval from playlist."""
         mock_client = MagicMock()
@@ -70,7 +89,7 @@ class TestGetVideosFromPlaylist:
         assert songs[0].track == "Test Song"
         print("✓ Get videos from playlist works")
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_get_videos_from_playlist_no_artist_dash(self, mock_build):
         """Test video retrieval with title that doesn't contain artist dash."""
         mock_client = MagicMock()
@@ -87,7 +106,7 @@ class TestGetVideosFromPlaylist:
         assert len(songs) == 0
         print("✓ Get videos handles titles without artist dash")
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_get_videos_from_playlist_empty(self, mock_build):
         """Test video retrieval from empty playlist."""
         mock_client = MagicMock()
@@ -102,11 +121,128 @@ class TestGetVideosFromPlaylist:
         assert len(songs) == 0
         print("✓ Get videos from empty playlist works")
 
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_get_videos_from_playlist_normalizes_titles(self, mock_build):
+        """Test that titles are normalized, including Topic channel uploads."""
+        mock_client = MagicMock()
+        mock_client.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"snippet": {"title": "Artist — Track (Official Video) ft. X"}},
+                {
+                    "snippet": {
+                        "title": "Topic Track",
+                        "videoOwnerChannelTitle": "Topic Artist - Topic",
+                    }
+                },
+            ]
+        }
+        mock_build.return_value = mock_client
+
+        client = YouTubeClient(api_key="test_key")
+        songs = client.get_videos_from_playlist("test_playlist_id")
+
+        assert [str(song) for song in songs] == [
+            "Artist - Track",
+            "Topic Artist - Topic Track",
+        ]
+        print("✓ Get videos normalizes titles")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_get_videos_from_playlist_follows_pages(self, mock_build):
+        """Test that every page is read by following nextPageToken."""
+        mock_client = MagicMock()
+        mock_playlist_items = MagicMock()
+        mock_playlist_items.list.return_value.execute.side_effect = [
+            {
+                "items": [{"snippet": {"title": "Artist 1 - Song 1"}}],
+                "nextPageToken": "page2",
+                "pageInfo": {"totalResults": 2},
+            },
+            {
+                "items": [{"snippet": {"title": "Artist 2 - Song 2"}}],
+                "pageInfo": {"totalResults": 2},
+            },
+        ]
+        mock_client.playlistItems.return_value = mock_playlist_items
+        mock_build.return_value = mock_client
+
+        client = YouTubeClient(api_key="test_key")
+        songs = client.get_videos_from_playlist("test_playlist_id")
+
+        assert [song.track for song in songs] == ["Song 1", "Song 2"]
+        calls = mock_playlist_items.list.call_args_list
+        assert calls[0][1]["pageToken"] is None
+        assert calls[1][1]["pageToken"] == "page2"
+        assert "items/snippet(title" in calls[0][1]["fields"]
+        print("✓ Get videos follows nextPageToken")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_playlist_pages_carry_video_ids(self, mock_build):
+        """Test that pages list the videoId of every item, parseable or not."""
+        mock_client = MagicMock()
+        mock_playlist_items = MagicMock()
+        mock_playlist_items.list.return_value.execute.return_value = {
+            "items": [
+                {
+                    "snippet": {
+                        "title": "Artist - Song",
+                        "resourceId": {"videoId": "vid1"},
+                    }
+                },
+                {
+                    "snippet": {
+                        "title": "No separator",
+                        "resourceId": {"videoId": "vid2"},
+                    }
+                },
+            ],
+            "pageInfo": {"totalResults": 2},
+        }
+        mock_client.playlistItems.return_value = mock_playlist_items
+        mock_build.return_value = mock_client
+
+        client = YouTubeClient(api_key="test_key")
+        page = next(client.iter_playlist_pages("test_playlist_id"))
+
+        assert page.video_ids == ["vid1", "vid2"]
+        assert [song.track for song in page.songs] == ["Song"]
+        print("✓ Playlist pages carry video IDs")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_iter_playlist_pages_is_lazy(self, mock_build):
+        """Test that the next page is only fetched when it is asked for."""
+        mock_client = MagicMock()
+        mock_playlist_items = MagicMock()
+        mock_playlist_items.list.return_value.execute.side_effect = [
+            {
+                "items": [
+                    {"snippet": {"title": "Artist 1 - Song 1"}},
+                    {"snippet": {"title": "No separator"}},
+                ],
+                "nextPageToken": "page2",
+                "pageInfo": {"totalResults": 3},
+            },
+            {"items": [{"snippet": {"title": "Artist 2 - Song 2"}}]},
+        ]
+        mock_client.playlistItems.return_value = mock_playlist_items
+        mock_build.return_value = mock_client
+
+        client = YouTubeClient(api_key="test_key")
+        pages = client.iter_playlist_pages("test_playlist_id")
+        first = next(pages)
+
+        assert mock_playlist_items.list.call_count == 1
+        assert first.item_count == 2
+        assert first.total == 3
+        assert [song.track for song in first.songs] == ["Song 1"]
+        assert len(list(pages)) == 1
+        print("✓ Playlist pages are fetched lazily")
+
 
 class TestGetPlaylists:
     """Test getting playlists."""
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_get_playlists_success(self, mock_build):
         """Test successful playlist retrieval."""
         mock_client = MagicMock()
@@ -130,7 +266,7 @@ class TestGetPlaylists:
         assert playlists[1]["title"] == "Test Playlist 2"
         print("✓ Get playlists works")
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_get_playlists_empty(self, mock_build):
         """Test playlist retrieval when user has no playlists."""
         mock_client = MagicMock()
@@ -145,11 +281,45 @@ class TestGetPlaylists:
         assert len(playlists) == 0
         print("✓ Get playlists handles empty result")
 
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_get_playlists_follows_page_tokens(self, mock_build):
+        """Test that every page is fetched with the fields projection."""
+        mock_client = MagicMock()
+        mock_playlists = MagicMock()
+        mock_playlists.list.return_value.execute.side_effect = [
+            {
+                "items": [{"id": "playlist1", "snippet": {"title": "One"}}],
+                "nextPageToken": "page2",
+            },
+            {"items": [{"id": "playlist2", "snippet": {"title": "Two"}}]},
+        ]
+        mock_client.playlists.return_value = mock_playlists
+        mock_build.return_value = mock_client
+
+        client = YouTubeClient(api_key="test_key")
+        playlists = client.get_playlists()
+
+        assert [p["id"] for p in playlists] == ["playlist1", "playlist2"]
+        calls = mock_playlists.list.call_args_list
+        assert [c[1]["pageToken"] for c in calls] == [None, "page2"]
+        assert calls[0][1]["fields"] == "nextPageToken,items(id,snippet/title)"
+        print("✓ Get playlists pages through nextPageToken")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_get_channel_id(self, mock_build):
+        mock_client = MagicMock()
+        mock_client.channels.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "channel1"}]
+        }
+        mock_build.return_value = mock_client
+
+        assert YouTubeClient(api_key="test_key").get_channel_id() == "channel1"
+
 
 class TestSearchVideos:
     """Test video search functionality."""
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_search_videos_success(self, mock_build):
         """Test successful video search."""
         mock_client = MagicMock()
@@ -181,7 +351,7 @@ class TestSearchVideos:
         assert results[0]["thumbnail"] == "https://example.com/thumbnail.jpg"
         print("✓ Search videos works")
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_search_videos_no_results(self, mock_build):
         """Test video search with no results."""
         mock_client = MagicMock()
@@ -196,11 +366,43 @@ class TestSearchVideos:
         assert len(results) == 0
         print("✓ Search videos handles no results")
 
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_search_videos_uses_cache(self, mock_build):
+        """Test that cached results skip the search.list call."""
+        mock_client = MagicMock()
+        mock_build.return_value = mock_client
+        cache = MagicMock()
+        cache.get_results.return_value = [{"videoId": "cached_id"}]
+
+        client = YouTubeClient(api_key="test_key", search_cache=cache)
+        results = client.search_videos("test query", max_results=1)
+
+        assert results == [{"videoId": "cached_id"}]
+        mock_client.search.assert_not_called()
+        print("✓ Search videos uses the cache")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_search_videos_caches_misses(self, mock_build):
+        """Test that an empty search result is cached as well."""
+        mock_client = MagicMock()
+        mock_client.search.return_value.list.return_value.execute.return_value = {
+            "items": []
+        }
+        mock_build.return_value = mock_client
+        cache = MagicMock()
+        cache.get_results.return_value = None
+
+        client = YouTubeClient(api_key="test_key", search_cache=cache)
+        client.search_videos("nonexistent query", max_results=1)
+
+        cache.set_results.assert_called_once_with("nonexistent query", 1, [])
+        print("✓ Search videos caches misses")
+
 
 class TestAddVideoToPlaylist:
     """Test adding videos to playlist."""
 
-    @patch("googleapiclient.discovery.build")
+    @patch("backend.clients.youtube_client.get_youtube_service")
     def test_add_video_to_playlist_success(self, mock_build):
         """Test successful video addition to playlist."""
         mock_client = MagicMock()
@@ -225,5 +427,64 @@ class TestAddVideoToPlaylist:
         print("✓ Add video to playlist works")
 
 
+class TestRateLimiting:
+    """Test rate limit handling in the YouTube client."""
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_search_retries_after_429(self, mock_build):
+        """Test that a throttled search is retried and slows the limiter."""
+        from googleapiclient.errors import HttpError
+
+        throttled = HttpError(MagicMock(status=429, reason="Too Many Requests"), b"{}")
+        mock_client = MagicMock()
+        mock_search = MagicMock()
+        mock_search.list.return_value.execute.side_effect = [
+            throttled,
+            {"items": []},
+        ]
+        mock_client.search.return_value = mock_search
+        mock_build.return_value = mock_client
+
+        limiter = MagicMock()
+        with patch(
+            "backend.clients.youtube_client.get_rate_limiter", return_value=limiter
+        ):
+            client = YouTubeClient(api_key="test_key")
+            results = client.search_videos("test query", max_results=1)
+
+        assert results == []
+        assert limiter.acquire.call_count == 2
+        limiter.on_throttle.assert_called_once()
+        limiter.on_success.assert_called_once()
+        print("✓ Search retries after 429")
+
+    @patch("backend.clients.youtube_client.get_youtube_service")
+    def test_quota_exceeded_not_retried(self, mock_build):
+        """Test that an exhausted daily quota is raised immediately."""
+        from googleapiclient.errors import HttpError
+
+        quota_error = HttpError(
+            MagicMock(status=403, reason="Forbidden"),
+            b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}',
+        )
+        mock_client = MagicMock()
+        mock_search = MagicMock()
+        mock_search.list.return_value.execute.side_effect = quota_error
+        mock_client.search.return_value = mock_search
+        mock_build.return_value = mock_client
+
+        limiter = MagicMock()
+        with patch(
+            "backend.clients.youtube_client.get_rate_limiter", return_value=limiter
+        ):
+            client = YouTubeClient(api_key="test_key")
+            with pytest.raises(HttpError):
+                client.search_videos("test query", max_results=1)
+
+        assert limiter.acquire.call_count == 1
+        limiter.on_throttle.assert_not_called()
+        print("✓ Quota exhaustion is not retried")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
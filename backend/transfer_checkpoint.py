@@ -0,0 +1,222 @@
+import os
+import json
+import logging
+import redis
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+
+from config.redis_client import get_redis
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# How long an unfinished transfer can be resumed after its last commit.
+TRANSFER_CHECKPOINT_TTL = int(os.getenv("TRANSFER_CHECKPOINT_TTL", str(24 * 3600)))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class TransferCheckpoint:
+    """
+    Progress of one transfer task persisted in Redis under its task id, so a
+    redelivered task (acks_late + reject_on_worker_lost) continues where the
+    previous attempt stopped instead of starting again from track 0.
+
+    Holds the cursor (number of source tracks whose writes are committed),
+    the success/failed/skipped entries for those tracks, the Liked Songs IDs saved so
+    far and the matches made for tracks past the cursor that were not written
+    yet. A batch whose write succeeded but whose commit was lost is written
+    again on resume, so at most one batch can be duplicated.
+
+    Like the search caches, every Redis error is logged and turns
+    checkpointing off for the rest of the task instead of failing it.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        ttl: int = TRANSFER_CHECKPOINT_TTL,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        self.task_id = task_id
+        self.ttl = ttl
+        self._redis = redis_client
+        base = f"playlifts:checkpoint:{task_id}"
+        self.cursor_key = f"{base}:cursor"
+        self.success_key = f"{base}:success"
+        self.failed_key = f"{base}:failed"
+        self.skipped_key = f"{base}:skipped"
+        self.saved_key = f"{base}:saved"
+        self.matches_key = f"{base}:matches"
+
+        self.enabled = True
+        self.loaded = False
+        self.cursor = 0
+        self.successful: List[Any] = []
+        self.failed: List[Any] = []
+        self.skipped: List[Any] = []
+        self.saved_ids: Dict[str, bool] = {}
+        self._stored_success = 0
+        self._stored_failed = 0
+        self._stored_skipped = 0
+        # The task adds to saved_ids as it goes, so what Redis already holds
+        # is tracked apart from it.
+        self._stored_saved: Dict[str, bool] = {}
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or get_redis()
+
+    @property
+    def keys(self) -> List[str]:
+        return [
+            self.cursor_key,
+            self.success_key,
+            self.failed_key,
+            self.skipped_key,
+            self.saved_key,
+            self.matches_key,
+        ]
+
+    def _failed(self, action: str, error: Exception) -> None:
+        logger.warning(f"Checkpoint {action} for task {self.task_id} failed: {error}")
+        self.enabled = False
+
+    def load(self) -> bool:
+        """Load a previous attempt's progress. Returns True when resuming."""
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.get(self.cursor_key)
+            pipe.lrange(self.success_key, 0, -1)
+            pipe.lrange(self.failed_key, 0, -1)
+            pipe.lrange(self.skipped_key, 0, -1)
+            pipe.hgetall(self.saved_key)
+            pipe.hlen(self.matches_key)
+            cursor, successful, failed, skipped, saved, matches = pipe.execute()
+        except redis.RedisError as e:
+            self._failed("load", e)
+            return False
+
+        # An attempt that stopped before its first write left only matches.
+        if cursor is None and not matches:
+            return False
+
+        self.cursor = int(cursor or 0)
+        self.successful = [json.loads(entry) for entry in successful]
+        self.failed = [json.loads(entry) for entry in failed]
+        self.skipped = [json.loads(entry) for entry in skipped]
+        self.saved_ids = {
+            _text(track_id): _text(success) == "1"
+            for track_id, success in saved.items()
+        }
+        self._stored_success = len(self.successful)
+        self._stored_failed = len(self.failed)
+        self._stored_skipped = len(self.skipped)
+        self._stored_saved = dict(self.saved_ids)
+        self.loaded = True
+        logger.info(f"Resuming task {self.task_id} from track {self.cursor}")
+        return True
+
+    def get_match(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Return {"match", "error"} recorded for `index` by a previous attempt,
+        or None. A fresh task has none, so Redis is not asked.
+        """
+        if not self.enabled or not self.loaded:
+            return None
+        try:
+            raw = self.redis.hget(self.matches_key, str(index))
+        except redis.RedisError as e:
+            self._failed("read", e)
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def record_match(self, index: int, match: Any, error: Optional[str]) -> None:
+        if not self.enabled:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(
+                self.matches_key,
+                str(index),
+                _dumps({"match": match, "error": error}),
+            )
+            pipe.expire(self.matches_key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._failed("write", e)
+
+    def commit(
+        self,
+        cursor: int,
+        successful: List[Any],
+        failed: List[Any],
+        saved_ids: Optional[Dict[str, bool]] = None,
+        skipped: Optional[List[Any]] = None,
+    ) -> None:
+        """
+        Record that every source track before `cursor` has been written.
+        `successful`, `failed` and `skipped` are the task's full result
+        lists; only the entries added since the last commit are sent to Redis.
+        """
+        skipped = skipped or []
+        if not self.enabled:
+            return
+
+        new_success = successful[self._stored_success :]
+        new_failed = failed[self._stored_failed :]
+        new_skipped = skipped[self._stored_skipped :]
+        new_saved = {
+            track_id: success
+            for track_id, success in (saved_ids or {}).items()
+            if track_id is not None and self._stored_saved.get(track_id) != success
+        }
+
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            if new_success:
+                pipe.rpush(self.success_key, *map(_dumps, new_success))
+            if new_failed:
+                pipe.rpush(self.failed_key, *map(_dumps, new_failed))
+            if new_skipped:
+                pipe.rpush(self.skipped_key, *map(_dumps, new_skipped))
+            if new_saved:
+                pipe.hset(
+                    self.saved_key,
+                    mapping={
+                        track_id: "1" if success else "0"
+                        for track_id, success in new_saved.items()
+                    },
+                )
+            if cursor > self.cursor:
+                pipe.hdel(self.matches_key, *map(str, range(self.cursor, cursor)))
+            pipe.set(self.cursor_key, cursor)
+            for key in self.keys:
+                pipe.expire(key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._failed("commit", e)
+            return
+
+        self.cursor = cursor
+        self._stored_success = len(successful)
+        self._stored_failed = len(failed)
+        self._stored_skipped = len(skipped)
+        self._stored_saved.update(new_saved)
+        self.saved_ids.update(new_saved)
+
+    def clear(self) -> None:
+        """Drop the checkpoint once the transfer has finished."""
+        if not self.enabled:
+            return
+        try:
+            self.redis.delete(*self.keys)
+        except redis.RedisError as e:
+            logger.warning(f"Could not clear checkpoint for task {self.task_id}: {e}")
@@ -0,0 +1,234 @@
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+TRANSFER_MATCH_CONCURRENCY = int(os.getenv("TRANSFER_MATCH_CONCURRENCY", "8"))
+TRANSFER_QUEUE_SIZE = int(os.getenv("TRANSFER_QUEUE_SIZE", "100"))
+# A partial write batch is flushed once no new match has arrived for this long.
+TRANSFER_FLUSH_INTERVAL = float(os.getenv("TRANSFER_FLUSH_INTERVAL", "2"))
+
+# How often blocked stages wake up to check whether the pipeline was stopped.
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class PipelineItem(object):
+    """One source track as it moves through the pipeline."""
+
+    def __init__(self, index, source):
+        self.index = index
+        self.source = source
+        self.normalized = None
+        self.match = None
+        self.error = None
+
+
+class TransferPipeline(object):
+    """
+    Streams a transfer through four stages connected by bounded queues:
+
+        source pages -> normalize -> match (thread pool) -> batched write
+
+    Source paging, normalization and matching each run on their own thread;
+    writing runs on the calling thread so progress can be reported from the
+    Celery task thread. Matches are handed to the writer in source order.
+    Every queue is bounded and at most 2 * match_width searches are in flight,
+    so a slow stage blocks the ones before it instead of piling up work, and
+    memory stays flat regardless of playlist size.
+
+    normalize(source) returns the value passed to match(); either may raise
+    to mark the item failed, which is recorded on item.error. write(batch)
+    receives lists of PipelineItems, failed ones included, in order.
+
+    To resume an interrupted transfer, `start` skips that many source items
+    without normalizing or matching them, and a TransferCheckpoint reuses the
+    match outcomes recorded for the rest instead of searching again.
+    """
+
+    def __init__(
+        self,
+        pages: Iterable[List[Any]],
+        normalize: Callable[[Any], Any],
+        match: Callable[[Any], Any],
+        write: Callable[[List[PipelineItem]], None],
+        batch_size: int = 1,
+        match_width: Optional[int] = None,
+        queue_size: int = TRANSFER_QUEUE_SIZE,
+        flush_interval: float = TRANSFER_FLUSH_INTERVAL,
+        start: int = 0,
+        checkpoint=None,
+    ):
+        self.pages = pages
+        self.normalize = normalize
+        self.match = match
+        self.write = write
+        self.batch_size = max(1, batch_size)
+        self.match_width = max(1, match_width or TRANSFER_MATCH_CONCURRENCY)
+        self.flush_interval = flush_interval
+        self.start = start
+        self.checkpoint = checkpoint
+
+        self._sourced = queue.Queue(maxsize=queue_size)
+        self._normalized = queue.Queue(maxsize=queue_size)
+        self._matched = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._error = None
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue) -> Any:
+        """Return the next item, _DONE, or None if nothing arrived in time."""
+        try:
+            return q.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            return _DONE if self._stop.is_set() else None
+
+    def _fail(self, error: Exception) -> None:
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+    def _source_stage(self) -> None:
+        try:
+            index = 0
+            for page in self.pages:
+                for source in page:
+                    if index >= self.start and not self._put(
+                        self._sourced, PipelineItem(index, source)
+                    ):
+                        return
+                    index += 1
+        except Exception as e:
+            logger.error(f"Transfer source failed: {str(e)}")
+            self._fail(e)
+        finally:
+            self._put(self._sourced, _DONE)
+
+    def _normalize_stage(self) -> None:
+        try:
+            while True:
+                item = self._get(self._sourced)
+                if item is None:
+                    continue
+                if item is _DONE:
+                    break
+                try:
+                    item.normalized = self.normalize(item.source)
+                except Exception as e:
+                    item.error = e
+                if not self._put(self._normalized, item):
+                    return
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(self._normalized, _DONE)
+
+    def _match_one(self, item: PipelineItem) -> PipelineItem:
+        if item.error is not None:
+            return item
+
+        recorded = self.checkpoint.get_match(item.index) if self.checkpoint else None
+        if recorded is not None:
+            item.match = recorded["match"]
+            if recorded["error"] is not None:
+                item.error = Exception(recorded["error"])
+            return item
+
+        try:
+            item.match = self.match(item.normalized)
+        except Exception as e:
+            item.error = e
+        if self.checkpoint:
+            self.checkpoint.record_match(
+                item.index,
+                item.match,
+                str(item.error) if item.error is not None else None,
+            )
+        return item
+
+    def _match_stage(self) -> None:
+        in_flight = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=self.match_width) as executor:
+                finished = False
+                while not finished or in_flight:
+                    if not finished and len(in_flight) < 2 * self.match_width:
+                        item = self._get(self._normalized)
+                        if item is _DONE:
+                            finished = True
+                        elif item is not None:
+                            in_flight.append(executor.submit(self._match_one, item))
+                    elif in_flight:
+                        in_flight[0].result()
+
+                    # Hand completed matches over strictly in source order.
+                    while in_flight and in_flight[0].done():
+                        if not self._put(self._matched, in_flight.popleft().result()):
+                            return
+                    if self._stop.is_set():
+                        return
+        except Exception as e:
+            self._fail(e)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            self._put(self._matched, _DONE)
+
+    def run(self) -> None:
+        """Run the pipeline to completion, raising the first stage error."""
+        threads = [
+            threading.Thread(target=stage, daemon=True)
+            for stage in (self._source_stage, self._normalize_stage, self._match_stage)
+        ]
+        for thread in threads:
+            thread.start()
+
+        batch = []
+        last_item_at = time.monotonic()
+        try:
+            while True:
+                item = self._get(self._matched)
+                if item is _DONE:
+                    break
+                if item is None:
+                    idle = time.monotonic() - last_item_at
+                    if batch and idle >= self.flush_interval:
+                        self.write(batch)
+                        batch = []
+                    continue
+
+                last_item_at = time.monotonic()
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self.write(batch)
+                    batch = []
+
+            if batch and self._error is None:
+                self.write(batch)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
@@ -0,0 +1,116 @@
+import os
+import json
+import zlib
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+# Track rows larger than this many bytes of JSON are stored zlib-compressed
+# (0 disables compression).
+TRANSFER_RESULT_COMPRESS_MIN_BYTES = int(
+    os.getenv("TRANSFER_RESULT_COMPRESS_MIN_BYTES", "16384")
+)
+
+STATUSES = ("success", "failed", "skipped")
+ROW_FIELDS = ["status", "artist", "track", "detail"]
+
+
+def _row(status: str, entry: Dict[str, Any]) -> List[Any]:
+    """
+    One [status, artist, track, detail] row. Entries are either flat
+    {"artist", "track", ...} dicts or {"track": <source track>, "reason"};
+    detail is the failure reason, or the artwork URL of a Spotify match.
+    """
+    source = entry["track"] if isinstance(entry.get("track"), dict) else entry
+    detail = entry.get("reason") if status == "failed" else entry.get("artwork_url")
+    return [status, source.get("artist"), source.get("track"), detail]
+
+
+def _encode_rows(rows: List[List[Any]], compress_min_bytes: int) -> Dict[str, Any]:
+    raw = json.dumps(rows, separators=(",", ":"))
+    if compress_min_bytes and len(raw) >= compress_min_bytes:
+        data = base64.b64encode(zlib.compress(raw.encode())).decode("ascii")
+        return {"fields": ROW_FIELDS, "encoding": "zlib", "data": data}
+    return {"fields": ROW_FIELDS, "encoding": "json", "rows": rows}
+
+
+def _decode_rows(tracks: Dict[str, Any]) -> List[List[Any]]:
+    if tracks.get("encoding") == "zlib":
+        return json.loads(zlib.decompress(base64.b64decode(tracks["data"])))
+    return tracks.get("rows", [])
+
+
+def build_result(
+    successful: List[Dict[str, Any]],
+    failed: List[Dict[str, Any]],
+    skipped: Optional[List[Dict[str, Any]]] = None,
+    compress_min_bytes: int = TRANSFER_RESULT_COMPRESS_MIN_BYTES,
+) -> Dict[str, Any]:
+    """
+    The Celery result of a transfer: a count per outcome plus every track as
+    a compact row, compressed once the rows get large. /tasks/status only
+    returns the counts (summarize_result); the rows are paged out through
+    /tasks/<task_id>/results (result_tracks).
+    """
+    skipped = skipped or []
+    rows = [
+        _row(status, entry)
+        for status, entries in zip(STATUSES, (successful, failed, skipped))
+        for entry in entries
+    ]
+    return {
+        "success": {"count": len(successful)},
+        "failed": {"count": len(failed)},
+        "skipped": {"count": len(skipped)},
+        "tracks": _encode_rows(rows, compress_min_bytes),
+    }
+
+
+def summarize_result(result: Any) -> Any:
+    """Return only the per-outcome counts of a transfer result."""
+    if not isinstance(result, dict):
+        return result
+    return {
+        status: {"count": result[status].get("count", 0)}
+        for status in STATUSES
+        if isinstance(result.get(status), dict)
+    }
+
+
+def _result_rows(result: Dict[str, Any]) -> List[List[Any]]:
+    if "tracks" in result:
+        return _decode_rows(result["tracks"])
+    # Results stored before rows were compacted keep full lists per outcome.
+    rows = []
+    for status in STATUSES:
+        outcome = result.get(status) or {}
+        entries = outcome.get("songs") or outcome.get("tracks") or []
+        rows.extend(_row(status, entry) for entry in entries)
+    return rows
+
+
+def _expand_row(row: List[Any]) -> Dict[str, Any]:
+    status, artist, track, detail = row
+    track_info = {"status": status, "artist": artist, "track": track}
+    if detail is not None:
+        track_info["reason" if status == "failed" else "artwork_url"] = detail
+    return track_info
+
+
+def result_tracks(
+    result: Dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    statuses: Optional[List[str]] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Return (total, tracks) for one page of a transfer result's tracks,
+    optionally only those whose status is in `statuses`.
+    """
+    rows = _result_rows(result)
+    if statuses:
+        rows = [row for row in rows if row[0] in statuses]
+    end = None if limit is None else offset + limit
+    return len(rows), [_expand_row(row) for row in rows[offset:end]]
@@ -37,8 +37,8 @@ export const PlaylistTransfer = () => {
       console.log('Transfer response:', { status: res.status, data });
 
       if (res.status === 202 && data.task_id) {
-        // start polling
-        pollTaskStatus(data.task_id);
+        // follow progress over the event stream, polling if it is unavailable
+        streamTaskStatus(data.task_id);
       } else if (res.ok) {
         const allSongs = [
           ...data.success.songs.map((s: any) => ({ ...s, status: "success" })),
@@ -46,7 +46,7 @@ export const PlaylistTransfer = () => {
         ];
         setSongs(allSongs);
         
-        if (data.success.count > 0) {
+        if (data.success.count > 0 || data.skipped?.count > 0) {
           setError(null);
         } else {
           setError("No songs were successfully transferred. Please check your YouTube Music link and try again.");
@@ -61,6 +61,86 @@ export const PlaylistTransfer = () => {
     }
   };
 
+  const fetchTaskResults = async (taskId: string) => {
+    const tracks: any[] = [];
+    const limit = 500;
+
+    for (let offset = 0; ; offset += limit) {
+      const response = await fetch(
+        `https://api.playlifts.com/tasks/${taskId}/results?offset=${offset}&limit=${limit}&status=success,failed`,
+        { credentials: 'include' }
+      );
+
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+      }
+
+      const page = await response.json();
+      tracks.push(...page.tracks);
+      if (offset + limit >= page.total) {
+        return tracks;
+      }
+    }
+  };
+
+  const finishTask = async (taskId: string, data: any) => {
+    setIsTransferring(false);
+
+    if (data.state === 'SUCCESS') {
+      // The status only carries counts; the tracks are paged separately.
+      const result = data.result;
+      try {
+        setSongs(await fetchTaskResults(taskId));
+      } catch (e) {
+        console.error('Results error:', e);
+      }
+
+      if (result.success.count > 0 || result.skipped?.count > 0) {
+        setError(null);
+      } else {
+        setError("No songs were successfully transferred. Please check your YouTube Music link and try again.");
+      }
+    } else {
+      const errorMessage = data.status || data.error || 'Unknown error occurred during transfer';
+      setError(`Transfer failed: ${errorMessage}`);
+    }
+  };
+
+  const streamTaskStatus = (taskId: string) => {
+    if (typeof EventSource === 'undefined') {
+      pollTaskStatus(taskId);
+      return;
+    }
+
+    const events = new EventSource(`https://api.playlifts.com/tasks/stream/${taskId}`, {
+      withCredentials: true,
+    });
+    let finished = false;
+
+    const handleState = (event: MessageEvent) => {
+      const data = JSON.parse(event.data);
+      console.log('Task status:', data.state);
+
+      if (data.state === 'SUCCESS' || data.state === 'FAILURE') {
+        finished = true;
+        events.close();
+        finishTask(taskId, data);
+      }
+    };
+    events.addEventListener('status', handleState);
+    events.addEventListener('done', handleState);
+    events.addEventListener('failed', handleState);
+
+    events.onerror = () => {
+      // EventSource reconnects on its own when the server ends a stream;
+      // only fall back to polling when it has given up.
+      if (!finished && events.readyState === EventSource.CLOSED) {
+        console.log('Task stream closed, falling back to polling...');
+        pollTaskStatus(taskId);
+      }
+    };
+  };
+
   const pollTaskStatus = async (taskId: string) => {
     let pollCount = 0;
     const maxPolls = 300; // 10 minutes at 1-second intervals
@@ -86,25 +166,10 @@ export const PlaylistTransfer = () => {
           console.log('Task in progress, continuing to poll...');
         } else if (data.state === 'SUCCESS') {
           clearInterval(pollInterval);
-          setIsTransferring(false);
-          
-          const result = data.result;
-          const allSongs = [
-            ...result.success.songs.map((s: any) => ({ ...s, status: "success" })),
-            ...result.failed.songs.map((s: any) => ({ ...s, status: "failed", reason: s.reason })),
-          ];
-          setSongs(allSongs);
-          
-          if (result.success.count > 0) {
-            setError(null);
-          } else {
-            setError("No songs were successfully transferred. Please check your YouTube Music link and try again.");
-          }
+          finishTask(taskId, data);
         } else if (data.state === 'FAILURE') {
           clearInterval(pollInterval);
-          setIsTransferring(false);
-          const errorMessage = data.status || data.error || 'Unknown error occurred during transfer';
-          setError(`Transfer failed: ${errorMessage}`);
+          finishTask(taskId, data);
         }
         
         if (pollCount >= maxPolls) {